@@ -3,17 +3,32 @@
 
 # GUI uses tkinter, pandas, matplotlib, numpy, skicitlearn
 import tkinter as tk
+from tkinter import ttk
 from functools import partial
-from tkinter.filedialog import askopenfilename
+from tkinter.filedialog import askopenfilename, askopenfilenames, askdirectory, asksaveasfilename
 from matplotlib.backends.backend_tkagg import (FigureCanvasTkAgg, NavigationToolbar2Tk)
 from matplotlib.backend_bases import key_press_handler
 from matplotlib.figure import Figure
+from matplotlib.widgets import SpanSelector
 import pandas as pd
 import math
 import numpy as np
+from scipy import ndimage, signal
 import gc
+import hashlib
+import heapq
+import io
 import os
 import time
+import json
+import struct
+import sys
+import threading
+import traceback
+import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
 # Global CSV interface variables
 has_csv_path: bool = False
@@ -23,7 +38,1652 @@ alphabet: list = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm
 csv_identities: list = []
 index: int = 0
 
+class Profiler:
+    def __init__(self, capacity: int = 20000):
+        """
+        function initializes the Profiler class that records timed spans around ingest, reindex/re-zero, each
+        calculation, cycle parsing and each plot render, and aggregates them into per-stage histograms
+        :param capacity: maximum number of individual spans retained for export (oldest spans are dropped first)
+        """
+        self.enabled: bool = True
+        self.spans: deque = deque(maxlen=capacity)
+        self.histograms: dict = {}
+        self.origin_ns: int = time.perf_counter_ns()
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def span(self, stage: str, dataset=None, rows=None, **params):
+        """
+        function times the enclosed block w/ perf_counter_ns and records it as a span of the given stage
+        :param stage: name of the processing stage (e.g. 'ingest', 're_zero', 'engineering_stress', 'plot')
+        :param dataset: csv index of the dataset being processed (None if the stage is not tied to one dataset)
+        :param rows: number of rows processed by the stage
+        :param params: calculation parameters stored w/ the span
+        :return: nothing; span is recorded once the block exits (even if it raises)
+        """
+        if self.enabled is False:
+            yield
+            return
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            self.record(stage, start, end, dataset, rows, params)
+
+    def record(self, stage: str, start: int, end: int, dataset=None, rows=None, params=None):
+        """
+        function stores a finished span and adds its duration to the stage's log2 histogram
+        :param stage: name of the processing stage
+        :param start: perf_counter_ns value when the stage started
+        :param end: perf_counter_ns value when the stage ended
+        :param dataset: csv index of the dataset being processed
+        :param rows: number of rows processed by the stage
+        :param params: calculation parameters stored w/ the span
+        :return: updated spans & histograms
+        """
+        duration = end - start
+        span = {'stage': stage, 'dataset': dataset, 'rows': rows, 'params': params or {},
+                'start_ns': start - self.origin_ns, 'duration_ns': duration, 'thread': threading.get_ident()}
+        with self.lock:
+            self.spans.append(span)
+            histogram = self.histograms.setdefault(stage, {'count': 0, 'total_ns': 0, 'min_ns': duration,
+                                                           'max_ns': duration, 'buckets': {}})
+            histogram['count'] += 1
+            histogram['total_ns'] += duration
+            histogram['min_ns'] = min(histogram['min_ns'], duration)
+            histogram['max_ns'] = max(histogram['max_ns'], duration)
+            bucket = max(duration, 1).bit_length() - 1
+            histogram['buckets'][bucket] = histogram['buckets'].get(bucket, 0) + 1
+
+    def recent(self, dataset=None, limit: int = 12):
+        """
+        function returns the most recent spans, optionally restricted to a single dataset
+        :param dataset: csv index to filter by (None for all datasets)
+        :param limit: maximum number of spans returned
+        :return: list of span dictionaries, oldest first
+        """
+        with self.lock:
+            spans = [s for s in self.spans if dataset is None or s['dataset'] == dataset]
+        return spans[-limit:]
+
+    def summary(self):
+        """
+        function summarizes every stage's histogram into count, total, mean, min, max & percentiles (in ms); the
+        percentiles are taken from the retained spans of that stage
+        :return: dictionary of stage -> summary statistics
+        """
+        with self.lock:
+            durations: dict = {}
+            for s in self.spans:
+                durations.setdefault(s['stage'], []).append(s['duration_ns'])
+            out = {}
+            for stage, histogram in self.histograms.items():
+                retained = np.array(durations.get(stage, [histogram['max_ns']]), dtype='float64')
+                out[stage] = {
+                    'count': histogram['count'],
+                    'total_ms': histogram['total_ns'] / 1e6,
+                    'mean_ms': histogram['total_ns'] / histogram['count'] / 1e6,
+                    'min_ms': histogram['min_ns'] / 1e6,
+                    'max_ms': histogram['max_ns'] / 1e6,
+                    'p50_ms': float(np.percentile(retained, 50)) / 1e6,
+                    'p95_ms': float(np.percentile(retained, 95)) / 1e6,
+                    'histogram_log2_ns': {str(k): v for k, v in sorted(histogram['buckets'].items())},
+                }
+        return out
+
+    def export_json(self, path: str):
+        """
+        function writes the per-stage summary & every retained span to a JSON file
+        :param path: output file path
+        :return: JSON file
+        """
+        with self.lock:
+            spans = list(self.spans)
+        with open(path, 'w') as f:
+            json.dump({'summary': self.summary(), 'spans': spans}, f, indent=1, default=str)
+
+    def export_chrome_trace(self, path: str):
+        """
+        function writes every retained span as a complete ('X') event in Chrome trace format, viewable in
+        chrome://tracing or Perfetto
+        :param path: output file path
+        :return: Chrome trace JSON file
+        """
+        with self.lock:
+            spans = list(self.spans)
+        events = []
+        for s in spans:
+            args = dict(s['params'])
+            args['dataset'] = s['dataset']
+            args['rows'] = s['rows']
+            events.append({'name': s['stage'], 'cat': 'dvacgui', 'ph': 'X', 'pid': os.getpid(), 'tid': s['thread'],
+                           'ts': s['start_ns'] / 1000, 'dur': s['duration_ns'] / 1000, 'args': args})
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, default=str)
+
+    def clear(self):
+        """
+        function discards every recorded span & histogram
+        :return: empty profiler
+        """
+        with self.lock:
+            self.spans.clear()
+            self.histograms.clear()
+
+
+# Global profiler recording timing spans of every processing stage
+profiler: Profiler = Profiler()
+
+
+class StallWatchdog:
+    def __init__(self, root, interval_ms: int = 50, threshold_ms: int = 250, capacity: int = 500):
+        """
+        function initializes the StallWatchdog class that measures Tk main-loop responsiveness; a heartbeat after()
+        callback stamps the loop's progress while a monitor thread samples the main thread's stack whenever the
+        heartbeat is late by more than the threshold
+        :param root: Tk root whose main loop is watched
+        :param interval_ms: heartbeat period in ms
+        :param threshold_ms: heartbeat delay in ms beyond which the loop is considered stalled
+        :param capacity: number of stalls kept in the rolling log
+        """
+        self.root = root
+        self.interval_ms: int = interval_ms
+        self.threshold_ns: int = threshold_ms * 1000000
+        self.stalls: deque = deque(maxlen=capacity)
+        self.latencies: deque = deque(maxlen=20000)
+        self.current_stall = None
+        self.main_thread_id = None
+        self.expected_ns: int = 0
+        self.last_beat_ns: int = 0
+        self.running: bool = False
+        self.lock = threading.Lock()
+
+    def start(self):
+        """
+        function starts the heartbeat & the monitor thread; must be called from the thread running the Tk main loop
+        :return: running watchdog
+        """
+        self.main_thread_id = threading.get_ident()
+        self.running = True
+        self.last_beat_ns = time.perf_counter_ns()
+        self.expected_ns = self.last_beat_ns + self.interval_ms * 1000000
+        self.root.after(self.interval_ms, self.heartbeat)
+        threading.Thread(target=self.monitor, name='StallWatchdog', daemon=True).start()
+
+    def stop(self):
+        """
+        function stops the monitor thread; the heartbeat stops rescheduling itself
+        :return: stopped watchdog
+        """
+        self.running = False
+
+    def heartbeat(self):
+        """
+        function runs on the Tk main loop every interval; records how late it ran & closes any stall in progress
+        :return: next heartbeat scheduled
+        """
+        now = time.perf_counter_ns()
+        with self.lock:
+            self.latencies.append(max(0, now - self.expected_ns))
+            self.last_beat_ns = now
+            stall = self.current_stall
+            self.current_stall = None
+        if stall is not None:
+            stall['duration_ms'] = (now - stall['start_ns']) / 1e6
+            with self.lock:
+                self.stalls.append(stall)
+            profiler.record('stall', stall['start_ns'], now, params={'callback': stall['callback']})
+        if self.running is True:
+            self.expected_ns = now + self.interval_ms * 1000000
+            self.root.after(self.interval_ms, self.heartbeat)
+
+    def monitor(self):
+        """
+        function runs on the monitor thread; when the heartbeat is overdue it samples the main thread's stack once per
+        stall and records which DVaCGUI callback was running
+        :return: stall records opened while the loop is blocked
+        """
+        while self.running is True:
+            time.sleep(self.interval_ms / 2000)
+            now = time.perf_counter_ns()
+            with self.lock:
+                overdue = now - self.last_beat_ns - self.interval_ms * 1000000
+                if overdue < self.threshold_ns or self.current_stall is not None:
+                    continue
+                start = self.last_beat_ns + self.interval_ms * 1000000
+            frame = sys._current_frames().get(self.main_thread_id)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame)
+            callback = self.callback_name(frame)
+            with self.lock:
+                if self.last_beat_ns + self.interval_ms * 1000000 == start:
+                    self.current_stall = {'start_ns': start, 'callback': callback, 'duration_ms': None,
+                                          'stack': [os.path.basename(f.filename) + ':' + str(f.lineno) + ' ' + f.name
+                                                    for f in stack[-25:]]}
+
+    def callback_name(self, frame):
+        """
+        function walks a stack sample from the innermost frame outwards & names the outermost method of a DVaCGUI
+        interface class, i.e. the Tk callback that blocked the loop (e.g. CSVInterface.plot_all)
+        :param frame: innermost frame of the main thread
+        :return: 'Class.method' of the callback or the innermost function name when no interface method is found
+        """
+        name = frame.f_code.co_name
+        while frame is not None:
+            owner = frame.f_locals.get('self')
+            if isinstance(owner, tk.Frame) and frame.f_code.co_filename == __file__:
+                name = type(owner).__name__ + '.' + frame.f_code.co_name
+            frame = frame.f_back
+        return name
+
+    def summary(self):
+        """
+        function summarizes heartbeat latency percentiles & the stalls per callback
+        :return: dictionary w/ latency percentiles (ms), stall count, stalled time & per-callback totals
+        """
+        with self.lock:
+            latencies = np.array(self.latencies, dtype='float64') / 1e6
+            stalls = list(self.stalls)
+        out = {'heartbeats': len(latencies), 'stalls': len(stalls),
+               'stalled_ms': float(sum(s['duration_ms'] for s in stalls)), 'callbacks': {}}
+        if len(latencies) > 0:
+            for p in (50, 90, 99):
+                out['latency_p' + str(p) + '_ms'] = float(np.percentile(latencies, p))
+            out['latency_max_ms'] = float(latencies.max())
+        for s in stalls:
+            entry = out['callbacks'].setdefault(s['callback'], {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            entry['count'] += 1
+            entry['total_ms'] += s['duration_ms']
+            entry['max_ms'] = max(entry['max_ms'], s['duration_ms'])
+        return out
+
+    def recent(self, limit: int = 50):
+        """
+        function returns the most recent stalls of the rolling log, newest first
+        :param limit: maximum number of stalls returned
+        :return: list of stall dictionaries
+        """
+        with self.lock:
+            return list(self.stalls)[-limit:][::-1]
+
+
+# Global Tk main-loop watchdog (started w/ the program)
+stall_watchdog = None
+
+
+class SegmentIndex:
+    # phase codes of the phase array
+    LOADING: int = 1
+    HOLD: int = 0
+    UNLOADING: int = -1
+    # default deadband: a reversal counts once the column moves back from its last peak or valley by more than this
+    # fraction of its range or this many times its noise (standard deviation estimated from second differences)
+    deadband_range: float = 0.05
+    deadband_noise: float = 12.0
+
+    def __init__(self, values, tolerance: float = 0.0, deadband: float = None):
+        """
+        function classifies every row of a displacement or load column as loading, hold or unloading & numbers the
+        cycles; the column turns at the peaks & valleys that stand out from their surroundings by more than the
+        deadband (found by prominence, so noise wiggles never start a segment), every row between a valley & the next
+        peak is loading & every row between a peak & the next valley is unloading, apart from holds; a cycle starts at
+        every valley, so holds or noise never split a cycle
+        :param values: displacement or load column
+        :param tolerance: largest |step| still treated as a hold
+        :param deadband: smallest reversal that turns the column (None: see deadband_range & deadband_noise)
+        """
+        values = np.asarray(values, dtype='float64')
+        step = np.diff(values, prepend=np.nan)
+        if deadband is None:
+            deadband = self.default_deadband(values)
+        self.deadband: float = float(deadband)
+        direction = self.directions(values, self.deadband)
+        self.direction: np.ndarray = direction
+        self.phase: np.ndarray = np.where(np.abs(step) > tolerance, direction, self.HOLD).astype(np.int8)
+        start = np.zeros(len(values), dtype=bool)
+        start[:-1] = (direction[:-1] == self.UNLOADING) & (direction[1:] == self.LOADING)
+        self.cycle: np.ndarray = np.cumsum(start, dtype=np.int32)
+        first = np.zeros(min(len(values), 1), dtype=np.int64)
+        self.cycle_starts: np.ndarray = np.concatenate((first, np.flatnonzero(start)))
+        self.segment_starts: np.ndarray = np.concatenate((first, np.flatnonzero(np.diff(self.phase)) + 1))
+        self.segment_phase: np.ndarray = self.phase[self.segment_starts]
+
+    @classmethod
+    def default_deadband(cls, values):
+        """
+        function gives the deadband of a column from its range & its noise; the noise is estimated from the median
+        absolute second difference, which smooth ramps (e.g. controlled columns) leave near zero
+        :param values: displacement or load column
+        :return: deadband
+        """
+        finite = values[np.isfinite(values)]
+        if len(finite) < 3:
+            return 0.0
+        return max(cls.deadband_range * float(np.ptp(finite)), cls.deadband_noise * cls.noise(finite))
+
+    @staticmethod
+    def noise(values):
+        """
+        function estimates the standard deviation of the noise of a column from the median absolute deviation of its
+        second differences (smooth trends leave them near zero)
+        :param values: column values
+        :return: noise standard deviation
+        """
+        values = np.asarray(values, dtype='float64')
+        values = values[np.isfinite(values)]
+        if len(values) < 3:
+            return 0.0
+        second = np.diff(values, 2)
+        return 1.4826 * float(np.median(np.abs(second - np.median(second)))) / math.sqrt(6.0)
+
+    @classmethod
+    def directions(cls, values, deadband):
+        """
+        function finds the peaks & valleys of a column that stand out by more than the deadband & gives each row the
+        direction of the stretch it belongs to (LOADING up to a peak, UNLOADING down to a valley)
+        :param values: displacement or load column
+        :param deadband: smallest reversal that turns the column
+        :return: LOADING or UNLOADING for every row
+        """
+        finite = np.isfinite(values)
+        if finite.sum() < 2:
+            return np.full(len(values), cls.LOADING, dtype=np.int8)
+        rows = np.arange(len(values))
+        filled = np.interp(rows, rows[finite], values[finite])
+        prominence = deadband if deadband > 0.0 else None
+        (peaks, _) = signal.find_peaks(filled, prominence=prominence)
+        (valleys, _) = signal.find_peaks(-filled, prominence=prominence)
+        turns = np.concatenate((peaks, valleys))
+        kinds = np.concatenate((np.full(len(peaks), cls.LOADING), np.full(len(valleys), cls.UNLOADING)))
+        order = np.argsort(turns, kind='stable')
+        # peaks & valleys alternate; of two neighbours of the same kind only the more extreme one is a turn
+        kept_turns = []
+        kept_kinds = []
+        for (turn, kind) in zip(turns[order], kinds[order]):
+            if len(kept_kinds) > 0 and kept_kinds[-1] == kind:
+                if kind * (filled[turn] - filled[kept_turns[-1]]) > 0.0:
+                    kept_turns[-1] = turn
+                continue
+            kept_turns.append(turn)
+            kept_kinds.append(kind)
+        if len(kept_turns) == 0:
+            rising = filled[-1] >= filled[0]
+            return np.full(len(values), cls.LOADING if rising else cls.UNLOADING, dtype=np.int8)
+        # the step into a row belongs to the stretch ending at the first turn at or after it
+        kept_kinds.append(-kept_kinds[-1])
+        return np.asarray(kept_kinds, dtype=np.int8)[np.searchsorted(kept_turns, rows, 'left')]
+
+    def cycle_rows(self, k):
+        """
+        function returns the rows of the kth cycle as a slice
+        :param k: cycle number (starting at 0)
+        :return: slice of the rows
+        """
+        stop = self.cycle_starts[k + 1] if k + 1 < len(self.cycle_starts) else len(self.phase)
+        return slice(int(self.cycle_starts[k]), int(stop))
+
+    def segments(self, phase: int):
+        """
+        function returns the boundaries of every segment w/ the given phase
+        :param phase: LOADING, HOLD or UNLOADING
+        :return: first row & row after the last row of each segment
+        """
+        stops = np.append(self.segment_starts[1:], len(self.phase))
+        chosen = self.segment_phase == phase
+        return self.segment_starts[chosen], stops[chosen]
+
+
+class WindowSums:
+    def __init__(self, x, y, extra: dict = None):
+        """
+        function sorts the points by x once & keeps prefix sums of 1, x, y, x^2, xy & y^2 (centered on their means so
+        the sums do not lose precision) plus prefix sums of any extra columns; the least-squares fit & the means over
+        any x window then take two binary searches & a few subtractions
+        :param x: abscissa values
+        :param y: ordinate values
+        :param extra: name -> values averaged over the same windows (NaN values are skipped)
+        """
+        x = np.asarray(x, dtype='float64')
+        y = np.asarray(y, dtype='float64')
+        finite = np.isfinite(x) & np.isfinite(y)
+        order = np.flatnonzero(finite)[np.argsort(x[finite], kind='stable')]
+        self.x: np.ndarray = x[order]
+        self.x_center: float = float(self.x.mean()) if len(self.x) > 0 else 0.0
+        self.y_center: float = float(y[order].mean()) if len(self.x) > 0 else 0.0
+        dx = self.x - self.x_center
+        dy = y[order] - self.y_center
+        self.sums: np.ndarray = np.zeros((6, len(self.x) + 1))
+        np.cumsum(np.stack((np.ones(len(self.x)), dx, dy, dx * dx, dx * dy, dy * dy)), axis=1, out=self.sums[:, 1:])
+        self.extra: dict = {}
+        for (name, values) in (extra or {}).items():
+            values = np.asarray(values, dtype='float64')[order]
+            sums = np.zeros((2, len(self.x) + 1))
+            np.cumsum(np.stack((np.isfinite(values), np.nan_to_num(values, nan=0.0, posinf=0.0, neginf=0.0))),
+                      axis=1, out=sums[:, 1:])
+            self.extra[name] = sums
+        self.order: np.ndarray = order
+
+    def bounds(self, x_start, x_end):
+        """
+        function finds the sorted positions of the points inside [x_start, x_end]
+        :param x_start: window start
+        :param x_end: window end
+        :return: first position & position after the last one
+        """
+        return np.searchsorted(self.x, x_start, 'left'), np.searchsorted(self.x, x_end, 'right')
+
+    def fit(self, x_start, x_end):
+        """
+        function fits a line to the points inside each [x_start, x_end] window; windows may be given as arrays of any
+        shape & are all evaluated at once
+        :param x_start: window starts
+        :param x_end: window ends
+        :return: least-squares slope, R^2 & number of points of each window (NaN slope & R^2 if fewer than 2
+        distinct x values)
+        """
+        (i, j) = self.bounds(x_start, x_end)
+        (n, sx, sy, sxx, sxy, syy) = self.sums[:, j] - self.sums[:, i]
+        x_spread = n * sxx - sx * sx
+        y_spread = n * syy - sy * sy
+        valid = (n >= 2) & (x_spread > 0.0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = np.where(valid, (n * sxy - sx * sy) / x_spread, np.nan)
+            r2 = np.where(valid & (y_spread > 0.0), (n * sxy - sx * sy) ** 2 / (x_spread * y_spread), np.nan)
+        return slope, r2, n.astype(np.int64)
+
+    def slope(self, x_start, x_end):
+        """
+        function returns the least-squares slope of the points inside [x_start, x_end]
+        :param x_start: window start
+        :param x_end: window end
+        :return: slope & number of points (NaN slope if fewer than 2 distinct x values)
+        """
+        (slope, r2, n) = self.fit(x_start, x_end)
+        return float(slope), int(n)
+
+    def mean(self, name, x_start, x_end):
+        """
+        function returns the mean of an extra column over the points inside [x_start, x_end]
+        :param name: extra column name
+        :param x_start: window start
+        :param x_end: window end
+        :return: mean (NaN if the window has no values)
+        """
+        (i, j) = self.bounds(x_start, x_end)
+        (n, total) = self.extra[name][:, j] - self.extra[name][:, i]
+        return total / n if n > 0 else math.nan
+
+    def rows(self, x_start, x_end):
+        """
+        function returns the original row positions of the points inside [x_start, x_end]
+        :param x_start: window start
+        :param x_end: window end
+        :return: row positions
+        """
+        (i, j) = self.bounds(x_start, x_end)
+        return self.order[i:j]
+
+
+class SignalConditioner:
+    # filters applied to the load, displacement & CSM columns before any calculation
+    methods: tuple = ('None', 'Savitzky-Golay', 'Moving Median', 'Butterworth')
+
+    def __init__(self, method: str = 'None', window: int = 11, order: int = 3, cutoff: float = 0.1):
+        """
+        function initializes the filter settings of the signal conditioning stage
+        :param method: 'None', 'Savitzky-Golay', 'Moving Median' or 'Butterworth'
+        :param window: odd number of points of the Savitzky-Golay & moving median windows
+        :param order: polynomial order (Savitzky-Golay) or filter order (Butterworth)
+        :param cutoff: Butterworth low-pass cutoff as a fraction of the Nyquist frequency (0 < cutoff < 1)
+        """
+        self.method: str = method
+        self.window: int = int(window)
+        self.order: int = int(order)
+        self.cutoff: float = float(cutoff)
+
+    @property
+    def key(self):
+        """
+        function gives the settings that determine the filtered values (memoization & result cache key)
+        :return: tuple of the settings the selected method uses
+        """
+        if self.method in ('Savitzky-Golay', 'Moving Median'):
+            return self.method, self.window, self.order if self.method == 'Savitzky-Golay' else 0
+        if self.method == 'Butterworth':
+            return self.method, self.order, self.cutoff
+        return 'None',
+
+    def active(self):
+        """
+        function checks whether a filter is selected
+        :return: True or False
+        """
+        return self.method != 'None'
+
+    def validate(self):
+        """
+        function checks the settings of the selected filter
+        :return: reason the filter cannot be applied ('' if it can)
+        """
+        if self.active() is False:
+            return ''
+        if self.method in ('Savitzky-Golay', 'Moving Median') and (self.window < 3 or self.window % 2 == 0):
+            return 'The filter window must be an odd number of at least 3 points.'
+        if self.method == 'Savitzky-Golay' and not 0 <= self.order < self.window:
+            return 'The Savitzky-Golay polynomial order must be at least 0 and less than the window.'
+        if self.method == 'Butterworth' and (self.order < 1 or not 0.0 < self.cutoff < 1.0):
+            return 'The Butterworth order must be at least 1 and the cutoff between 0 and 1 (fraction of Nyquist).'
+        return ''
+
+    def apply(self, values):
+        """
+        function filters a whole column at once; NaN rows are left out of the filter & kept as NaN
+            Savitzky-Golay: least-squares polynomial of the given order over each window (edges fitted, not padded;
+            columns shorter than the window are left as they are)
+            moving median: median of each window (edges repeat the first & last value)
+            Butterworth: low-pass run forward & backward (zero phase, so features are not shifted in strain)
+        :param values: column values
+        :return: filtered values
+        """
+        values = np.asarray(values, dtype='float64')
+        finite = np.isfinite(values)
+        kept = values[finite]
+        if self.active() is False or len(kept) == 0:
+            return values.copy()
+        if self.method == 'Savitzky-Golay':
+            filtered = signal.savgol_filter(kept, self.window, self.order, mode='interp') if len(kept) >= self.window else kept
+        elif self.method == 'Moving Median':
+            filtered = ndimage.median_filter(kept, size=self.window, mode='nearest')
+        else:
+            sos = signal.butter(self.order, self.cutoff, output='sos')
+            filtered = signal.sosfiltfilt(sos, kept, padlen=min(3 * (2 * len(sos) + 1), len(kept) - 1))
+        if finite.all():
+            return filtered
+        result = np.full(len(values), np.nan)
+        result[finite] = filtered
+        return result
+
+
+class FailureDetector:
+    # right after a failure candidate the stress trend fitted over drop_rows rows falls by more than drop_noise standard
+    # errors
+    drop_rows: int = 50
+    drop_noise: float = 4.0
+
+    def __init__(self, values, max_candidates: int = 10, min_size: int = 1, stress=None, direction=None,
+                 boundary: int = 10):
+        """
+        function segments the increments of a column (e.g. strain) into runs of constant mean by binary segmentation
+        within every loading stretch & ranks the change points where the mean increment jumps up while the stress
+        drops (the material gives way) as failure candidates; segment costs come from prefix sums, so each split
+        search is one vectorized pass over its segment
+            cost of a segment: sum of squared deviations of its increments from their mean
+            a change point is kept while it lowers the cost by more than 2 * sigma^2 * ln(n), w/ sigma the noise of the
+            increments (median absolute deviation of their differences)
+            a failure candidate lies at least boundary rows inside its loading stretch (never at a reload or at an
+            unload) & the stress trend over the drop_rows rows after it (within the stretch) falls by more than
+            drop_noise standard errors
+            confidence: share of the cost reduction of all failure candidates explained by the candidate
+        :param values: column values in row order (NaN rows are skipped)
+        :param max_candidates: most failure candidates ranked
+        :param min_size: fewest increments on either side of a change point
+        :param stress: stress of every row (None: no stress drop is required)
+        :param direction: SegmentIndex direction of every row (None: the whole column is one loading stretch)
+        :param boundary: fewest rows between a failure candidate & either end of its loading stretch
+        """
+        values = np.asarray(values, dtype='float64')
+        finite = np.flatnonzero(np.isfinite(values))
+        steps = np.diff(values[finite])
+        n = len(steps)
+        self.center: float = float(steps.mean()) if n > 0 else 0.0
+        self.sums: np.ndarray = np.zeros((2, n + 1))
+        np.cumsum(np.stack((steps - self.center, (steps - self.center) ** 2)), axis=1, out=self.sums[:, 1:])
+        self.min_size: int = max(int(min_size), 1)
+        if n > 2:
+            jitter = np.diff(steps)
+            sigma = 1.4826 * float(np.median(np.abs(jitter - np.median(jitter)))) / math.sqrt(2)
+        else:
+            sigma = 0.0
+        self.penalty: float = 2 * sigma ** 2 * math.log(max(n, 2))
+
+        # increment t is the step into row finite[t + 1]; loading stretches are runs of loading increments
+        if direction is None:
+            loading = np.ones(n, dtype=bool)
+        else:
+            loading = np.asarray(direction)[finite[1:]] == SegmentIndex.LOADING
+        edges = np.diff(np.concatenate(([0], loading.astype(np.int8), [0])))
+        (stretch_starts, stretch_stops) = (np.flatnonzero(edges == 1), np.flatnonzero(edges == -1))
+
+        changes = []
+        heap = []
+        for (lo, hi) in zip(stretch_starts, stretch_stops):
+            self.push_split(heap, int(lo), int(hi))
+        while len(heap) > 0 and len(changes) < 4 * max_candidates:
+            (negative_gain, t, lo, hi) = heapq.heappop(heap)
+            if -negative_gain <= self.penalty:
+                break
+            changes.append((-negative_gain, t, self.mean(lo, t), self.mean(t, hi)))
+            self.push_split(heap, lo, t)
+            self.push_split(heap, t, hi)
+        if stress is not None:
+            stress = np.asarray(stress, dtype='float64')
+            self.stress_noise: float = SegmentIndex.noise(stress)
+        stretch = np.searchsorted(stretch_starts, [change[1] for change in changes], 'right') - 1
+        failures = []
+        for (change, k) in zip(changes, stretch):
+            t = change[1]
+            if change[3] <= change[2] or t - stretch_starts[k] < boundary or stretch_stops[k] - t < boundary:
+                continue
+            if stress is not None and self.gives_way(stress, finite[t], finite[stretch_stops[k]]) is False:
+                continue
+            failures.append(change)
+        failures = sorted(failures, key=lambda change: -change[0])[:max_candidates]
+        gains = np.array([change[0] for change in failures])
+        # increment t is the step from row t to row t + 1: row t is the last row before the mean increment jumps
+        self.rows: np.ndarray = finite[[change[1] for change in failures]] if len(failures) > 0 else np.zeros(0, dtype=int)
+        self.confidence: np.ndarray = gains / gains.sum() if len(failures) > 0 else np.zeros(0)
+        self.step_before: np.ndarray = np.array([change[2] for change in failures])
+        self.step_after: np.ndarray = np.array([change[3] for change in failures])
+        # w/o a failure candidate the row of the highest stress (or the largest single increment) is the failure point
+        if len(self.rows) > 0:
+            self.failure_row: int = int(self.rows[0])
+        elif stress is not None and np.isfinite(stress).any():
+            self.failure_row: int = int(np.nanargmax(stress))
+        else:
+            self.failure_row: int = int(finite[np.argmax(steps)]) if n > 0 else 0
+
+    def gives_way(self, stress, row, last):
+        """
+        function checks whether the stress drops right after a change point: the least-squares trend of the stress
+        over the next drop_rows rows (up to the end of the loading stretch) has to fall by more than drop_noise times
+        its standard error (from the stress noise)
+        :param stress: stress of every row
+        :param row: last row before the change point
+        :param last: last row of the loading stretch
+        :return: True if the stress drops
+        """
+        after = stress[row + 1:min(row + 1 + self.drop_rows, last + 1)]
+        x = np.flatnonzero(np.isfinite(after)).astype('float64')
+        if len(x) < 3:
+            return False
+        y = after[np.isfinite(after)]
+        spread = float(((x - x.mean()) ** 2).sum())
+        drop = -float(((x - x.mean()) * (y - y.mean())).sum()) / spread * len(after)
+        error = self.stress_noise * len(after) / math.sqrt(spread)
+        return bool(drop > 0.0 and drop > self.drop_noise * error)
+
+    def cost(self, lo, hi):
+        """
+        function gives the sum of squared deviations of the increments in [lo, hi) from their mean
+        :param lo: first increment
+        :param hi: increment after the last one (scalar or array)
+        :return: segment cost
+        """
+        size = hi - lo
+        total = self.sums[0][hi] - self.sums[0][lo]
+        return self.sums[1][hi] - self.sums[1][lo] - total * total / size
+
+    def mean(self, lo, hi):
+        """
+        function gives the mean increment in [lo, hi)
+        :param lo: first increment
+        :param hi: increment after the last one
+        :return: mean increment
+        """
+        return float((self.sums[0][hi] - self.sums[0][lo]) / (hi - lo)) + self.center
+
+    def push_split(self, heap: list, lo, hi):
+        """
+        function finds the split of [lo, hi) that lowers the cost the most & queues it by its gain
+        :param heap: queue of candidate splits (negative gain first)
+        :param lo: first increment
+        :param hi: increment after the last one
+        :return: nothing
+        """
+        if hi - lo < 2 * self.min_size:
+            return
+        t = np.arange(lo + self.min_size, hi - self.min_size + 1)
+        split_cost = self.cost(lo, t) + self.cost(t, hi)
+        best = int(np.argmin(split_cost))
+        heapq.heappush(heap, (float(split_cost[best] - self.cost(lo, hi)), int(t[best]), lo, hi))
+
+
+class DriftCorrection:
+    def __init__(self, time, displacement, segment_index: SegmentIndex, min_rows: int = 10):
+        """
+        function measures the thermal drift rate of every hold segment (load held within the segment index tolerance)
+        by least-squares fits of displacement vs. time, all holds at once (np.add.reduceat over the hold rows), and
+        integrates the drift rate, interpolated between the holds' mid-times (constant before the first & after the
+        last hold), along the test
+        :param time: time column (or row numbers)
+        :param displacement: displacement column
+        :param segment_index: SegmentIndex of the load column
+        :param min_rows: fewest rows a hold needs to be fitted
+        """
+        time = np.asarray(time, dtype='float64')
+        displacement = np.asarray(displacement, dtype='float64')
+        (starts, stops) = segment_index.segments(SegmentIndex.HOLD)
+        fitted = (stops - starts) >= max(int(min_rows), 2)
+        (starts, stops) = (starts[fitted], stops[fitted])
+        rows = stops - starts
+        self.hold_starts: np.ndarray = starts
+        self.hold_rows: np.ndarray = rows
+        self.rates: np.ndarray = np.zeros(len(starts))
+        self.hold_times: np.ndarray = np.zeros(len(starts))
+        self.drift: np.ndarray = np.zeros(len(displacement))
+        if len(starts) == 0:
+            return
+        # rows of all holds back to back; sums are centered on each hold's first point to keep their precision
+        offsets = np.cumsum(rows) - rows
+        positions = np.repeat(starts - offsets, rows) + np.arange(rows.sum())
+        t = time[positions] - np.repeat(time[starts], rows)
+        d = displacement[positions] - np.repeat(displacement[starts], rows)
+        valid = np.isfinite(t) & np.isfinite(d)
+        (t, d) = (np.where(valid, t, 0.0), np.where(valid, d, 0.0))
+        (n, st, sd, stt, std) = (np.add.reduceat(valid.astype('float64'), offsets), np.add.reduceat(t, offsets),
+                                 np.add.reduceat(d, offsets), np.add.reduceat(t * t, offsets),
+                                 np.add.reduceat(t * d, offsets))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.rates = (n * std - st * sd) / (n * stt - st * st)
+            self.hold_times = time[starts] + st / n
+        known = np.isfinite(self.rates) & np.isfinite(self.hold_times)
+        (self.hold_starts, self.hold_rows) = (self.hold_starts[known], self.hold_rows[known])
+        (self.rates, self.hold_times) = (self.rates[known], self.hold_times[known])
+        if len(self.rates) == 0:
+            return
+        order = np.argsort(self.hold_times, kind='stable')
+        rate = np.interp(time, self.hold_times[order], self.rates[order])
+        step = np.nan_to_num(0.5 * (rate[1:] + rate[:-1]) * np.diff(time))
+        self.drift[1:] = np.cumsum(step)
+
+
+class ContactDetector:
+    # ways first contact is found on the load-displacement curve
+    methods: tuple = ('Piecewise Fit', 'Load Threshold')
+
+    def __init__(self, load, displacement, method: str = 'Piecewise Fit', threshold: float = 0.0):
+        """
+        function finds the row of first contact on the first loading of the load-displacement curve in one vectorized
+        pass; the first loading ends at its peak load, before the load first falls back below half of its rise so far
+        (once the rise exceeds 10% of the load range, so noise before contact does not end it)
+            load threshold: first row whose load exceeds the initial load by the threshold
+            piecewise fit: row c that minimizes the squared error of a constant load before c plus a quadratic of load
+            vs. displacement from c to the peak load; prefix sums give the error of every c at once
+        :param load: load column
+        :param displacement: displacement column
+        :param method: 'Piecewise Fit' or 'Load Threshold'
+        :param threshold: load rise above the initial load that marks contact (load threshold only)
+        """
+        load = np.asarray(load, dtype='float64')
+        displacement = np.asarray(displacement, dtype='float64')
+        rows = np.flatnonzero(np.isfinite(load) & np.isfinite(displacement))
+        self.row: int = int(rows[0]) if len(rows) > 0 else 0
+        if len(rows) < 4:
+            return
+        p = load[rows] - load[rows[0]]
+        rise = np.maximum.accumulate(p)
+        unloaded = np.flatnonzero((rise > 0.1 * (p.max() - p.min())) & (p < 0.5 * rise))
+        peak = int(np.argmax(p[:unloaded[0]] if len(unloaded) > 0 else p))
+        (rows, p) = (rows[:peak + 1], p[:peak + 1])
+        if method == 'Load Threshold':
+            above = np.flatnonzero(p >= threshold)
+            self.row = int(rows[above[0]]) if len(above) > 0 else int(rows[0])
+            return
+        if len(rows) < 5:
+            return
+        # displacement scaled to [-1, 1] so the prefix sums of its powers keep their precision
+        h = displacement[rows] - displacement[rows[0]]
+        h = h / max(float(np.abs(h).max()), np.finfo('float64').tiny)
+        sums = np.zeros((9, len(rows) + 1))
+        np.cumsum(np.stack((np.ones(len(rows)), p, p * p, h, h * h, h ** 3, h ** 4, h * p, h * h * p)), axis=1,
+                  out=sums[:, 1:])
+        c = np.arange(1, len(rows) - 2)
+        before = sums[2][c] - sums[1][c] ** 2 / c
+        (m, sp, spp, s1, s2, s3, s4, s1p, s2p) = (sums[:, -1:] - sums[:, c])
+        # least-squares quadratic of the load after c from its normal equations, for every c at once (pseudo-inverse
+        # if the equations are singular, e.g. where the displacement does not change)
+        normal = np.stack((np.stack((m, s1, s2), axis=-1), np.stack((s1, s2, s3), axis=-1),
+                           np.stack((s2, s3, s4), axis=-1)), axis=-2)
+        moments = np.stack((sp, s1p, s2p), axis=-1)
+        try:
+            coefficients = np.linalg.solve(normal, moments[..., np.newaxis])[..., 0]
+        except np.linalg.LinAlgError:
+            coefficients = (np.linalg.pinv(normal) @ moments[..., np.newaxis])[..., 0]
+        after = spp - (coefficients * moments).sum(axis=-1)
+        self.row = int(rows[c[np.nanargmin(before + after)]])
+
+
+class FolderWatcher:
+    def __init__(self, directory: str, ledger_path: str):
+        """
+        function watches a folder for new CSV files by polling its listing on local disk; a file is ready once its
+        size & modification time are unchanged between two polls (the instrument finished writing it), and files that
+        were already processed are recognized by the fingerprint of their content kept in a ledger file
+        :param directory: watched folder
+        :param ledger_path: JSON file of processed fingerprints (shared by every watched folder)
+        """
+        self.directory = directory
+        self.ledger_path = ledger_path
+        self.stats: dict = {}
+        self.queued: dict = {}
+        try:
+            with open(ledger_path) as f:
+                self.ledger: dict = json.load(f)
+        except (OSError, ValueError):
+            self.ledger: dict = {}
+
+    def scan(self):
+        """
+        function lists the CSV files of the folder & hands out those that did not change since the previous poll
+        (once per size & modification time, so a file written again is handed out again)
+        :return: paths of the files that are ready, in file name order
+        """
+        stats = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.lower().endswith('.csv'):
+                    stat = entry.stat()
+                    stats[entry.path] = (stat.st_size, stat.st_mtime_ns)
+        ready = []
+        for path in sorted(stats):
+            if stats[path][0] > 0 and stats[path] == self.stats.get(path) and self.queued.get(path) != stats[path]:
+                self.queued[path] = stats[path]
+                ready.append(path)
+        self.stats = stats
+        return ready
+
+    def processed(self, fingerprint: str):
+        """
+        function checks whether a file w/ this fingerprint was already processed
+        :param fingerprint: SHA-256 of the file content
+        :return: True or False
+        """
+        return fingerprint in self.ledger
+
+    def record(self, fingerprint: str, path: str, csv_file: int):
+        """
+        function adds a processed file to the ledger & writes the ledger (through a temporary file so an interrupted
+        write never leaves half a ledger); the file stays in the ledger kept in memory if the write fails
+        :param fingerprint: SHA-256 of the file content
+        :param path: file path
+        :param csv_file: number of the CSV file it was loaded as
+        :return: updated ledger file (OSError if it cannot be written)
+        """
+        self.ledger[fingerprint] = {'file': os.path.basename(path), 'folder': self.directory, 'csv_file': csv_file,
+                                    'processed': time.strftime('%Y-%m-%dT%H:%M:%S')}
+        os.makedirs(os.path.dirname(self.ledger_path), exist_ok=True)
+        temp = self.ledger_path + '.tmp'
+        with open(temp, 'w') as f:
+            json.dump(self.ledger, f, indent=1)
+        os.replace(temp, self.ledger_path)
+
+
+class LiveTail:
+    def __init__(self, path: str, capacity: int = 65536):
+        """
+        function follows a CSV file that is still being written (header & unit row first, like instrument exports);
+        the rows read so far are kept in one float64 buffer that doubles when it is full, so each poll only parses &
+        copies the rows appended since the previous poll
+        :param path: CSV file path
+        :param capacity: number of rows the buffer starts with
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            header = f.readline()
+            unit_row = f.readline()
+        if unit_row.endswith(b'\n') is False:
+            raise ValueError('the header & unit row are not complete yet')
+        head = pd.read_csv(io.BytesIO(header + unit_row), dtype=str, keep_default_na=False, skip_blank_lines=False)
+        self.columns: list = list(head.columns)
+        self.raw_columns = len(self.columns)
+        self.units: dict = {}
+        for (j, col_name) in enumerate(self.columns):
+            unit = head.iloc[0, j] if len(head) > 0 else ''
+            self.units[col_name] = unit if unit != '' else 'null'
+        self.offset = len(header) + len(unit_row)
+        self.offsets: dict = {}
+        self.values = np.full((capacity, self.raw_columns), np.nan)
+        self.rows = 0
+
+    def add_column(self, col_name):
+        """
+        function adds a calculated column to the buffer; the caller fills it for the new rows of every poll
+        :param col_name: column name
+        :return: position of the column in the buffer
+        """
+        if col_name not in self.columns:
+            self.columns.append(col_name)
+            values = np.full((len(self.values), len(self.columns)), np.nan)
+            values[:self.rows, :-1] = self.values[:self.rows]
+            self.values = values
+        return self.columns.index(col_name)
+
+    def poll(self):
+        """
+        function reads the bytes appended to the file since the last poll (up to the last complete line), parses them
+        & appends the rows; like re-zeroing, every column is shifted by its minimum, taken over the first rows read so
+        later rows keep the same zero
+        :return: first & end row of the new rows (equal if there are none)
+        """
+        size = os.path.getsize(self.path)
+        if size < self.offset:
+            raise ValueError('the file is now shorter than the rows already read')
+        first = self.rows
+        if size == self.offset:
+            return first, first
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            chunk = f.read(size - self.offset)
+        chunk = chunk[:chunk.rfind(b'\n') + 1]
+        self.offset += len(chunk)
+        if len(chunk.strip()) == 0:
+            return first, first
+        block = pd.read_csv(io.BytesIO(chunk), header=None)
+        width = min(self.raw_columns, block.shape[1])
+        values = np.full((len(block), self.raw_columns), np.nan)
+        values[:, :width] = block.iloc[:, :width].apply(pd.to_numeric, errors='coerce').to_numpy(dtype='float64')
+        if len(self.offsets) == 0:
+            for (j, col_name) in enumerate(self.columns[:self.raw_columns]):
+                finite = values[:, j][np.isfinite(values[:, j])]
+                self.offsets[col_name] = float(finite.min()) if len(finite) > 0 else 0.0
+        values -= np.array([self.offsets[col_name] for col_name in self.columns[:self.raw_columns]])
+        end = first + len(values)
+        if end > len(self.values):
+            grown = np.full((max(2 * len(self.values), end), len(self.columns)), np.nan)
+            grown[:first] = self.values[:first]
+            self.values = grown
+        self.values[first:end, :self.raw_columns] = values
+        self.rows = end
+        return first, end
+
+    def column(self, col_name):
+        """
+        function returns the rows read so far of a column (a view of the buffer, valid until the next poll)
+        :param col_name: column name
+        :return: column values
+        """
+        return self.values[:self.rows, self.columns.index(col_name)]
+
+
+class DatasetStore:
+    # largest float32 round-off, relative to the column's typical (median nonzero) step, a column may take & still be
+    # stored as float32
+    storage_tolerance: float = 0.001
+
+    def __init__(self):
+        """
+        function initializes the registry of cleaned datasets (unit row removed, re-zeroed) keyed by CSV index so
+        Data Calculations sheets start from memory instead of re-reading & re-cleaning the CSV file each time; watch
+        workers register & calculate datasets while the main thread reads them, so every access holds the lock
+        (listeners are called after it is released)
+        """
+        self.frames: dict = {}
+        self.units: dict = {}
+        self.base_columns: dict = {}
+        self.digests: dict = {}
+        self.artifacts: dict = {}
+        self.offsets: dict = {}
+        self.precision: str = 'float64'
+        self.dtypes: dict = {}
+        self.columns: dict = {}
+        self.listeners: list = []
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def zero_offsets(frame):
+        """
+        function measures the shift re-zeroing applies to every column (its minimum) before it is applied
+        :param frame: reindexed DataFrame
+        :return: column name -> minimum (0.0 for columns w/o numbers)
+        """
+        offsets = {}
+        for col_name in frame.columns:
+            edge = float(np.nanmin(frame[col_name].to_numpy(dtype='float64'))) if frame[col_name].notna().any() else 0.0
+            offsets[col_name] = edge if math.isfinite(edge) else 0.0
+        return offsets
+
+    def storage_dtype(self, values):
+        """
+        function picks the dtype a column is kept in: float32 under the float32 precision policy if rounding the column
+        to float32 moves no value by more than storage_tolerance of its typical step (so counters like time on long
+        tests, whose steps are small next to their magnitude, stay float64), float64 otherwise
+        :param values: column values
+        :return: 'float32' or 'float64'
+        """
+        if self.precision != 'float32':
+            return 'float64'
+        values = np.asarray(values, dtype='float64')
+        values = values[np.isfinite(values)]
+        if len(values) == 0:
+            return 'float32'
+        if np.abs(values).max() > np.finfo('float32').max:
+            return 'float64'
+        error = np.abs(values.astype('float32') - values).max()
+        if error == 0.0:
+            return 'float32'
+        steps = np.abs(np.diff(values))
+        steps = steps[steps > 0]
+        scale = np.median(steps) if len(steps) > 0 else np.abs(values).max()
+        return 'float32' if error <= self.storage_tolerance * scale else 'float64'
+
+    def compact(self, n, frame):
+        """
+        function applies the precision policy to the float64 columns of a frame kept for the nth dataset (cleaned raw
+        columns & calculated columns); the dtype of each column is measured once per dataset & column name
+        :param n: nth CSV file
+        :param frame: DataFrame
+        :return: DataFrame w/ float32 columns wherever they lose no precision that matters (the frame itself if none)
+        """
+        with self.lock:
+            if self.precision != 'float32':
+                return frame
+            dtypes = self.dtypes.setdefault(n, {})
+            casts = {}
+            for col_name in frame.columns:
+                if frame[col_name].dtype != np.float64:
+                    continue
+                if col_name not in dtypes:
+                    dtypes[col_name] = self.storage_dtype(frame[col_name].to_numpy())
+                if dtypes[col_name] == 'float32':
+                    casts[col_name] = 'float32'
+        if len(casts) == 0:
+            return frame
+        with profiler.span('compact', n, len(frame), columns=len(casts)):
+            return frame.astype(casts)
+
+    def set_precision(self, precision: str):
+        """
+        function switches the precision policy; switching to float32 compacts every registered frame (its digest &
+        artifacts are dropped when stored values change), switching back keeps datasets registered later in float64
+        :param precision: 'float64' or 'float32'
+        :return: nothing
+        """
+        with self.lock:
+            self.precision = precision
+            if precision != 'float32':
+                return
+            for n in self.frames:
+                frame = self.compact(n, self.frames[n])
+                if frame is not self.frames[n]:
+                    self.frames[n] = frame
+                    self.digests.pop(n, None)
+                    self.artifacts.pop(n, None)
+
+    @staticmethod
+    def nbytes(frame):
+        """
+        function counts the bytes held by the float columns of a frame
+        :param frame: DataFrame
+        :return: number of bytes
+        """
+        return int(sum(frame[col_name].to_numpy().nbytes for col_name in frame.columns if frame[col_name].dtype.kind == 'f'))
+
+    def subscribe(self, listener):
+        """
+        function registers a listener called w/ the dataset index whenever the published columns of a dataset change
+        :param listener: callable taking the dataset index
+        :return: nothing
+        """
+        with self.lock:
+            if listener not in self.listeners:
+                self.listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        """
+        function removes a listener (e.g. of a closed Data Calculations sheet)
+        :param listener: callable registered by subscribe
+        :return: nothing
+        """
+        with self.lock:
+            if listener in self.listeners:
+                self.listeners.remove(listener)
+
+    def publish(self, n, columns, units: dict):
+        """
+        function records the columns the nth dataset offers for plotting (raw & calculated, w/ their units) and notifies
+        the listeners if the columns or their units changed, so option menus are listed w/o touching the data
+        :param n: nth CSV file
+        :param columns: column names in frame order
+        :param units: column name -> unit
+        :return: nothing
+        """
+        columns = {col_name: str(units.get(col_name, 'null')) for col_name in columns}
+        with self.lock:
+            if list(columns.items()) == list(self.columns.get(n, {}).items()):
+                return
+            self.columns[n] = columns
+            listeners = list(self.listeners)
+        for listener in listeners:
+            listener(n)
+
+    def listed_columns(self, n):
+        """
+        function gives the columns last published for the nth dataset
+        :param n: nth CSV file
+        :return: column name -> unit (empty if none were published)
+        """
+        with self.lock:
+            return dict(self.columns.get(n, {}))
+
+    def has(self, n):
+        """
+        function checks whether the nth dataset has been cleaned & registered
+        :param n: nth CSV file
+        :return: True or False
+        """
+        with self.lock:
+            return n in self.frames
+
+    def registered(self):
+        """
+        function lists the registered datasets w/ their frames as stored (float32 where compacted)
+        :return: nth CSV file -> DataFrame
+        """
+        with self.lock:
+            return dict(self.frames)
+
+    def stored(self, n):
+        """
+        function returns the registered frame of the nth dataset as stored (raw & calculated columns, float32 where
+        compacted) w/o copying it; callers only read it
+        :param n: nth CSV file
+        :return: DataFrame
+        """
+        with self.lock:
+            return self.frames[n]
+
+    def stored_units(self, n):
+        """
+        function gives the units of the nth dataset
+        :param n: nth CSV file
+        :return: column name -> unit
+        """
+        with self.lock:
+            return dict(self.units[n])
+
+    def stored_offsets(self, n):
+        """
+        function gives the shift re-zeroing removed from each column of the nth dataset
+        :param n: nth CSV file
+        :return: column name -> shift (empty if none were recorded)
+        """
+        with self.lock:
+            return dict(self.offsets.get(n, {}))
+
+    def stored_base_columns(self, n):
+        """
+        function gives the raw columns of the nth dataset's registered frame
+        :param n: nth CSV file
+        :return: column names
+        """
+        with self.lock:
+            return list(self.base_columns[n])
+
+    def register(self, n, frame, units: dict, base_columns=None, offsets=None):
+        """
+        function registers the cleaned DataFrame of the nth dataset w/ its units; a restored session registers the
+        full frame (raw & calculated columns) and names the raw columns in base_columns
+        :param n: nth CSV file
+        :param frame: cleaned DataFrame
+        :param units: column name -> unit
+        :param base_columns: raw columns of the frame (all columns if None)
+        :param offsets: column name -> shift removed by re-zeroing (none recorded if None)
+        :return: nothing
+        """
+        with self.lock:
+            self.dtypes.pop(n, None)
+            self.frames[n] = self.compact(n, frame)
+            self.offsets[n] = dict(offsets or {})
+            self.units[n] = dict(units)
+            self.base_columns[n] = list(frame.columns) if base_columns is None else list(base_columns)
+            self.digests.pop(n, None)
+            self.artifacts.pop(n, None)
+        self.publish(n, frame.columns, units)
+
+    def frame(self, n):
+        """
+        function returns a private copy of the raw columns of the nth cleaned dataset so calculations never modify
+        the registered frame; columns stored as float32 are upcast so every calculation runs in float64
+        :param n: nth CSV file
+        :return: cleaned DataFrame
+        """
+        with self.lock:
+            frame = self.frames[n]
+            base_columns = list(self.base_columns[n])
+        if len(base_columns) != len(frame.columns):
+            frame = frame[base_columns]
+        casts = {col_name: 'float64' for col_name in frame.columns if frame[col_name].dtype == np.float32}
+        if len(casts) > 0:
+            return frame.astype(casts)
+        return frame.copy()
+
+    def update_units(self, n, units: dict):
+        """
+        function adds units of newly calculated columns to the nth dataset
+        :param n: nth CSV file
+        :param units: column name -> unit
+        :return: nothing
+        """
+        with self.lock:
+            self.units[n].update(units)
+
+    def remove(self, n):
+        """
+        function drops the nth dataset from the registry (e.g. after it is parsed into cycles); listeners are notified
+        that its published columns are gone
+        :param n: nth CSV file
+        :return: nothing
+        """
+        with self.lock:
+            self.frames.pop(n, None)
+            self.units.pop(n, None)
+            self.base_columns.pop(n, None)
+            self.digests.pop(n, None)
+            self.artifacts.pop(n, None)
+            self.offsets.pop(n, None)
+            self.dtypes.pop(n, None)
+            listeners = list(self.listeners) if self.columns.pop(n, None) is not None else []
+        for listener in listeners:
+            listener(n)
+
+    def digest(self, n):
+        """
+        function hashes the raw columns (names & float64 values) of the nth cleaned dataset; the hash identifies the
+        dataset's content for result_cache regardless of file name or location
+        :param n: nth CSV file
+        :return: SHA-256 hex digest
+        """
+        with self.lock:
+            if n in self.digests:
+                return self.digests[n]
+            frame = self.frames[n]
+            base_columns = list(self.base_columns[n])
+        content = hashlib.sha256()
+        for col_name in base_columns:
+            content.update(col_name.encode('utf-8'))
+            content.update(np.ascontiguousarray(frame[col_name].to_numpy(dtype='float64')))
+        with self.lock:
+            if self.frames.get(n) is frame:
+                self.digests[n] = content.hexdigest()
+        return content.hexdigest()
+
+    def artifact(self, n, key, build):
+        """
+        function returns an artifact of the nth dataset (segment index, filtered column, drift, contact), built on first
+        use & kept until the dataset is registered again or removed; it is built w/o holding the lock so a watch worker
+        does not block the main thread, and dropped if the dataset was registered again meanwhile
+        :param n: nth CSV file
+        :param key: artifact key
+        :param build: callable building the artifact from the registered frame
+        :return: artifact
+        """
+        with self.lock:
+            frame = self.frames[n]
+            if key in self.artifacts.get(n, {}):
+                return self.artifacts[n][key]
+        value = build(frame)
+        with self.lock:
+            if self.frames.get(n) is frame:
+                value = self.artifacts.setdefault(n, {}).setdefault(key, value)
+        return value
+
+    def segments(self, n, col_name, tolerance: float = 0.0):
+        """
+        function returns the segment index of a raw column of the nth dataset; it is computed on first use and kept
+        until the dataset is registered again or removed
+        :param n: nth CSV file
+        :param col_name: displacement or load column
+        :param tolerance: largest |step| still treated as a hold
+        :return: SegmentIndex
+        """
+        def build(frame):
+            with profiler.span('segment_index', n, len(frame), column=col_name):
+                return SegmentIndex(frame[col_name].to_numpy(dtype='float64'), tolerance)
+
+        return self.artifact(n, ('segments', col_name, tolerance), build)
+
+    def conditioned(self, n, col_name, conditioner: SignalConditioner):
+        """
+        function returns a raw column of the nth dataset filtered by the signal conditioner; it is computed on first
+        use for each filter setting and kept until the dataset is registered again or removed
+        :param n: nth CSV file
+        :param col_name: load, displacement or CSM column
+        :param conditioner: filter settings
+        :return: filtered values
+        """
+        def build(frame):
+            with profiler.span('signal_conditioning', n, len(frame), column=col_name, method=conditioner.method):
+                return conditioner.apply(frame[col_name].to_numpy(dtype='float64'))
+
+        return self.artifact(n, ('conditioned', col_name) + conditioner.key, build)
+
+    def drift(self, n, time_col, load_col, displacement_col, tolerance: float = 0.0, min_rows: int = 10):
+        """
+        function returns the thermal drift correction of the nth dataset; it is computed on first use for each
+        setting and kept until the dataset is registered again or removed
+        :param n: nth CSV file
+        :param time_col: time column ('' to use row numbers)
+        :param load_col: load column (holds are found in it)
+        :param displacement_col: displacement column
+        :param tolerance: largest |load step| still treated as a hold
+        :param min_rows: fewest rows a hold needs to be fitted
+        :return: DriftCorrection
+        """
+        def build(frame):
+            segment_index = self.segments(n, load_col, tolerance)
+            with profiler.span('drift_correction', n, len(frame), time=time_col, tolerance=tolerance):
+                time = frame[time_col].to_numpy(dtype='float64') if time_col != '' else np.arange(len(frame), dtype='float64')
+                return DriftCorrection(time, frame[displacement_col].to_numpy(dtype='float64'), segment_index, min_rows)
+
+        return self.artifact(n, ('drift', time_col, load_col, displacement_col, tolerance, min_rows), build)
+
+    def contact(self, n, load_col, displacement_col, method: str = 'Piecewise Fit', threshold: float = 0.0):
+        """
+        function returns the contact row of the nth dataset; it is computed on first use for each setting and kept
+        until the dataset is registered again or removed
+        :param n: nth CSV file
+        :param load_col: load column
+        :param displacement_col: displacement column
+        :param method: 'Piecewise Fit' or 'Load Threshold'
+        :param threshold: load rise above the initial load that marks contact (load threshold only)
+        :return: ContactDetector
+        """
+        def build(frame):
+            with profiler.span('contact_detection', n, len(frame), method=method):
+                return ContactDetector(frame[load_col].to_numpy(dtype='float64'),
+                                       frame[displacement_col].to_numpy(dtype='float64'), method, threshold)
+
+        return self.artifact(n, ('contact', load_col, displacement_col, method,
+                                 threshold if method == 'Load Threshold' else 0.0), build)
+
+
+# Global registry of cleaned datasets
+dataset_store: DatasetStore = DatasetStore()
+
+# Binary container layout: magic, little-endian uint64 header length, JSON header, raw arrays aligned to 64 bytes
+CONTAINER_MAGIC: bytes = b'DVACBIN1'
+CONTAINER_ALIGN: int = 64
+
+
+def write_container(path: str, header: dict, arrays: dict):
+    """
+    function writes a JSON header & raw numeric arrays into a single binary file; every array starts on a 64-byte
+    boundary so it can be memory-mapped in place on reload
+    :param path: file path
+    :param header: JSON-serializable information
+    :param arrays: name -> numpy array
+    :return: binary container file
+    """
+    entries = {}
+    blobs = []
+    offset = 0
+    for name in arrays:
+        array = np.ascontiguousarray(arrays[name])
+        entries[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+        blobs.append((offset, array))
+        offset += -(-array.nbytes // CONTAINER_ALIGN) * CONTAINER_ALIGN
+    encoded = json.dumps(dict(header, arrays=entries)).encode('utf-8')
+    start = -(-(len(CONTAINER_MAGIC) + 8 + len(encoded)) // CONTAINER_ALIGN) * CONTAINER_ALIGN
+    with open(path, 'wb') as f:
+        f.write(CONTAINER_MAGIC)
+        f.write(struct.pack('<Q', len(encoded)))
+        f.write(encoded)
+        for (position, array) in blobs:
+            f.seek(start + position)
+            f.write(array.tobytes())
+        f.truncate(start + offset)
+
+
+def read_container(path: str):
+    """
+    function reads a binary container written by write_container; arrays are memory-mapped copy-on-write so only
+    the pages that are used get loaded and edits never touch the file
+    :param path: file path
+    :return: header dictionary & name -> array
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(CONTAINER_MAGIC)) != CONTAINER_MAGIC:
+            raise ValueError('Not a DVaCGUI file: ' + path)
+        length = struct.unpack('<Q', f.read(8))[0]
+        header = json.loads(f.read(length).decode('utf-8'))
+    start = -(-(len(CONTAINER_MAGIC) + 8 + length) // CONTAINER_ALIGN) * CONTAINER_ALIGN
+    arrays = {}
+    for name, entry in header['arrays'].items():
+        dtype = np.dtype(entry['dtype'])
+        shape = tuple(entry['shape'])
+        if int(np.prod(shape)) == 0:
+            arrays[name] = np.zeros(shape, dtype=dtype)
+        else:
+            arrays[name] = np.memmap(path, dtype=dtype, mode='c', offset=start + entry['offset'], shape=shape)
+    return header, arrays
+
+
+class ResultCache:
+    def __init__(self, directory: str, max_bytes: int = 512 * 1024 * 1024, verify_rate: float = 0.1):
+        """
+        function initializes the persistent, content-addressed cache of calculation results; each entry is a binary
+        container named by the SHA-256 of (dataset hash, calculation, calculation version, parameters)
+        :param directory: folder holding the cache entries
+        :param max_bytes: size limit; least recently used entries are removed beyond it
+        :param verify_rate: fraction of cache hits recalculated & compared when verification is on
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.verify_rate = verify_rate
+        self.enabled: bool = True
+        self.verify: bool = False
+        self.hits: int = 0
+        self.misses: int = 0
+        self.verified: int = 0
+        self.mismatches: list = []
+        self.write_errors: list = []
+        self.lock = threading.Lock()
+        self.rng = np.random.default_rng()
+
+    @staticmethod
+    def key(digest: str, calculation: str, version: int, params: dict):
+        """
+        function encodes the cache key canonically (sorted keys, no whitespace) and hashes it
+        :param digest: dataset hash
+        :param calculation: calculation name
+        :param version: calculation version
+        :param params: parameters the calculation depends on
+        :return: SHA-256 hex digest
+        """
+        canonical = json.dumps({'dataset': digest, 'calculation': calculation, 'version': version, 'parameters': params},
+                               sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def path(self, key: str):
+        """
+        function gives the file of a cache entry
+        :param key: cache key
+        :return: file path
+        """
+        return os.path.join(self.directory, key + '.dvac')
+
+    def load(self, key: str):
+        """
+        function reads a cache entry into memory & marks it as recently used
+        :param key: cache key
+        :return: header & arrays, or None on a miss
+        """
+        path = self.path(key)
+        try:
+            header, arrays = read_container(path)
+            arrays = {name: np.array(arrays[name]) for name in arrays}
+            os.utime(path)
+        except (OSError, ValueError, KeyError):
+            with self.lock:
+                self.misses += 1
+            return None
+        with self.lock:
+            self.hits += 1
+        return header, arrays
+
+    def store(self, key: str, header: dict, arrays: dict):
+        """
+        function writes a cache entry (through a temporary file so readers never see half an entry) and evicts least
+        recently used entries beyond the size limit; a failed write is recorded in write_errors
+        :param key: cache key
+        :param header: JSON-serializable outputs
+        :param arrays: name -> numpy array
+        :return: True if the entry was written
+        """
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temp = self.path(key) + '.' + str(threading.get_ident()) + '.tmp'
+            write_container(temp, header, arrays)
+            os.replace(temp, self.path(key))
+            self.evict()
+        except OSError as error:
+            with self.lock:
+                self.write_errors.append({'key': key, 'error': str(error), 'time': time.strftime('%Y-%m-%d %H:%M:%S')})
+            return False
+        return True
+
+    def entries(self):
+        """
+        function lists the cache entries
+        :return: list of (last use time, size in bytes, path)
+        """
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries
+        for name in names:
+            if name.endswith('.dvac'):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self):
+        """
+        function removes least recently used entries until the cache fits in max_bytes
+        :return: nothing
+        """
+        with self.lock:
+            entries = sorted(self.entries())
+            total = sum(entry[1] for entry in entries)
+            for (_, size, path) in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    continue
+
+    def should_verify(self):
+        """
+        function decides whether a cache hit is recalculated & compared
+        :return: True or False
+        """
+        return self.verify is True and self.rng.random() < self.verify_rate
+
+    def record_verification(self, calculation: str, key: str, matched: bool):
+        """
+        function counts a verified hit; mismatching entries are recorded in mismatches & removed so they are
+        recalculated
+        :param calculation: calculation name
+        :param key: cache key
+        :param matched: whether the recalculated outputs match the cached outputs
+        :return: nothing
+        """
+        with self.lock:
+            self.verified += 1
+            if matched is False:
+                self.mismatches.append({'calculation': calculation, 'key': key, 'time': time.strftime('%Y-%m-%d %H:%M:%S')})
+        if matched is False:
+            try:
+                os.remove(self.path(key))
+            except OSError:
+                return
+
+    def summary(self):
+        """
+        function summarizes the cache's size & hit statistics
+        :return: dictionary of cache statistics
+        """
+        entries = self.entries()
+        return {'directory': self.directory, 'entries': len(entries), 'bytes': sum(entry[1] for entry in entries),
+                'max_bytes': self.max_bytes, 'hits': self.hits, 'misses': self.misses, 'verified': self.verified,
+                'mismatches': len(self.mismatches), 'write_errors': len(self.write_errors),
+                'last_mismatch': self.mismatches[-1] if len(self.mismatches) > 0 else None,
+                'last_write_error': self.write_errors[-1] if len(self.write_errors) > 0 else None}
+
+    def clear(self):
+        """
+        function removes every cache entry & resets the statistics
+        :return: nothing
+        """
+        for (_, _, path) in self.entries():
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+        with self.lock:
+            self.hits = 0
+            self.misses = 0
+            self.verified = 0
+            self.mismatches = []
+            self.write_errors = []
+
+
+# Global persistent result cache (in the user's home folder)
+result_cache: ResultCache = ResultCache(os.path.join(os.path.expanduser('~'), '.dvacgui', 'cache'))
+
+
+def update_option_menu(menu, variable, listed, columns: dict, command, placeholder: str):
+    """
+    function brings an option menu of columns (entries after its placeholder) up to date w/ the published columns:
+    entries of removed columns are deleted, entries whose unit changed are relabeled & new columns are appended, so
+    only the changes cost Tk calls; a menu w/o a record of its entries is rebuilt once
+    :param menu: menu of the option menu
+    :param variable: variable of the option menu (reset to the placeholder if its column is removed)
+    :param listed: column name -> unit listed in the menu (None if unknown)
+    :param columns: column name -> unit published
+    :param command: called w/ the selected column
+    :param placeholder: text of the first entry (e.g. 'Select Abscissa')
+    :return: column name -> unit now listed
+    """
+    if listed is None:
+        menu.delete(0, 'end')
+        menu.add_command(label=placeholder, command=tk._setit(variable, placeholder))
+        listed = {}
+    order = list(listed)
+    for position in sorted((order.index(col_name) for col_name in order if col_name not in columns), reverse=True):
+        menu.delete(position + 1)
+    if variable.get() in listed and variable.get() not in columns:
+        variable.set(placeholder)
+    kept = [col_name for col_name in order if col_name in columns]
+    for (position, col_name) in enumerate(kept):
+        if listed[col_name] != columns[col_name]:
+            menu.entryconfigure(position + 1, label=col_name + ' (' + columns[col_name] + ')')
+    for col_name in columns:
+        if col_name not in listed:
+            menu.add_command(label=col_name + ' (' + columns[col_name] + ')', command=tk._setit(variable, col_name, command))
+    return {col_name: columns[col_name] for col_name in kept + [c for c in columns if c not in listed]}
+
+
 class CSVInterface(tk.Frame):
+    # watched folder: poll interval (ms), ledger of processed files & the results listed in the campaign table
+    watch_interval: int = 1000
+    watch_ledger: str = os.path.join(os.path.expanduser('~'), '.dvacgui', 'processed.json')
+    campaign_attributes: tuple = ('youngs_modulus_value_slope', 'youngs_modulus_value_csm',
+                                  'youngs_modulus_value_sneddon', 'ultimate_stress_value', 'ultimate_strain_value',
+                                  'energy_dissipated_value', 'num_bursts_value')
+    campaign_columns: tuple = ('CSV File', "Young's Modulus (Slope)", "Young's Modulus (CSM)",
+                               "Young's Modulus (Sneddon)", 'Ultimate Stress', 'Ultimate Strain', 'Energy Dissipated',
+                               'Bursts')
+
     def __init__(self, parent, *args, **kwargs):
         """
         function initializes CSVInterface class upon initializing the program
@@ -49,6 +1709,15 @@ class CSVInterface(tk.Frame):
         self.once_or: bool = False
         self.can_export_multiplot: bool = False
         self.units_list: dict = {}
+        self.dataset_labels: dict = {}
+        self.ingest = None
+        self.watch = None
+        self.statistics_frame = None
+        self.statistics_interface = None
+        self.abscissa_listed: dict = {}
+        self.ordinate_listed: dict = {}
+        self.stale_menus: set = set()
+        dataset_store.subscribe(self.columns_changed)
         self.create_button('Choose CSV File', self.open_file, 3, 0, 5, 10)
         self.create_button('Parse Cycles (Displacement Controlled)', self.parse_displacement_controlled, 3, 5, 12, 30)
         self.create_button('Parse Cycles (Load Controlled)', self.parse_load_controlled, 3, 17, 9, 27)
@@ -59,6 +1728,20 @@ class CSVInterface(tk.Frame):
         self.create_button('Export SVG File', self.save_svg, 10, 11, 6, 14)
         self.create_button('Statistics Panel', self.statistics_window, 10, 17, 6, 15)
         self.create_button('Weibull Distribution', self.weibull_window, 10, 23, 8, 20)
+        self.create_button('Export Timing (JSON)', self.export_timing_json, 4, 23, 8, 20)
+        self.create_button('Export Timing (Chrome Trace)', self.export_timing_trace, 4, 31, 10, 26)
+        self.create_button('Responsiveness Log', self.responsiveness_window, 3, 26, 8, 20)
+        self.create_button('Save Session', self.save_session, 4, 41, 6, 14)
+        self.create_button('Load Session', self.load_session, 4, 47, 6, 14)
+        self.create_button('Result Cache', self.cache_window, 3, 34, 7, 14)
+        self.create_button('Choose CSV Folder', self.open_folder, 3, 41, 7, 16)
+        self.create_button('Strain Range Sweep (All)', self.strain_sweep_all, 10, 31, 9, 22)
+        self.create_button('Drift Correction (All)', self.drift_all, 10, 40, 8, 20)
+        self.create_button('Contact Point (All)', self.contact_all, 10, 48, 7, 18)
+        self.create_button('Watch Folder', self.watch_window, 10, 55, 6, 14)
+        self.input_precision()
+        self.ingest_label = tk.Label(self.parent, text='')
+        self.ingest_label.grid(row=3, column=48, columnspan=12, sticky=tk.W)
         self.multiplot_info()
         self.program_info()
         self.input_domain()
@@ -97,13 +1780,14 @@ class CSVInterface(tk.Frame):
         :param data: csv data file user selects from desktop
         :return: data converted to float64 values where each column has its 0th row index removed
         """
-        data = data.loc[data.index > 0]
-        data = data.reset_index(drop=True)
-        for col_name in data.columns:
-            try:
-                data[col_name] = data[col_name].astype('float64')
-            except ValueError:
-                data[col_name] = None
+        with profiler.span('reindex', None, len(data)):
+            data = data.loc[data.index > 0]
+            data = data.reset_index(drop=True)
+            for col_name in data.columns:
+                try:
+                    data[col_name] = data[col_name].astype('float64')
+                except ValueError:
+                    data[col_name] = None
         return data
 
     def re_zero(self, data: {}):
@@ -113,14 +1797,50 @@ class CSVInterface(tk.Frame):
         :param data: csv data file user selects from desktop
         :return: data shifted to a new zero value
         """
-        for i in data.columns:
-            column_edge = data[i].min()
-            if column_edge >= 0:
-                data[i] = data[i] - column_edge
-            elif column_edge < 0:
-                data[i] = data[i] + abs(column_edge)
+        with profiler.span('re_zero', None, len(data)):
+            for i in data.columns:
+                column_edge = data[i].min()
+                if column_edge >= 0:
+                    data[i] = data[i] - column_edge
+                elif column_edge < 0:
+                    data[i] = data[i] + abs(column_edge)
         return data
 
+    def input_precision(self):
+        """
+        function creates the 'Float32 Storage' check box; checked, the cleaned datasets & their calculated columns are
+        kept as float32 wherever that loses no precision that matters (calculations still run in float64)
+        :return: check box & stored data label
+        """
+        def determine_precision():
+            if self.precision_select.get() == 1:
+                dataset_store.set_precision('float32')
+                for n in dataset_store.registered():
+                    if n in data_frames:
+                        data_frames[n] = dataset_store.compact(n, data_frames[n])
+            else:
+                dataset_store.set_precision('float64')
+            self.display_memory()
+
+        self.precision_select = tk.IntVar()
+        checkbox_precision = tk.Checkbutton(self.parent, text='Float32 Storage', variable=self.precision_select,
+                                            onvalue=1, offvalue=0, command=determine_precision)
+        checkbox_precision.grid(row=4, column=53, columnspan=7, sticky=tk.W)
+        self.memory_label = tk.Label(self.parent, text='')
+        self.memory_label.grid(row=4, column=60, columnspan=12, sticky=tk.W)
+
+    def display_memory(self):
+        """
+        function displays the memory held by the cleaned datasets & their calculated columns
+        :return: stored data label
+        """
+        total = 0
+        for (n, frame) in dataset_store.registered().items():
+            total += dataset_store.nbytes(frame)
+            if n in data_frames and data_frames[n] is not frame:
+                total += dataset_store.nbytes(data_frames[n])
+        self.memory_label.config(text='Stored data: ' + str(float("{:.1f}".format(total / 1048576))) + ' MB')
+
     def create_button(self, title, call, r, c, cs, w):
         """
         function creates buttons w/ commands for the GUI
@@ -178,36 +1898,42 @@ class CSVInterface(tk.Frame):
 
     def refresh_both(self):
         """
-        function updates all abscissa & ordinate column selection availability to newest calculations
+        function updates the abscissa & ordinate column selection of every dataset whose columns changed since its
+        menus were last updated (new calculations, removed conditioning) & displays the stored data size
         :return: column selection with updated options
         """
-        for i in range(0, index):
-            self.abscissa_buttons[i].set('Select Abscissa')
-            self.abscissa_drops[i]['menu'].delete(0, 'end')
-            df = data_frames[i]
-            column_names = []
-            for col_name in df.columns:
-                column_names.append(col_name)
-            for j in column_names[:]:
-                try:
-                    u = csv_identities[i].units_list[j]
-                except AttributeError:
-                    u = self.units_list[j]
-                self.abscissa_drops[i]['menu'].add_command(label=j + ' (' + u + ')', command=tk._setit(self.abscissa_buttons[i], j, partial(self.select_adata, i)))
-
-        for w in range(0, index):
-            self.ordinate_buttons[w].set('Select Ordinate')
-            self.ordinate_drops[w]['menu'].delete(0, 'end')
-            df = data_frames[w]
-            column_names = []
-            for col_name in df.columns:
-                column_names.append(col_name)
-            for x in column_names[:]:
-                try:
-                    du = csv_identities[w].units_list[x]
-                except AttributeError:
-                    du = self.units_list[x]
-                self.ordinate_drops[w]['menu'].add_command(label=x + ' (' + du + ')', command=tk._setit(self.ordinate_buttons[w], x, partial(self.select_odata, w)))
+        self.update_menus()
+        self.display_memory()
+
+    def columns_changed(self, n):
+        """
+        function notes that the published columns of the nth dataset changed (dataset_store notification); its menus are
+        updated at once when the change comes from the main thread, otherwise on the next refresh or watch poll
+        :param n: nth CSV file
+        :return: updated menus or dataset marked for updating
+        """
+        self.stale_menus.add(n)
+        if threading.current_thread() is threading.main_thread():
+            self.update_menus()
+
+    def update_menus(self):
+        """
+        function updates the 'Select Abscissa' & 'Select Ordinate' menus of the datasets marked by columns_changed;
+        only the entries of added, removed or relabeled columns are touched & no data is read or recalculated
+        :return: menus w/ the published columns
+        """
+        while len(self.stale_menus) > 0:
+            n = self.stale_menus.pop()
+            columns = dataset_store.listed_columns(n)
+            if n not in self.abscissa_drops or self.abscissa_drops[n].winfo_exists() == 0:
+                continue
+            with profiler.span('update_menus', n, len(columns)):
+                self.abscissa_listed[n] = update_option_menu(self.abscissa_drops[n]['menu'], self.abscissa_buttons[n],
+                                                             self.abscissa_listed.get(n), columns,
+                                                             partial(self.select_adata, n), 'Select Abscissa')
+                self.ordinate_listed[n] = update_option_menu(self.ordinate_drops[n]['menu'], self.ordinate_buttons[n],
+                                                             self.ordinate_listed.get(n), columns,
+                                                             partial(self.select_odata, n), 'Select Ordinate')
 
     def calc_window(self, n):
         """
@@ -220,11 +1946,281 @@ class CSVInterface(tk.Frame):
         csv_pop_up.geometry('1120x750') # -temp- 1120x750
         frame = ScrollableFrame(csv_pop_up, 1100, 710) # -temp- 1100, 710
         frame.grid(row=0)
+        previous = csv_identities[n]
         csv_identities[n] = GraphSoftware(frame.scrollable_frame, n)
+        if isinstance(previous, GraphSoftware):
+            csv_identities[n].restore_state(*previous.snapshot_state())
         csv_identities[n].grid(row=0)
         remove_button = tk.Button(csv_pop_up, text='Dismiss', command=csv_pop_up.destroy)
         remove_button.grid(row=46)
 
+    def strain_sweep_all(self):
+        """
+        function runs the strain range sweep of every Data Calculations sheet w/ a stress-strain curve & creates a
+        table of each CSV file's most stable strain window (modulus in GPa)
+        :return: Strain Range Sweep table or pop-up
+        """
+        rows = []
+        for (n, software) in enumerate(csv_identities):
+            if isinstance(software, GraphSoftware) is False or csv_list.get(n) == 'parse':
+                continue
+            if software.compute_stress is False or software.compute_strain is False or software.type_exists is False:
+                continue
+            best = software.stable_window(*software.strain_sweep())
+            if best is not None:
+                rows.append([n + 1, best[0], best[1], best[2] * software.pascal_divisor(software.stress_pascal_unit) / 1e9,
+                             best[3]])
+        if len(rows) == 0:
+            self.create_pop_up('Calculate stress & strain (w/ a stress-strain type) in the Data Calculations sheet of at least one CSV file first.')
+            return
+        table_pop_up = tk.Toplevel()
+        table_pop_up.title('Strain Range Sweep')
+        table = TableInterface(table_pop_up, 'Strain range sweep', ('CSV File', 'Strain Start', 'Strain End',
+                                                                    "Young's Modulus", 'R^2'), rows,
+                               {"Young's Modulus": 'GPa'})
+        table.grid()
+
+    def drift_all(self):
+        """
+        function fits the thermal drift of every hold of every Data Calculations sheet w/ load & displacement columns
+        (each sheet's time column, hold tolerance & minimum hold rows), turns the drift correction on where holds are
+        found (& checks the box of sheets w/ widgets) & creates a table of each CSV file's holds & drift
+        :return: Drift Correction table or pop-up
+        """
+        rows = []
+        for (n, software) in enumerate(csv_identities):
+            if isinstance(software, GraphSoftware) is False or csv_list.get(n) == 'parse':
+                continue
+            if software.l is False or software.d is False:
+                continue
+            correction = software.drift_correction()
+            if len(correction.rates) == 0:
+                rows.append([n + 1, 0, np.nan, np.nan, np.nan])
+                continue
+            software.correct_drift = True
+            if software.is_headless() is False:
+                software.drift_select.set(1)
+                software.display_drift()
+            rows.append([n + 1, len(correction.rates), float(np.mean(correction.rates)), float(np.max(np.abs(correction.rates))),
+                         float(correction.drift[-1])])
+        if len(rows) == 0:
+            self.create_pop_up('Select the load & displacement columns in the Data Calculations sheet of at least one CSV file first.')
+            return
+        table_pop_up = tk.Toplevel()
+        table_pop_up.title('Thermal Drift Correction')
+        table = TableInterface(table_pop_up, 'Thermal drift correction', ('CSV File', 'Holds', 'Mean Drift Rate',
+                                                                          'Max |Drift Rate|', 'Total Drift'), rows, {})
+        table.grid()
+
+    def contact_all(self):
+        """
+        function detects the contact point of every Data Calculations sheet w/ load & displacement columns (each
+        sheet's detection method), turns contact zeroing on (& checks the box of sheets w/ widgets) & creates a table of
+        each CSV file's contact point
+        :return: Contact Point table or pop-up
+        """
+        rows = []
+        for (n, software) in enumerate(csv_identities):
+            if isinstance(software, GraphSoftware) is False or csv_list.get(n) == 'parse':
+                continue
+            if software.l is False or software.d is False:
+                continue
+            row = software.contact_detection().row
+            frame = dataset_store.stored(n)
+            offsets = dataset_store.stored_offsets(n)
+            software.zero_at_contact = True
+            if software.is_headless() is False:
+                software.contact_select.set(1)
+                software.display_contact()
+            rows.append([n + 1, row, float(frame[software.load_column].iloc[row]) + offsets.get(software.load_column, 0.0),
+                         float(frame[software.displacement_column].iloc[row]) + offsets.get(software.displacement_column, 0.0)])
+        if len(rows) == 0:
+            self.create_pop_up('Select the load & displacement columns in the Data Calculations sheet of at least one CSV file first.')
+            return
+        table_pop_up = tk.Toplevel()
+        table_pop_up.title('Contact Point')
+        table = TableInterface(table_pop_up, 'Contact point', ('CSV File', 'Contact Row', 'Contact Load',
+                                                               'Contact Displacement'), rows, {})
+        table.grid()
+
+    def watch_window(self):
+        """
+        function creates the Watched Folder sheet: every CSV file the instrument drops into the chosen folder is
+        loaded as the next CSV file & calculated w/ the parameters of a template Data Calculations sheet; results are
+        added to the campaign table & the Statistics panel as files finish
+        :return: Watched Folder sheet or pop-up
+        """
+        if self.watch is not None:
+            self.watch['window'].lift()
+            return
+        templates = {self.dataset_labels.get(n, 'CSV File' + str(n + 1)): n for (n, software) in enumerate(csv_identities)
+                     if isinstance(software, GraphSoftware)}
+        if len(templates) == 0:
+            self.create_pop_up('Set up the Data Calculations sheet of one CSV file first; its parameters are applied to every new file of the watched folder.')
+            return
+        folder = askdirectory()
+        if folder == '' or folder == ():
+            return
+        watch_pop_up = tk.Toplevel()
+        watch_pop_up.title('Watched Folder')
+        tk.Label(watch_pop_up, text='Watching ' + folder).grid(row=0, column=0, columnspan=4, sticky=tk.W)
+        tk.Label(watch_pop_up, text='Calculation template:').grid(row=1, column=0, sticky=tk.E)
+        clicked_template = tk.StringVar(watch_pop_up)
+        clicked_template.set(list(templates)[0])
+        tk.OptionMenu(watch_pop_up, clicked_template, *templates).grid(row=1, column=1, sticky=tk.W)
+        status = tk.Label(watch_pop_up, text='')
+        status.grid(row=2, column=0, columnspan=4, sticky=tk.W)
+        log = tk.Listbox(watch_pop_up, width=100, height=6)
+        log.grid(row=3, column=0, columnspan=4, sticky=tk.EW)
+        table_frame = tk.Frame(watch_pop_up)
+        table_frame.grid(row=4, column=0, columnspan=4, sticky=tk.NSEW)
+        table = TableInterface(table_frame, 'Campaign', self.campaign_columns, [], {})
+        table.grid()
+        self.watch = {'window': watch_pop_up, 'folder': folder, 'watcher': None, 'executor': None, 'template': None,
+                      'reading': {}, 'calculating': {}, 'processed': 0, 'skipped': 0, 'job': None, 'status': status,
+                      'log': log, 'table': table}
+
+        def start():
+            if self.watch['watcher'] is not None:
+                return
+            template = csv_identities[templates[clicked_template.get()]]
+            self.watch['template'] = template.template_state()
+            self.watch['watcher'] = FolderWatcher(folder, self.watch_ledger)
+            self.watch['executor'] = ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, 4))
+            self.poll_watch()
+
+        def close():
+            self.stop_watch()
+            watch_pop_up.destroy()
+            self.watch = None
+
+        tk.Button(watch_pop_up, text='Start Watching', command=start).grid(row=1, column=2, sticky=tk.EW)
+        tk.Button(watch_pop_up, text='Stop Watching', command=self.stop_watch).grid(row=1, column=3, sticky=tk.EW)
+        watch_pop_up.protocol('WM_DELETE_WINDOW', close)
+
+    def stop_watch(self):
+        """
+        function stops polling the watched folder; files still being read or calculated are dropped (their CSV files
+        stay loaded w/o results)
+        :return: watching stopped
+        """
+        watch = self.watch
+        if watch is None or watch['watcher'] is None:
+            return
+        if watch['job'] is not None:
+            self.parent.after_cancel(watch['job'])
+            watch['job'] = None
+        watch['executor'].shutdown(wait=False, cancel_futures=True)
+        watch['watcher'] = None
+        watch['reading'].clear()
+        watch['calculating'].clear()
+        watch['status'].config(text='Stopped; ' + str(watch['processed']) + ' files processed, ' + str(watch['skipped']) + ' skipped')
+
+    @staticmethod
+    def read_watched_file(watcher: FolderWatcher, path: str):
+        """
+        function reads a watched file once (runs on a watch worker thread), fingerprints its content & parses it unless
+        a file w/ the same content was already processed
+        :param watcher: folder watcher w/ the ledger
+        :param path: CSV file path
+        :return: fingerprint & raw DataFrame w/ its unit row (None if already processed)
+        """
+        with profiler.span('watch_read', None, path=path):
+            with open(path, 'rb') as f:
+                content = f.read()
+            fingerprint = hashlib.sha256(content).hexdigest()
+            if watcher.processed(fingerprint) is True:
+                return fingerprint, None
+            data = pd.read_csv(io.BytesIO(content))
+        if len(data) == 0:
+            raise ValueError('no unit row or data')
+        return fingerprint, data
+
+    @staticmethod
+    def process_watched_file(n, template: dict):
+        """
+        function calculates the nth CSV file w/ the template's parameters in a headless Data Calculations sheet (runs
+        on a watch worker thread)
+        :param n: nth CSV file
+        :param template: parameters & calculation toggles of the template sheet
+        :return: headless Data Calculations sheet w/ results
+        """
+        software = GraphSoftware.headless(n)
+        software.unit_storage(data_frames[n])
+        software.restore_state(template, {})
+        with profiler.span('watch_calculate', n):
+            software.load_data()
+        return software
+
+    def poll_watch(self):
+        """
+        function hands the files that stopped changing to the watch workers, loads every file read (unless it was
+        already processed) as the next CSV file & queues its calculation, adds every finished calculation to the
+        campaign table, the ledger & the Statistics panel, then re-schedules itself (also after an error, which is logged
+        for its file)
+        :return: updated Watched Folder sheet
+        """
+        watch = self.watch
+        watch['job'] = None
+        try:
+            try:
+                for path in watch['watcher'].scan():
+                    watch['reading'][path] = watch['executor'].submit(self.read_watched_file, watch['watcher'], path)
+            except OSError as error:
+                watch['log'].insert(tk.END, 'Cannot list ' + watch['folder'] + ': ' + str(error))
+            for path in [path for path in watch['reading'] if watch['reading'][path].done()]:
+                future = watch['reading'].pop(path)
+                try:
+                    (fingerprint, data) = future.result()
+                except Exception as error:
+                    watch['log'].insert(tk.END, os.path.basename(path) + ': not read (' + type(error).__name__ + ': ' + str(error) + ')')
+                    continue
+                if data is None:
+                    watch['skipped'] += 1
+                    watch['log'].insert(tk.END, os.path.basename(path) + ': already processed, skipped')
+                    continue
+                if index >= len(alphabet):
+                    watch['log'].insert(tk.END, os.path.basename(path) + ': not loaded, all ' + str(len(alphabet)) + ' CSV files are in use')
+                    continue
+                self.register_file(path, data)
+                future = watch['executor'].submit(self.process_watched_file, index - 1, watch['template'])
+                watch['calculating'][index - 1] = (future, path, fingerprint)
+            for n in [n for n in watch['calculating'] if watch['calculating'][n][0].done()]:
+                (future, path, fingerprint) = watch['calculating'].pop(n)
+                try:
+                    software = future.result()
+                except Exception as error:
+                    watch['log'].insert(tk.END, os.path.basename(path) + ': calculation failed (' + type(error).__name__ + ': ' + str(error) + ')')
+                    continue
+                csv_identities[n] = software
+                watch['table'].append_rows([[n + 1] + [getattr(software, name) for name in self.campaign_attributes]])
+                try:
+                    watch['watcher'].record(fingerprint, path, n + 1)
+                except OSError as error:
+                    watch['log'].insert(tk.END, os.path.basename(path) + ': ledger not written (' + str(error) + ')')
+                watch['processed'] += 1
+                watch['log'].insert(tk.END, os.path.basename(path) + ': processed as ' + self.dataset_labels[n])
+                self.refresh_statistics()
+            self.update_menus()
+            for software in csv_identities:
+                if isinstance(software, GraphSoftware):
+                    software.update_menus()
+            watch['log'].see(tk.END)
+            watch['status'].config(text=str(len(watch['reading'])) + ' reading, ' + str(len(watch['calculating'])) +
+                                   ' calculating, ' + str(watch['processed']) + ' processed, ' + str(watch['skipped']) +
+                                   ' skipped')
+        finally:
+            watch['job'] = self.parent.after(self.watch_interval, self.poll_watch)
+
+    def refresh_statistics(self):
+        """
+        function refreshes the open Statistics panel in place so it includes newly calculated CSV files
+        :return: updated Statistics panel (nothing if it is not open)
+        """
+        if self.statistics_frame is None or self.statistics_frame.winfo_exists() == 0:
+            return
+        self.statistics_interface.refresh()
+
     def statistics_window(self):
         """
         function creates a new Statistics panel sheet that analyzes output values of all CSV files that have been
@@ -236,8 +2232,9 @@ class CSVInterface(tk.Frame):
         statistics_pop_up.geometry('1195x990') # -temp- 995x790
         frame = ScrollableFrame(statistics_pop_up, 1175, 950) # -temp- 975, 750
         frame.grid()
-        statistics_interface = StatisticsInterface(frame.scrollable_frame)
-        statistics_interface.grid()
+        self.statistics_frame = frame
+        self.statistics_interface = StatisticsInterface(frame.scrollable_frame, frame)
+        self.statistics_interface.grid()
 
     def weibull_window(self):
         """
@@ -268,6 +2265,21 @@ class CSVInterface(tk.Frame):
         else:
             self.create_pop_up('Add CSV files first.')
 
+    @staticmethod
+    def cycle_labels(col, controlled: bool):
+        """
+        function labels every row of a reindexed cycle column w/ the number of the cycle it belongs to; controlled
+        cycles have the same known peak every time so each cycle spans (2 * peak - 1) rows, arbitrary cycles are
+        split at every valley of the column (see SegmentIndex)
+        :param col: reindexed displacement or load column
+        :param controlled: True for displacement/load controlled cycles, False for arbitrary peaks
+        :return: cycle number of each row
+        """
+        if controlled is True:
+            nrows = int(col.max() * 2) - 1
+            return col.index // nrows
+        return pd.Series(SegmentIndex(col.to_numpy(dtype='float64')).cycle, index=col.index)
+
     def parse_displacement_cycles(self, r):
         """
         function parses the CSV file's DataFrame into multiple DataFrames that are separated based off displacement
@@ -282,11 +2294,11 @@ class CSVInterface(tk.Frame):
             if 'Displacement' in i:
                 displacement_column = i
                 break
-        self.unit_storage(data_frames[r])
-        temp_df = self.reindex(data_frames[r])
-        val = int(temp_df[displacement_column].max() * 2)
-        nrows = val - 1
-        groups = temp_df.groupby(temp_df.index // nrows)
+        with profiler.span('parse_displacement_cycles', r, len(data_frames[r])):
+            self.unit_storage(data_frames[r])
+            temp_df = self.reindex(data_frames[r])
+            val = int(temp_df[displacement_column].max() * 2)
+            groups = temp_df.groupby(self.cycle_labels(temp_df[displacement_column], True))
         self.csv_calculation[r].destroy()
         self.abscissa_drops[r].destroy()
         self.ordinate_drops[r].destroy()
@@ -294,9 +2306,11 @@ class CSVInterface(tk.Frame):
         self.a_completed[r] = True
         self.o_completed[r] = True
         del data_frames[r]
+        dataset_store.remove(r)
         gc.collect()
         for (frameno, frame) in groups:
             csv_list[index] = 'parse'
+            self.dataset_labels[index] = 'CSV File ' + str(temp) + alphabet[frameno]
             csv_calculation = tk.Button(self.parent, text='CSV File ' + str(temp) + alphabet[frameno], width=10, command=partial(self.calc_window, index))
             csv_calculation.grid(row=2, column=(index * 4), columnspan=4, sticky=tk.EW)
             csv_identities.append(alphabet[index])
@@ -367,11 +2381,11 @@ class CSVInterface(tk.Frame):
             if 'Load' in i:
                 load_column = i
                 break
-        self.unit_storage(data_frames[r])
-        temp_df = self.reindex(data_frames[r])
-        val = int(temp_df[load_column].max() * 2)
-        nrows = val - 1
-        groups = temp_df.groupby(temp_df.index // nrows)
+        with profiler.span('parse_load_cycles', r, len(data_frames[r])):
+            self.unit_storage(data_frames[r])
+            temp_df = self.reindex(data_frames[r])
+            val = int(temp_df[load_column].max() * 2)
+            groups = temp_df.groupby(self.cycle_labels(temp_df[load_column], True))
         self.csv_calculation[r].destroy()
         self.abscissa_drops[r].destroy()
         self.ordinate_drops[r].destroy()
@@ -379,9 +2393,11 @@ class CSVInterface(tk.Frame):
         self.a_completed[r] = True
         self.o_completed[r] = True
         del data_frames[r]
+        dataset_store.remove(r)
         gc.collect()
         for (frameno, frame) in groups:
             csv_list[index] = 'parse'
+            self.dataset_labels[index] = 'CSV File ' + str(temp) + alphabet[frameno]
             csv_calculation = tk.Button(self.parent, text='CSV File ' + str(temp) + alphabet[frameno], width=10, command=partial(self.calc_window, index))
             csv_calculation.grid(row=2, column=(index * 4), columnspan=4, sticky=tk.EW)
             csv_identities.append(alphabet[index])
@@ -452,13 +2468,11 @@ class CSVInterface(tk.Frame):
             if 'Displacement' in i:
                 displacement_column = i
                 break
-        self.unit_storage(data_frames[r])
-        temp_df = self.reindex(data_frames[r])
+        with profiler.span('parse_arbitrary_displacement_cycles', r, len(data_frames[r])):
+            self.unit_storage(data_frames[r])
+            temp_df = self.reindex(data_frames[r])
 
-        col = temp_df[displacement_column]
-        minima = (col <= col.shift()) & (col < col.shift(-1))
-        g = minima.cumsum()
-        groups = temp_df.groupby(g)
+            groups = temp_df.groupby(self.cycle_labels(temp_df[displacement_column], False))
 
         self.csv_calculation[r].destroy()
         self.abscissa_drops[r].destroy()
@@ -467,9 +2481,11 @@ class CSVInterface(tk.Frame):
         self.a_completed[r] = True
         self.o_completed[r] = True
         del data_frames[r]
+        dataset_store.remove(r)
         gc.collect()
         for (frameno, frame) in groups:
             csv_list[index] = 'parse'
+            self.dataset_labels[index] = 'CSV File ' + str(temp) + alphabet[frameno]
             csv_calculation = tk.Button(self.parent, text='CSV File ' + str(temp) + alphabet[frameno], width=10,
                                         command=partial(self.calc_window, index))
             csv_calculation.grid(row=2, column=(index * 4), columnspan=4, sticky=tk.EW)
@@ -541,13 +2557,11 @@ class CSVInterface(tk.Frame):
             if 'Load' in i:
                 load_column = i
                 break
-        self.unit_storage(data_frames[r])
-        temp_df = self.reindex(data_frames[r])
+        with profiler.span('parse_arbitrary_load_cycles', r, len(data_frames[r])):
+            self.unit_storage(data_frames[r])
+            temp_df = self.reindex(data_frames[r])
 
-        col = temp_df[load_column]
-        minima = (col <= col.shift()) & (col < col.shift(-1))
-        g = minima.cumsum()
-        groups = temp_df.groupby(g)
+            groups = temp_df.groupby(self.cycle_labels(temp_df[load_column], False))
 
         self.csv_calculation[r].destroy()
         self.abscissa_drops[r].destroy()
@@ -556,9 +2570,11 @@ class CSVInterface(tk.Frame):
         self.a_completed[r] = True
         self.o_completed[r] = True
         del data_frames[r]
+        dataset_store.remove(r)
         gc.collect()
         for (frameno, frame) in groups:
             csv_list[index] = 'parse'
+            self.dataset_labels[index] = 'CSV File ' + str(temp) + alphabet[frameno]
             csv_calculation = tk.Button(self.parent, text='CSV File ' + str(temp) + alphabet[frameno], width=10,
                                         command=partial(self.calc_window, index))
             csv_calculation.grid(row=2, column=(index * 4), columnspan=4, sticky=tk.EW)
@@ -603,50 +2619,232 @@ class CSVInterface(tk.Frame):
 
     def open_file(self):
         """
-        function allows user to upload new CSV files, and stores the data form the CSV files into DataFrames that are
-        organized in dictionaries as well as the units
+        function allows user to upload one or more new CSV files at once (multi-select) and stores the data from the
+        CSV files into DataFrames that are organized in dictionaries as well as the units
+        :return: new CSV files added to the CSV interface and stored in the dictionary
+        """
+        paths = askopenfilenames(filetypes=[('CSV files', '*.csv'), ('All files', '*.*')])
+        if len(paths) == 0:
+            return
+        self.ingest_files(list(paths))
+
+    def open_folder(self):
+        """
+        function allows user to upload every CSV file of a folder (in file name order)
+        :return: new CSV files added to the CSV interface or pop-up
+        """
+        folder = askdirectory()
+        if folder == '' or folder == ():
+            return
+        paths = sorted(os.path.join(folder, name) for name in os.listdir(folder) if name.lower().endswith('.csv'))
+        if len(paths) == 0:
+            self.create_pop_up('No CSV files in ' + folder)
+            return
+        self.ingest_files(paths)
+
+    @staticmethod
+    def read_csv_file(path: str):
+        """
+        function reads a CSV file (runs on an ingest worker thread; pandas' C parser releases the GIL for most of the
+        work so several files are parsed at once)
+        :param path: CSV file path
+        :return: raw DataFrame w/ its unit row
+        """
+        with profiler.span('ingest', None, path=path):
+            data = pd.read_csv(path)
+        if len(data) == 0:
+            raise ValueError('no unit row or data')
+        return data
+
+    def ingest_files(self, paths: list):
+        """
+        function reads the CSV files concurrently on a thread pool; files are registered in the order they were
+        selected as they complete, w/ progress shown next to the 'Choose CSV Folder' button
+        :param paths: CSV file paths
+        :return: ingest started or pop-up
+        """
+        if self.ingest is not None:
+            self.create_pop_up('CSV files are still loading.')
+            return
+        free = len(alphabet) - index
+        if len(paths) > free:
+            self.create_pop_up('Only ' + str(free) + ' more CSV files can be added; the first ' + str(free) + ' selected files are loaded.')
+            paths = paths[:free]
+        if len(paths) == 0:
+            return
+        executor = ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1, 8))
+        self.ingest = {'paths': paths, 'futures': [executor.submit(self.read_csv_file, path) for path in paths],
+                       'next': 0, 'errors': [], 'executor': executor, 'start': time.perf_counter()}
+        self.poll_ingest()
+
+    def poll_ingest(self):
+        """
+        function registers every finished file that is next in line (keeps the selection order deterministic),
+        updates the progress label & re-schedules itself until all files are done; failed files are reported together
+        :return: registered CSV files, progress & error pop-up
+        """
+        ingest = self.ingest
+        futures = ingest['futures']
+        while ingest['next'] < len(futures) and futures[ingest['next']].done():
+            path = ingest['paths'][ingest['next']]
+            try:
+                data = futures[ingest['next']].result()
+            except (OSError, ValueError) as error:
+                ingest['errors'].append(os.path.basename(path) + ': ' + str(error))
+            else:
+                self.register_file(path, data)
+            ingest['next'] += 1
+        done = sum(1 for future in futures if future.done())
+        if ingest['next'] < len(futures):
+            self.ingest_label.config(text='Loading ' + str(done) + '/' + str(len(futures)) + ' files...')
+            self.parent.after(50, self.poll_ingest)
+            return
+        ingest['executor'].shutdown(wait=False)
+        self.ingest = None
+        loaded = len(futures) - len(ingest['errors'])
+        self.ingest_label.config(text='Loaded ' + str(loaded) + '/' + str(len(futures)) + ' files in ' + str(float("{:.2f}".format(time.perf_counter() - ingest['start']))) + ' s')
+        if len(ingest['errors']) > 0:
+            self.create_pop_up('Could not load:\n' + '\n'.join(ingest['errors']))
+
+    def register_file(self, path: str, data: {}):
+        """
+        function stores a read CSV file as the next dataset and adds its widgets to the CSV interface
+        :param path: CSV file path
+        :param data: raw DataFrame w/ its unit row
         :return: new CSV file added to the CSV interface and stored in the dictionary
         """
         global has_csv_path
-        global csv_list
-        global data_frames
-        global csv_identities
         global index
-        csv_list[index] = askopenfilename()
-        if csv_list[index] == '':
-            return
+        csv_list[index] = path
+        data_frames[index] = data
+        csv_identities.append(alphabet[index])
+        print(data_frames[index])
+        self.unit_storage(data_frames[index])
         index += 1
         has_csv_path = True
-        if has_csv_path is True:
-            self.csv_calculation[index-1] = tk.Button(self.parent, text='CSV File' + str(index), width=10, command=partial(self.calc_window, index-1))
-            self.csv_calculation[index-1].grid(row=2, column=(index-1) * 4, columnspan=4, sticky=tk.EW)
-            csv_identities.append(alphabet[index-1])
-            data_frames[index-1] = pd.read_csv(csv_list[index-1])
-            print(data_frames[index-1])
-            self.unit_storage(data_frames[index-1])
+        self.add_dataset_widgets(index-1, 'CSV File' + str(index), self.units_list)
 
-            self.csv_label[index-1] = tk.Label(self.parent, text='CSV File' + str(index), width=25)
-            self.csv_label[index-1].grid(row=7, column=(index-1) * 10, columnspan=10, sticky=tk.EW)
+    def add_dataset_widgets(self, n, text, units: dict):
+        """
+        function adds the Data Calculations button, label, 'Select Abscissa' & 'Select Ordinate' menus of the nth
+        CSV file to the CSV interface
+        :param n: nth CSV file
+        :param text: button & label text
+        :param units: column name -> unit
+        :return: CSV file widgets added to the CSV interface
+        """
+        self.dataset_labels[n] = text
+        self.csv_calculation[n] = tk.Button(self.parent, text=text, width=10, command=partial(self.calc_window, n))
+        self.csv_calculation[n].grid(row=2, column=n * 4, columnspan=4, sticky=tk.EW)
+        self.csv_label[n] = tk.Label(self.parent, text=text, width=25)
+        self.csv_label[n].grid(row=7, column=n * 10, columnspan=10, sticky=tk.EW)
 
-            column_names = []
-            for col_name in data_frames[index-1].columns:
-                column_names.append(col_name)
+        column_names = []
+        for col_name in data_frames[n].columns:
+            column_names.append(col_name)
 
-            self.a_completed[index-1] = False
-            self.abscissa_buttons[index-1] = tk.StringVar(self.parent)
-            self.abscissa_buttons[index-1].set('Select Abscissa')
-            self.abscissa_drops[index-1] = tk.OptionMenu(self.parent, self.abscissa_buttons[index-1], 'Select Abscissa', command=lambda *args: None)
-            for i in column_names[:]:
-                self.abscissa_drops[index-1]['menu'].add_command(label=i + ' (' + self.units_list[i] + ')', command=tk._setit(self.abscissa_buttons[index-1], i, partial(self.select_adata, index-1)))
-            self.abscissa_drops[index-1].grid(row=8, column=(index-1) * 10, columnspan=10, sticky=tk.EW)
+        self.a_completed[n] = False
+        self.abscissa_buttons[n] = tk.StringVar(self.parent)
+        self.abscissa_buttons[n].set('Select Abscissa')
+        self.abscissa_drops[n] = tk.OptionMenu(self.parent, self.abscissa_buttons[n], 'Select Abscissa', command=lambda *args: None)
+        for i in column_names[:]:
+            self.abscissa_drops[n]['menu'].add_command(label=i + ' (' + units[i] + ')', command=tk._setit(self.abscissa_buttons[n], i, partial(self.select_adata, n)))
+        self.abscissa_drops[n].grid(row=8, column=n * 10, columnspan=10, sticky=tk.EW)
 
-            self.o_completed[index-1] = False
-            self.ordinate_buttons[index-1] = tk.StringVar(self.parent)
-            self.ordinate_buttons[index-1].set('Select Ordinate')
-            self.ordinate_drops[index-1] = tk.OptionMenu(self.parent, self.ordinate_buttons[index-1], 'Select Ordinate', command=lambda *args: None)
-            for i in column_names[:]:
-                self.ordinate_drops[index-1]['menu'].add_command(label=i + ' (' + self.units_list[i] + ')', command=tk._setit(self.ordinate_buttons[index-1], i, partial(self.select_odata, index-1)))
-            self.ordinate_drops[index-1].grid(row=9, column=(index - 1) * 10, columnspan=10, sticky=tk.EW)
+        self.o_completed[n] = False
+        self.ordinate_buttons[n] = tk.StringVar(self.parent)
+        self.ordinate_buttons[n].set('Select Ordinate')
+        self.ordinate_drops[n] = tk.OptionMenu(self.parent, self.ordinate_buttons[n], 'Select Ordinate', command=lambda *args: None)
+        for i in column_names[:]:
+            self.ordinate_drops[n]['menu'].add_command(label=i + ' (' + units[i] + ')', command=tk._setit(self.ordinate_buttons[n], i, partial(self.select_odata, n)))
+        self.ordinate_drops[n].grid(row=9, column=n * 10, columnspan=10, sticky=tk.EW)
+        self.abscissa_listed[n] = {i: str(units[i]) for i in column_names}
+        self.ordinate_listed[n] = dict(self.abscissa_listed[n])
+
+    def save_session(self):
+        """
+        function saves every dataset (cleaned & calculated columns, units, label, source) and the parameters &
+        results of every Data Calculations sheet into a single binary session file
+        :return: session file or pop-up
+        """
+        if has_csv_path is False:
+            self.create_pop_up('Add CSV files first.')
+            return
+        path = asksaveasfilename(defaultextension='.dvac', filetypes=[('DVaCGUI session', '*.dvac')])
+        if path == '':
+            return
+        datasets = []
+        arrays = {}
+        with profiler.span('save_session', None, len(data_frames)):
+            for n in sorted(data_frames):
+                if dataset_store.has(n) is True:
+                    frame = data_frames[n]
+                    units = dataset_store.stored_units(n)
+                    base_columns = dataset_store.stored_base_columns(n)
+                    offsets = dataset_store.stored_offsets(n)
+                else:
+                    frame = self.reindex(data_frames[n])
+                    offsets = dataset_store.zero_offsets(frame)
+                    frame = self.re_zero(frame)
+                    units = {i: self.units_list[i] for i in frame.columns}
+                    base_columns = list(frame.columns)
+                entry = {'n': n, 'source': csv_list[n], 'label': self.dataset_labels.get(n, 'CSV File' + str(n+1)),
+                         'columns': list(frame.columns), 'base_columns': base_columns, 'offsets': offsets,
+                         'software': None}
+                block = np.empty((len(frame.columns), len(frame)), dtype='float64')
+                for (j, col_name) in enumerate(frame.columns):
+                    block[j] = frame[col_name].astype('float64').to_numpy()
+                arrays['frame ' + str(n)] = block
+                if isinstance(csv_identities[n], GraphSoftware):
+                    state, results = csv_identities[n].snapshot_state()
+                    units.update(state['units_list'])
+                    entry['software'] = state
+                    for name in results:
+                        arrays[name + ' ' + str(n)] = results[name]
+                entry['units'] = {i: str(units[i]) for i in units}
+                datasets.append(entry)
+            write_container(path, {'kind': 'session', 'version': 1, 'index': index, 'datasets': datasets,
+                                   'units_list': {i: str(self.units_list[i]) for i in self.units_list}}, arrays)
+
+    def load_session(self):
+        """
+        function restores a session file into an empty CSV interface; numeric columns are memory-mapped from the file
+        and the parameters & results of every Data Calculations sheet are restored w/o recalculating
+        :return: restored datasets & Data Calculations sheets or pop-up
+        """
+        global has_csv_path
+        global index
+        if index != 0:
+            self.create_pop_up('Sessions can only be loaded before any CSV file is added.')
+            return
+        path = askopenfilename(filetypes=[('DVaCGUI session', '*.dvac')])
+        if path == '':
+            return
+        try:
+            header, arrays = read_container(path)
+        except (OSError, ValueError, KeyError) as error:
+            self.create_pop_up('Could not load session: ' + str(error))
+            return
+        with profiler.span('load_session', None, len(header['datasets'])):
+            for n in range(0, header['index']):
+                csv_identities.append(alphabet[n])
+                self.a_completed[n] = True
+                self.o_completed[n] = True
+            for entry in header['datasets']:
+                n = entry['n']
+                frame = pd.DataFrame(arrays['frame ' + str(n)].T, columns=entry['columns'], copy=False)
+                csv_list[n] = entry['source']
+                dataset_store.register(n, frame, entry['units'], entry['base_columns'], entry.get('offsets'))
+                data_frames[n] = dataset_store.stored(n)
+                if entry['software'] is not None:
+                    results = {name: arrays[name + ' ' + str(n)] for name in GraphSoftware.state_arrays
+                               if name + ' ' + str(n) in arrays}
+                    csv_identities[n] = GraphSoftware.headless(n)
+                    csv_identities[n].restore_state(entry['software'], results)
+                self.add_dataset_widgets(n, entry['label'], entry['units'])
+            index = header['index']
+            self.units_list.update(header['units_list'])
+            has_csv_path = index > 0
 
     def multiplot_info(self):
         """
@@ -705,9 +2903,11 @@ class CSVInterface(tk.Frame):
             self.fig.gca().set_prop_cycle(color=['#8b008b', '#32359a', '#873e41', '#395683', '#573683', '#be00be']) # -temp- RGB cycle for plots
             for i in data_frames:
                 df = data_frames[i]
-                df = self.reindex(df)
-                df = self.re_zero(df)
-                self.graph.scatter(df[self.abscissa_values[i]], df[self.ordinate_values[i]], s=7, label='CSV Data File ' + str(i+1)) # -temp- s=0.5
+                if dataset_store.has(i) is False:
+                    df = self.reindex(df)
+                    df = self.re_zero(df)
+                with profiler.span('plot_dataset', i, len(df), abscissa=self.abscissa_values[i], ordinate=self.ordinate_values[i]):
+                    self.graph.scatter(df[self.abscissa_values[i]], df[self.ordinate_values[i]], s=7, label='CSV Data File ' + str(i+1)) # -temp- s=0.5
             ax = self.fig.gca()
             ax.xaxis.label.set_size(12.5)
             ax.yaxis.label.set_size(12.5)
@@ -721,8 +2921,9 @@ class CSVInterface(tk.Frame):
                 ax.set(ylim=(self.ymin_value, self.ymax_value))
             self.graph.legend(loc="upper right", markerscale=2)
             # self.graph.margins(x=0, y=0)
-            canvas = FigureCanvasTkAgg(self.fig, master=self.parent)
-            canvas.draw()
+            with profiler.span('plot_all', None, len(data_frames)):
+                canvas = FigureCanvasTkAgg(self.fig, master=self.parent)
+                canvas.draw()
             canvas.get_tk_widget().grid(row=13, rowspan=36, column=0, columnspan=80, sticky=tk.NW)
             self.can_export_multiplot = True
         else:
@@ -749,6 +2950,120 @@ class CSVInterface(tk.Frame):
         else:
             self.create_pop_up('First plot.')
 
+    def responsiveness_window(self):
+        """
+        function creates a Responsiveness Log sheet summarizing main-loop latency percentiles & listing the recent
+        stalls w/ the callback that was running, its duration & a stack sample
+        :return: Responsiveness Log sheet or pop-up
+        """
+        if stall_watchdog is None:
+            self.create_pop_up('The responsiveness watchdog is not running.')
+            return
+        summary = stall_watchdog.summary()
+        log_pop_up = tk.Toplevel()
+        log_pop_up.title('Responsiveness Log')
+        latency = 'Heartbeat latency (ms)  |  '
+        for key in ('latency_p50_ms', 'latency_p90_ms', 'latency_p99_ms', 'latency_max_ms'):
+            if key in summary:
+                latency += key.replace('latency_', '').replace('_ms', '') + ': ' + str(float("{:.1f}".format(summary[key]))) + '    '
+        tk.Label(log_pop_up, text='Main-Loop Responsiveness', font='Helvetica 18 bold').grid(row=0, sticky=tk.W)
+        tk.Label(log_pop_up, text=latency).grid(row=1, sticky=tk.W)
+        tk.Label(log_pop_up, text='Stalls: ' + str(summary['stalls']) + '  |  Total stalled: ' + str(float("{:.1f}".format(summary['stalled_ms']))) + ' ms').grid(row=2, sticky=tk.W)
+        row = 3
+        for name, entry in sorted(summary['callbacks'].items(), key=lambda c: -c[1]['total_ms']):
+            tk.Label(log_pop_up, text='    ' + name + '  x' + str(entry['count']) + '  total ' + str(float("{:.1f}".format(entry['total_ms']))) + ' ms  max ' + str(float("{:.1f}".format(entry['max_ms']))) + ' ms').grid(row=row, sticky=tk.W)
+            row += 1
+        stalls = Scrollable(log_pop_up)
+        stalls.grid(row=row, sticky=tk.EW)
+        r = 0
+        for stall in stall_watchdog.recent():
+            tk.Label(stalls.scrolled_frame, text=stall['callback'] + ' | ' + str(float("{:.1f}".format(stall['duration_ms']))) + ' ms', font='Helvetica 12 bold').grid(row=r, sticky=tk.W)
+            r += 1
+            for line in stall['stack'][-5:]:
+                tk.Label(stalls.scrolled_frame, text='    ' + line).grid(row=r, sticky=tk.W)
+                r += 1
+        export_button = tk.Button(log_pop_up, text='Export Log (JSON)', command=self.export_responsiveness_json)
+        export_button.grid(row=row + 1, sticky=tk.W)
+        remove_button = tk.Button(log_pop_up, text='Dismiss', command=log_pop_up.destroy)
+        remove_button.grid(row=row + 2, sticky=tk.W)
+
+    def cache_window(self):
+        """
+        function creates a Result Cache sheet showing the cache's size & hit statistics w/ controls for verification
+        and clearing
+        :return: Result Cache sheet
+        """
+        summary = result_cache.summary()
+        cache_pop_up = tk.Toplevel()
+        cache_pop_up.title('Result Cache')
+        tk.Label(cache_pop_up, text='Result Cache', font='Helvetica 18 bold').grid(row=0, sticky=tk.W)
+        tk.Label(cache_pop_up, text='Folder: ' + summary['directory']).grid(row=1, sticky=tk.W)
+        tk.Label(cache_pop_up, text='Entries: ' + str(summary['entries']) + '  |  Size: ' + str(float("{:.1f}".format(summary['bytes'] / 1048576))) + ' MB of ' + str(float("{:.1f}".format(summary['max_bytes'] / 1048576))) + ' MB').grid(row=2, sticky=tk.W)
+        tk.Label(cache_pop_up, text='Hits: ' + str(summary['hits']) + '  |  Misses: ' + str(summary['misses']) + '  |  Verified: ' + str(summary['verified']) + '  |  Mismatches: ' + str(summary['mismatches']) + '  |  Write Errors: ' + str(summary['write_errors'])).grid(row=3, sticky=tk.W)
+        problems = []
+        if summary['last_mismatch'] is not None:
+            problems.append('Last mismatch: ' + summary['last_mismatch']['calculation'] + ' at ' + summary['last_mismatch']['time'] + ' (entry removed)')
+        if summary['last_write_error'] is not None:
+            problems.append('Last write error: ' + summary['last_write_error']['error'] + ' at ' + summary['last_write_error']['time'])
+        tk.Label(cache_pop_up, text='\n'.join(problems) if len(problems) > 0 else 'No mismatches or write errors.', justify=tk.LEFT).grid(row=4, sticky=tk.W)
+
+        def determine_enabled():
+            result_cache.enabled = enabled_select.get() == 1
+
+        def determine_verify():
+            result_cache.verify = verify_select.get() == 1
+
+        enabled_select = tk.IntVar(value=1 if result_cache.enabled is True else 0)
+        checkbox_enabled = tk.Checkbutton(cache_pop_up, text='Use cached results', variable=enabled_select, onvalue=1,
+                                          offvalue=0, command=determine_enabled)
+        checkbox_enabled.grid(row=5, sticky=tk.W)
+        verify_select = tk.IntVar(value=1 if result_cache.verify is True else 0)
+        checkbox_verify = tk.Checkbutton(cache_pop_up, text='Verify (recalculate ' + str(int(result_cache.verify_rate * 100)) + '% of cached results and compare)',
+                                         variable=verify_select, onvalue=1, offvalue=0, command=determine_verify)
+        checkbox_verify.grid(row=6, sticky=tk.W)
+        clear_button = tk.Button(cache_pop_up, text='Clear Cache', command=result_cache.clear)
+        clear_button.grid(row=7, sticky=tk.W)
+        remove_button = tk.Button(cache_pop_up, text='Dismiss', command=cache_pop_up.destroy)
+        remove_button.grid(row=8, sticky=tk.W)
+
+    def export_responsiveness_json(self):
+        """
+        function saves the watchdog's latency summary & rolling stall log as a .json file next to the program
+        :return: JSON file
+        """
+        my_path = os.path.abspath(__file__)
+        base = os.path.basename(__file__)
+        new_path = my_path.replace(base, '')
+        my_file = os.path.join(new_path, 'DVaCGUI responsiveness.json')
+        with open(my_file, 'w') as f:
+            json.dump({'summary': stall_watchdog.summary(), 'stalls': stall_watchdog.recent(len(stall_watchdog.stalls))}, f, indent=1)
+        self.create_pop_up('Responsiveness log saved to ' + my_file)
+
+    def export_timing_json(self):
+        """
+        function saves the profiler's per-stage timing histograms & recorded spans as a .json file next to the program
+        :return: JSON file
+        """
+        my_path = os.path.abspath(__file__)
+        base = os.path.basename(__file__)
+        new_path = my_path.replace(base, '')
+        my_file = os.path.join(new_path, 'DVaCGUI timing.json')
+        profiler.export_json(my_file)
+        self.create_pop_up('Timing saved to ' + my_file)
+
+    def export_timing_trace(self):
+        """
+        function saves the profiler's recorded spans in Chrome trace format (chrome://tracing, Perfetto) next to the
+        program
+        :return: Chrome trace JSON file
+        """
+        my_path = os.path.abspath(__file__)
+        base = os.path.basename(__file__)
+        new_path = my_path.replace(base, '')
+        my_file = os.path.join(new_path, 'DVaCGUI timing trace.json')
+        profiler.export_chrome_trace(my_file)
+        self.create_pop_up('Chrome trace saved to ' + my_file)
+
     def input_domain(self):
         """
         function has user input a specific domain that is stored into the bounds for plotting
@@ -910,38 +3225,51 @@ class WeibullInterface(tk.Frame):
         self.ax1_xmin, self.ax1_xmax = self.ax1.get_xlim()
         self.ax3.set_xlim(self.x_manip(self.ax1_xmin), self.x_manip(self.ax1_xmax))
         self.ax3.plot([], [])
-        canvas = FigureCanvasTkAgg(self.fig, master=self.parent)
-        canvas.draw()
+        with profiler.span('plot_weibull', None, len(csv_identities)):
+            canvas = FigureCanvasTkAgg(self.fig, master=self.parent)
+            canvas.draw()
         canvas.get_tk_widget().grid(row=2)
 
 
 class StatisticsInterface(tk.Frame):
-    def __init__(self, parent, *args, **kwargs):
-        """
-        function initializes StatisticsInterface class upon initializing the program
+    # statistics panel rows: label, GraphSoftware attribute & attribute holding its unit (None: unitless)
+    metrics: tuple = (("Young's Modulus (Slope)", 'youngs_modulus_value_slope', 'stress_pascal_unit'),
+                      ("Young's Modulus (CSM)", 'youngs_modulus_value_csm', 'csm_pascal_unit'),
+                      ("Young's Modulus (Sneddon)", 'youngs_modulus_value_sneddon', 'sneddon_pascal_unit'),
+                      ('Energy Dissipation', 'energy_dissipated_value', 'stress_pascal_unit'),
+                      ('Burst Events (Size)', 'burst_size', None),
+                      ('Burst Events (Number)', 'num_bursts_value', None),
+                      ('Ultimate Failure (Stress)', 'ultimate_stress_value', 'stress_pascal_unit'),
+                      ('Ultimate Failure (Strain)', 'ultimate_strain_value', None))
+    measures: tuple = ('Mean', 'Median', 'Standard Deviation', 'Variance', 'Interquartile Range', 'Outliers')
+
+    def __init__(self, parent, scrolled=None, *args, **kwargs):
+        """
+        function initializes StatisticsInterface class upon initializing the program; the boxplots share one figure
+        that is drawn only once it is scrolled into view
         :param parent: reference to main frame of the StatisticsInterface class
+        :param scrolled: ScrollableFrame holding parent (None: the boxplots are always in view)
         :param args: N/A
         :param kwargs: N/A
         """
         tk.Frame.__init__(self, parent, *args, **kwargs)
         self.parent = parent
+        self.scrolled = scrolled
         self.program_info()
         self.one_dimensional_data()
         self.multi_dimensional_data()
-        self.calculate_means()
-        self.calculate_medians()
-        self.calculate_std()
-        self.calculate_variance()
-        self.calculate_IQR()
-        self.calculate_num_outliers()
-        self.plot_boxplots(0, "Young's Modulus (Slope)", csv_identities[0].stress_pascal_unit)
-        self.plot_boxplots(1, "Young's Modulus (CSM)", csv_identities[0].csm_pascal_unit)
-        self.plot_boxplots(2, "Young's Modulus (Sneddon)", csv_identities[0].sneddon_pascal_unit)
-        self.plot_boxplots(3, "Energy Dissipation", csv_identities[0].stress_pascal_unit)
-        self.plot_boxplots(4, "Burst Events (Size)", "")
-        self.plot_boxplots(5, "Burst Events (Number)", "")
-        self.plot_boxplots(6, "Ultimate Failure (Stress)", csv_identities[0].stress_pascal_unit)
-        self.plot_boxplots(7, "Ultimate Failure (Strain)", "")
+        self.value_labels = [[None] * len(self.measures) for _ in self.metrics]
+        for (i, j) in np.ndindex(len(self.metrics), len(self.measures)):
+            self.value_labels[i][j] = tk.Label(self.parent, width=15)
+            self.value_labels[i][j].grid(row=4 + i, column=10 + (6 * j), columnspan=6, sticky=tk.NW)
+        self.fig = Figure(figsize=(12, 6), dpi=100)
+        self.graphs = None
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.parent)
+        self.canvas.get_tk_widget().grid(row=12, column=0, columnspan=52, sticky=tk.NW)
+        self.canvas.get_tk_widget().bind('<Map>', lambda event: self.render_if_visible())
+        if self.scrolled is not None:
+            self.scrolled.view_listeners.append(self.render_if_visible)
+        self.refresh()
 
     def program_info(self):
         """
@@ -989,277 +3317,103 @@ class StatisticsInterface(tk.Frame):
         u_strain_label = tk.Label(self.parent, text="Ultimate Failure (Strain)  |  ")
         u_strain_label.grid(row=11, columnspan=10, sticky=tk.E)
 
-    def calculate_means(self):
-        def mean(n):
-            u = 0.0
-            for i in range(0, len(csv_identities)):
-                if n == 0:
-                    u += csv_identities[i].youngs_modulus_value_slope
-                if n == 1:
-                    u += csv_identities[i].youngs_modulus_value_csm
-                if n == 2:
-                    u += csv_identities[i].youngs_modulus_value_sneddon
-                if n == 3:
-                    u += csv_identities[i].energy_dissipated_value
-                if n == 4:
-                    print("not functional") # -temp-
-                if n == 5:
-                    u += csv_identities[i].num_bursts_value
-                if n == 6:
-                    u += csv_identities[i].ultimate_stress_value
-                if n == 7:
-                    u += csv_identities[i].ultimate_strain_value
-            return float("{:.4f}".format(u / len(csv_identities)))
-
-        for i in range(0, 8):
-            output = tk.Label(self.parent, text=str(mean(i)), width=15)
-            output.grid(row=4+i, column=10, columnspan=6, sticky=tk.NW)
-
-    def calculate_medians(self):
-        def median(n):
-            l = []
-            u = 0.0
-            if n == 0:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].youngs_modulus_value_slope)
-                u = np.median(l)
-            if n == 1:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].youngs_modulus_value_csm)
-                u = np.median(l)
-            if n == 2:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].youngs_modulus_value_sneddon)
-                u = np.median(l)
-            if n == 3:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].energy_dissipated_value)
-                u = np.median(l)
-            if n == 4:
-                print("not functional") # -temp-
-            if n == 5:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].num_bursts_value)
-                u = np.median(l)
-            if n == 6:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].ultimate_stress_value)
-                u = np.median(l)
-            if n == 7:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].ultimate_strain_value)
-                u = np.median(l)
-            return float("{:.4f}".format(u))
-
-        for i in range(0, 8):
-            output = tk.Label(self.parent, text=str(median(i)), width=15)
-            output.grid(row=4+i, column=16, columnspan=6, sticky=tk.NW)
-
-    def calculate_std(self):
-        def std(n):
-            l = []
-            u = 0.0
-            if n == 0:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].youngs_modulus_value_slope)
-                u = np.std(l)
-            if n == 1:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].youngs_modulus_value_csm)
-                u = np.std(l)
-            if n == 2:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].youngs_modulus_value_sneddon)
-                u = np.std(l)
-            if n == 3:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].energy_dissipated_value)
-                u = np.std(l)
-            if n == 4:
-                print("not functional")  # -temp-
-            if n == 5:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].num_bursts_value)
-                u = np.std(l)
-            if n == 6:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].ultimate_stress_value)
-                u = np.std(l)
-            if n == 7:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].ultimate_strain_value)
-                u = np.std(l)
-            return float("{:.4f}".format(u))
-
-        for i in range(0, 8):
-            output = tk.Label(self.parent, text=str(std(i)), width=15)
-            output.grid(row=4 + i, column=22, columnspan=6, sticky=tk.NW)
-
-    def calculate_variance(self):
-        def variance(n):
-            l = []
-            u = 0.0
-            if n == 0:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].youngs_modulus_value_slope)
-                u = np.var(l)
-            if n == 1:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].youngs_modulus_value_csm)
-                u = np.var(l)
-            if n == 2:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].youngs_modulus_value_sneddon)
-                u = np.var(l)
-            if n == 3:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].energy_dissipated_value)
-                u = np.var(l)
-            if n == 4:
-                print("not functional")  # -temp-
-            if n == 5:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].num_bursts_value)
-                u = np.var(l)
-            if n == 6:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].ultimate_stress_value)
-                u = np.var(l)
-            if n == 7:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].ultimate_strain_value)
-                u = np.var(l)
-            return float("{:.4f}".format(u))
-
-        for i in range(0, 8):
-            output = tk.Label(self.parent, text=str(variance(i)), width=15)
-            output.grid(row=4 + i, column=28, columnspan=6, sticky=tk.NW)
-
-    def calculate_IQR(self):
-        def iqr(n):
-            l = []
-            u = 0.0
-            if n == 0:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].youngs_modulus_value_slope)
-                u = np.subtract(*np.percentile(l, [75, 25]))
-            if n == 1:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].youngs_modulus_value_csm)
-                u = np.subtract(*np.percentile(l, [75, 25]))
-            if n == 2:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].youngs_modulus_value_sneddon)
-                u = np.subtract(*np.percentile(l, [75, 25]))
-            if n == 3:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].energy_dissipated_value)
-                u = np.subtract(*np.percentile(l, [75, 25]))
-            if n == 4:
-                print("not functional")  # -temp-
-            if n == 5:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].num_bursts_value)
-                u = np.subtract(*np.percentile(l, [75, 25]))
-            if n == 6:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].ultimate_stress_value)
-                u = np.subtract(*np.percentile(l, [75, 25]))
-            if n == 7:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].ultimate_strain_value)
-                u = np.subtract(*np.percentile(l, [75, 25]))
-            return float("{:.4f}".format(u))
-
-        for i in range(0, 8):
-            output = tk.Label(self.parent, text=str(iqr(i)), width=15)
-            output.grid(row=4 + i, column=34, columnspan=6, sticky=tk.NW)
-
-    def calculate_num_outliers(self):
-        def num_outliers(n):
-            l = []
-            u = 0.0
-            if n == 0:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].youngs_modulus_value_slope)
-                l = np.array(l)
-                z = l[(l > np.quantile(l, 0.1)) & (l < np.quantile(l, 0.9))].tolist()
-                u = len(np.array(l)) - len(np.array(z))
-            if n == 1:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].youngs_modulus_value_csm)
-                l = np.array(l)
-                z = l[(l > np.quantile(l, 0.1)) & (l < np.quantile(l, 0.9))].tolist()
-                u = len(np.array(l)) - len(np.array(z))
-            if n == 2:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].youngs_modulus_value_sneddon)
-                l = np.array(l)
-                z = l[(l > np.quantile(l, 0.1)) & (l < np.quantile(l, 0.9))].tolist()
-                u = len(np.array(l)) - len(np.array(z))
-            if n == 3:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].energy_dissipated_value)
-                l = np.array(l)
-                z = l[(l > np.quantile(l, 0.1)) & (l < np.quantile(l, 0.9))].tolist()
-                u = len(np.array(l)) - len(np.array(z))
-            if n == 4:
-                print("not functional")  # -temp-
-            if n == 5:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].num_bursts_value)
-                l = np.array(l)
-                z = l[(l > np.quantile(l, 0.1)) & (l < np.quantile(l, 0.9))].tolist()
-                u = len(np.array(l)) - len(np.array(z))
-            if n == 6:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].ultimate_stress_value)
-                l = np.array(l)
-                z = l[(l > np.quantile(l, 0.1)) & (l < np.quantile(l, 0.9))].tolist()
-                u = len(np.array(l)) - len(np.array(z))
-            if n == 7:
-                for i in range(0, len(csv_identities)):
-                    l.append(csv_identities[i].ultimate_strain_value)
-                l = np.array(l)
-                z = l[(l > np.quantile(l, 0.1)) & (l < np.quantile(l, 0.9))].tolist()
-                u = len(np.array(l)) - len(np.array(z))
-            return u
-
-        for i in range(0, 8):
-            output = tk.Label(self.parent, text=str(num_outliers(i)), width=15)
-            output.grid(row=4 + i, column=40, columnspan=6, sticky=tk.NW)
-
-    def plot_boxplots(self, n, str, unit):
-        l = []
-        for i in range(0, len(csv_identities)):
-            if n == 0:
-                l.append(csv_identities[i].youngs_modulus_value_slope)
-            if n == 1:
-                l.append(csv_identities[i].youngs_modulus_value_csm)
-            if n == 2:
-                l.append(csv_identities[i].youngs_modulus_value_sneddon)
-            if n == 3:
-                l.append(csv_identities[i].energy_dissipated_value)
-            if n == 4:
-                l.append(csv_identities[i].burst_size)
-            if n == 5:
-                l.append(csv_identities[i].num_bursts_value)
-            if n == 6:
-                l.append(csv_identities[i].ultimate_stress_value)
-            if n == 7:
-                l.append(csv_identities[i].ultimate_strain_value)
-        data = np.array(l).astype('float64')
-
-        self.fig = Figure(figsize=(3, 3), dpi=100)
-        self.fig.subplots_adjust(left=0.25, bottom=0.25)
-        self.graph = self.fig.add_subplot(111, xlabel=str + " (" + unit + ")")
-        self.graph.boxplot(data)
-        canvas = FigureCanvasTkAgg(self.fig, master=self.parent)
-        canvas.draw()
-        if n == 0 or n == 1 or n == 2 or n == 3:
-            canvas.get_tk_widget().grid(row=12, column=0 + (13 * n), columnspan=13, sticky=tk.NW)
-        if n == 4 or n == 5 or n == 6 or n == 7:
-            canvas.get_tk_widget().grid(row=13, column=-52 + (13 * n), columnspan=13, sticky=tk.NW)
+    @staticmethod
+    def measure(values):
+        """
+        function calculates the mean, median, standard deviation, variance, interquartile range & number of outliers
+        (values outside the 10th-90th percentile) of every column at once
+        :param values: array (specimen x metric)
+        :return: array (measure x metric)
+        """
+        if len(values) == 0:
+            return np.full((6, values.shape[1]), np.nan)
+        (q10, q25, q75, q90) = np.quantile(values, [0.1, 0.25, 0.75, 0.9], axis=0)
+        outliers = len(values) - ((values > q10) & (values < q90)).sum(axis=0)
+        return np.stack([values.mean(axis=0), np.median(values, axis=0), values.std(axis=0), values.var(axis=0),
+                         q75 - q25, outliers])
+
+    @classmethod
+    def statistics(cls, specimens):
+        """
+        function gathers the results of every specimen in one pass & calculates all statistics from them; burst sizes
+        are pooled over the bursts of all specimens
+        :param specimens: GraphSoftware objects (other entries, e.g. files w/o a Data Calculations sheet, are skipped)
+        :return: array (measure x metric) & the values of each metric for the boxplots
+        """
+        specimens = [software for software in specimens if isinstance(software, GraphSoftware)]
+        burst = [attribute for (_, attribute, _) in cls.metrics].index('burst_size')
+        scalar = [k for k in range(len(cls.metrics)) if k != burst]
+        values = np.array([[getattr(software, cls.metrics[k][1]) for k in scalar] for software in specimens],
+                          dtype='float64').reshape(-1, len(scalar))
+        sizes = np.concatenate([np.zeros(0)] + [np.asarray(software.burst_size, dtype='float64')
+                                                for software in specimens])
+        table = np.empty((len(cls.measures), len(cls.metrics)))
+        table[:, scalar] = cls.measure(values)
+        table[:, burst] = cls.measure(sizes.reshape(-1, 1))[:, 0]
+        data = [values[:, scalar.index(k)] if k in scalar else sizes for k in range(len(cls.metrics))]
+        return (table, data)
+
+    def refresh(self):
+        """
+        function recalculates the statistics of every CSV file, updates the value labels & redraws the boxplots in
+        the same figure (once they are in view)
+        :return: updated Statistics panel
+        """
+        with profiler.span('statistics', None, len(csv_identities)):
+            (self.table, self.data) = self.statistics(csv_identities)
+        for (i, j) in np.ndindex(self.table.shape[1], self.table.shape[0]):
+            value = self.table[j, i]
+            if self.measures[j] == 'Outliers' and np.isfinite(value):
+                text = str(int(value))
+            else:
+                text = str(float("{:.4f}".format(value)))
+            self.value_labels[i][j].configure(text=text)
+        specimen = next((software for software in csv_identities if isinstance(software, GraphSoftware)), None)
+        self.units = ['' if unit is None or specimen is None else getattr(specimen, unit)
+                      for (_, _, unit) in self.metrics]
+        self.rendered = False
+        self.render_if_visible()
+
+    def in_view(self):
+        """
+        function checks whether any part of the boxplots is inside the visible area of the scrolled panel
+        :return: True if the boxplots are in view
+        """
+        widget = self.canvas.get_tk_widget()
+        if widget.winfo_ismapped() == 0:
+            return False
+        if self.scrolled is None:
+            return True
+        view = self.scrolled.canvas
+        (top, bottom) = (view.canvasy(0), view.canvasy(view.winfo_height()))
+        return widget.winfo_y() < bottom and widget.winfo_y() + widget.winfo_height() > top
+
+    def render_if_visible(self):
+        """
+        function draws the boxplots if they changed since they were last drawn & are in view
+        :return: boxplots drawn or idle
+        """
+        if self.rendered is False and self.in_view() is True:
+            self.render()
+
+    def render(self):
+        """
+        function draws a boxplot of each metric in a subplot grid of the panel's figure; the figure, its subplots &
+        its canvas are reused every time
+        :return: boxplots
+        """
+        with profiler.span('plot_boxplots', None, len(csv_identities)):
+            if self.graphs is None:
+                self.fig.subplots_adjust(left=0.08, right=0.98, bottom=0.12, wspace=0.45, hspace=0.35)
+                self.graphs = self.fig.subplots(2, 4).ravel()
+            for (graph, (name, _, _), unit, data) in zip(self.graphs, self.metrics, self.units, self.data):
+                graph.clear()
+                graph.set(xlabel=name + " (" + unit + ")")
+                data = data[np.isfinite(data)]
+                if len(data) > 0:
+                    graph.boxplot(data)
+            self.canvas.draw()
+        self.rendered = True
 
 
 class Scrollable(tk.Frame):
@@ -1317,34 +3471,444 @@ class ScrollableFrame(tk.Frame):
         )
 
         canvas.create_window((0, 0), window=self.scrollable_frame, anchor=tk.NW)
-        canvas.configure(xscrollcommand=horiz.set, yscrollcommand=scrollbar.set)
+        canvas.configure(xscrollcommand=horiz.set, yscrollcommand=self.yscroll)
         canvas.grid(row=0, column=0)
         scrollbar.grid(row=0, column=1, sticky=tk.NS)
         horiz.grid(row=1, column=0, sticky=tk.EW)
+        self.canvas = canvas
+        self.scrollbar = scrollbar
+        # called w/o arguments whenever the visible part of the frame changes (scrolling, resizing, new contents)
+        self.view_listeners: list = []
+
+    def yscroll(self, first, last):
+        """
+        function moves the vertical scrollbar to the visible part of the frame & notifies the view listeners
+        :param first: top of the visible part (fraction of the frame)
+        :param last: bottom of the visible part (fraction of the frame)
+        :return: updated scrollbar
+        """
+        self.scrollbar.set(first, last)
+        for listener in list(self.view_listeners):
+            listener()
 
 
-class GraphSoftware(tk.Frame):
-    def __init__(self, parent, csv_index, *args, **kwargs):
+class BurstTable(tk.Frame):
+    columns: tuple = ('Burst', 'Lower Stress', 'Lower Strain', 'Upper Stress', 'Upper Strain', 'Size')
+
+    def __init__(self, parent, visible=8, command=None, *args, **kwargs):
         """
-        function initializes Graph Software class upon creating master parent and selecting a csv file from desktop
-        :param parent: reference to the main frame of the Graph Software class
+        function initializes a virtual table of burst events: the table holds only as many rows as are visible and
+        scrolling fills them from the burst arrays, so it is drawn in the same time for any number of bursts
+        :param parent: frame holding the table
+        :param visible: number of rows shown
+        :param command: called w/ the burst index (0 for the first burst) when a burst is selected
         :param args: N/A
         :param kwargs: N/A
         """
         tk.Frame.__init__(self, parent, *args, **kwargs)
-        self.parent = parent
-        self.csv_index = csv_index
-        self.csm_s: bool = False
-        self.csm_e: bool = False
-        self.ss: bool = False
-        self.se: bool = False
-        self.a: bool = False
-        self.o: bool = False
-        self.l: bool = False
-        self.d: bool = False
-        self.csm: bool = False
-        self.s: bool = False
-        self.h: bool = False
+        self.visible = visible
+        self.command = command
+        self.values = np.empty((0, len(self.columns) - 1))
+        self.order = np.arange(0)
+        self.first = 0
+        self.selected = None
+        self.sort_column = 'Burst'
+        self.descending = False
+        self.unit = ''
+        self.table = ttk.Treeview(self, columns=self.columns, show='headings', height=visible, selectmode='browse')
+        for col_name in self.columns:
+            self.table.heading(col_name, command=partial(self.sort, col_name))
+            self.table.column(col_name, width=50 if col_name == 'Burst' else 90, anchor=tk.E)
+        self.vsb = tk.Scrollbar(self, orient=tk.VERTICAL, command=self.scroll)
+        self.vsb.pack(side=tk.RIGHT, fill=tk.Y)
+        self.table.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.table.bind('<<TreeviewSelect>>', self.select)
+        self.table.bind('<MouseWheel>', lambda event: self.show(self.first - int(event.delta / abs(event.delta or 1))))
+        self.table.bind('<Button-4>', lambda event: self.show(self.first - 1))
+        self.table.bind('<Button-5>', lambda event: self.show(self.first + 1))
+
+    def set_bursts(self, burst_stress_strain, burst_size, unit):
+        """
+        function hands the table new burst results; the current sort is kept
+        :param burst_stress_strain: lower stress, lower strain, upper stress, upper strain of each burst in turn
+        :param burst_size: strain range of each burst
+        :param unit: stress unit
+        :return: table showing the first rows
+        """
+        stress_strain = np.asarray(burst_stress_strain, dtype='float64').reshape(-1, 4)
+        self.values = np.column_stack((stress_strain, np.asarray(burst_size, dtype='float64')[:len(stress_strain)]))
+        self.unit = unit
+        self.selected = None
+        self.table.delete(*self.table.get_children())
+        for slot in range(min(self.visible, len(self.values))):
+            self.table.insert('', tk.END, iid=str(slot))
+        self.sort(self.sort_column, toggle=False)
+
+    def heading(self, col_name):
+        """
+        function gives a column heading w/ its unit & the sort direction
+        :param col_name: column name
+        :return: column heading
+        """
+        text = col_name
+        if 'Stress' in col_name and self.unit != '':
+            text += ' (' + self.unit + ')'
+        if col_name == self.sort_column:
+            text += ' ▼' if self.descending is True else ' ▲'
+        return text
+
+    def sort(self, col_name, toggle=True):
+        """
+        function orders the bursts by a column; clicking the sorted column again reverses the order
+        :param col_name: column name
+        :param toggle: reverse the order if the table is already sorted by the column
+        :return: sorted table scrolled to the top
+        """
+        if toggle is True:
+            self.descending = not self.descending if col_name == self.sort_column else col_name != 'Burst'
+        self.sort_column = col_name
+        if col_name == 'Burst':
+            self.order = np.arange(len(self.values))
+        else:
+            self.order = np.argsort(self.values[:, self.columns.index(col_name) - 1], kind='stable')
+        if self.descending is True:
+            self.order = self.order[::-1]
+        for name in self.columns:
+            self.table.heading(name, text=self.heading(name))
+        self.show(0)
+
+    def scroll(self, *args):
+        """
+        function moves the visible rows when the scrollbar is dragged or clicked
+        :param args: scrollbar command ('moveto', fraction) or ('scroll', number, 'units' or 'pages')
+        :return: table showing the new rows
+        """
+        if args[0] == tk.MOVETO:
+            self.show(int(round(float(args[1]) * len(self.order))))
+        else:
+            self.show(self.first + int(args[1]) * (self.visible if args[2] == tk.PAGES else 1))
+
+    def show(self, first):
+        """
+        function fills the visible rows starting w/ the given row of the sorted bursts
+        :param first: first row shown
+        :return: table showing the rows
+        """
+        n = len(self.order)
+        self.first = max(0, min(first, n - self.visible))
+        rows = self.order[self.first:self.first + self.visible]
+        for (slot, r) in enumerate(rows):
+            self.table.item(str(slot), values=[str(r + 1)] + ['{:.3f}'.format(value) for value in self.values[r]])
+        slots = np.flatnonzero(rows == self.selected)
+        if len(slots) > 0:
+            self.table.selection_set(str(slots[0]))
+        elif len(self.table.selection()) > 0:
+            self.table.selection_remove(*self.table.selection())
+        if n > 0:
+            self.vsb.set(self.first / n, (self.first + len(rows)) / n)
+        else:
+            self.vsb.set(0.0, 1.0)
+
+    def select(self, event):
+        """
+        function hands the selected burst to the command
+        :param event: selection event
+        :return: command called w/ the burst index
+        """
+        selection = self.table.selection()
+        if len(selection) == 0:
+            return
+        burst = int(self.order[self.first + int(selection[0])])
+        if burst == self.selected:
+            return
+        self.selected = burst
+        if self.command is not None:
+            self.command(burst)
+
+
+class TableInterface(tk.Frame):
+    def __init__(self, parent, title, columns, rows, units=None, *args, **kwargs):
+        """
+        function initializes a table of per-cycle (or per-segment) results w/ a plot of any column against any other
+        column and CSV export
+        :param parent: reference to main frame of the TableInterface class
+        :param title: table title (also the name of the exported file)
+        :param columns: column names
+        :param rows: table rows (one list of values per row)
+        :param units: column name -> unit
+        :param args: N/A
+        :param kwargs: N/A
+        """
+        tk.Frame.__init__(self, parent, *args, **kwargs)
+        self.parent = parent
+        self.title = title
+        self.columns = list(columns)
+        self.rows = np.asarray(rows, dtype='float64').reshape(-1, len(self.columns))
+        self.units = units or {}
+        self.fig = None
+        tk.Label(self.parent, text=title, font='Helvetica 18 bold').grid(row=0, column=0, columnspan=4, sticky=tk.W)
+        self.create_table()
+        self.create_plot_options()
+
+    def heading(self, col_name):
+        """
+        function gives a column name w/ its unit
+        :param col_name: column name
+        :return: column heading
+        """
+        if self.units.get(col_name, '') == '':
+            return col_name
+        return col_name + ' (' + self.units[col_name] + ')'
+
+    def create_table(self):
+        """
+        function fills a scrollable table w/ every row
+        :return: table of results
+        """
+        self.table = ttk.Treeview(self.parent, columns=self.columns, show='headings', height=15)
+        for col_name in self.columns:
+            self.table.heading(col_name, text=self.heading(col_name))
+            self.table.column(col_name, width=110, anchor=tk.E)
+        for row in self.rows:
+            self.table.insert('', tk.END, values=['{:.6g}'.format(value) for value in row])
+        scrollbar = tk.Scrollbar(self.parent, orient=tk.VERTICAL, command=self.table.yview)
+        self.table.configure(yscrollcommand=scrollbar.set)
+        self.table.grid(row=1, column=0, columnspan=4, sticky=tk.NSEW)
+        scrollbar.grid(row=1, column=4, sticky=tk.NS)
+
+    def create_plot_options(self):
+        """
+        function creates the abscissa & ordinate option menus, the plot button and the export button
+        :return: plot & export controls
+        """
+        self.clicked_abscissa = tk.StringVar(self.parent)
+        self.clicked_abscissa.set(self.columns[0])
+        self.clicked_ordinate = tk.StringVar(self.parent)
+        self.clicked_ordinate.set(self.columns[-1])
+        drop_abscissa = tk.OptionMenu(self.parent, self.clicked_abscissa, *self.columns)
+        drop_abscissa.grid(row=2, column=0, sticky=tk.EW)
+        drop_ordinate = tk.OptionMenu(self.parent, self.clicked_ordinate, *self.columns)
+        drop_ordinate.grid(row=2, column=1, sticky=tk.EW)
+        tk.Button(self.parent, text='Plot', command=self.plot).grid(row=2, column=2, sticky=tk.EW)
+        tk.Button(self.parent, text='Export CSV File', command=self.export_csv).grid(row=2, column=3, sticky=tk.EW)
+
+    def plot(self):
+        """
+        function plots the selected ordinate column against the selected abscissa column; the figure & canvas are
+        created once and reused for every later plot
+        :return: plot of the table
+        """
+        x = self.columns.index(self.clicked_abscissa.get())
+        y = self.columns.index(self.clicked_ordinate.get())
+        with profiler.span('plot_table', None, len(self.rows), table=self.title):
+            if self.fig is None:
+                self.fig = Figure(figsize=(8, 5), dpi=100)
+                self.ax = self.fig.add_subplot(111)
+                self.canvas = FigureCanvasTkAgg(self.fig, master=self.parent)
+                self.canvas.get_tk_widget().grid(row=3, column=0, columnspan=5, sticky=tk.NW)
+            self.ax.clear()
+            self.ax.plot(self.rows[:, x], self.rows[:, y], marker='o', markersize=3, color='#8b008b')
+            self.ax.set(xlabel=self.heading(self.columns[x]), ylabel=self.heading(self.columns[y]))
+            self.canvas.draw()
+
+    def append_rows(self, rows):
+        """
+        function adds rows to the end of the table (e.g. results arriving while a campaign runs)
+        :param rows: table rows (one list of values per row)
+        :return: longer table
+        """
+        rows = np.asarray(rows, dtype='float64').reshape(-1, len(self.columns))
+        self.rows = np.vstack((self.rows, rows))
+        for row in rows:
+            self.table.insert('', tk.END, values=['{:.6g}'.format(value) for value in row])
+        self.table.yview_moveto(1.0)
+
+    def export_csv(self):
+        """
+        function saves the table as a .csv file next to the program
+        :return: CSV file
+        """
+        my_path = os.path.abspath(__file__)
+        base = os.path.basename(__file__)
+        new_path = my_path.replace(base, '')
+        my_file = os.path.join(new_path, self.title + '.csv')
+        pd.DataFrame(self.rows, columns=[self.heading(col_name) for col_name in self.columns]).to_csv(my_file, index=False)
+        tk.Label(self.parent, text='Saved to ' + my_file).grid(row=4, column=0, columnspan=5, sticky=tk.W)
+
+
+class GraphSoftware(tk.Frame):
+    # parameters, calculation toggles & scalar results kept in session files
+    state_attributes: tuple = ('s', 'h', 'ss', 'se', 'csm_s', 'csm_e', 'a', 'o', 'l', 'd', 'csm', 'poisson_exists',
+                               'known_elastic_modulus_exists', 'specimen_area', 'specimen_height', 'strain_start',
+                               'strain_end', 'csm_start', 'csm_end', 'poisson_ratio', 'known_elastic_modulus',
+                               'youngs_modulus_value_slope', 'youngs_modulus_value_csm',
+                               'youngs_modulus_value_sneddon', 'ultimate_stress_value', 'ultimate_strain_value',
+                               'energy_dissipated_value', 'num_bursts_value', 'area_conservation',
+                               'volume_conservation', 'compute_stress', 'compute_strain', 'compute_yms',
+                               'compute_ymcsm', 'compute_true_stress', 'compute_true_strain', 'compute_sneddon',
+                               'compute_uss', 'compute_energy_dissipated', 'compute_bursts', 'abscissa', 'ordinate',
+                               'load_column', 'displacement_column', 'csm_column', 'stress_pascal_unit',
+                               'csm_pascal_unit', 'sneddon_pascal_unit', 'xmin_value', 'xmax_value', 'ymin_value',
+                               'ymax_value', 'xmin_exists', 'ymin_exists', 'xmax_exists', 'ymax_exists',
+                               'toggle_bursts', 'stress_type', 'strain_type', 'type_exists', 'compute_cycle_energy',
+                               'cycle_mode', 'cycle_batch_units', 'unload_fraction', 'area_coefficient',
+                               'oliver_pharr_units', 'plot_segment', 'compute_rolling_modulus', 'rolling_window',
+                               'rolling_window_unit', 'sweep_poisson_start', 'sweep_poisson_end',
+                               'sweep_modulus_start', 'sweep_modulus_end', 'area_uncertainty', 'height_uncertainty',
+                               'uncertainty_distribution', 'uncertainty_samples', 'uncertainty_results',
+                               'apply_filter', 'filter_method', 'filter_window', 'filter_order', 'filter_cutoff',
+                               'failure_row', 'correct_drift', 'time_column', 'hold_tolerance', 'drift_min_rows',
+                               'zero_at_contact', 'contact_method', 'contact_threshold')
+    # scalar results & the units picked by the calculations; left out of calculation templates (recalculated for every
+    # dataset a template is applied to)
+    result_attributes: tuple = ('youngs_modulus_value_slope', 'youngs_modulus_value_csm', 'youngs_modulus_value_sneddon',
+                                'ultimate_stress_value', 'ultimate_strain_value', 'energy_dissipated_value',
+                                'num_bursts_value', 'toggle_bursts', 'stress_pascal_unit', 'csm_pascal_unit',
+                                'sneddon_pascal_unit', 'uncertainty_results', 'failure_row')
+    # list results kept in session files as arrays
+    state_arrays: tuple = ('large_diff', 'burst_stress_strain', 'burst_size', 'cycle_energy_table', 'cycle_batch_table',
+                           'oliver_pharr_table', 'failure_candidates')
+    # cycle batch: cycle definitions (same as the four cycle parsers) & columns of the per-cycle results table
+    cycle_modes: dict = {'Displacement Controlled': ('displacement_column', True),
+                         'Load Controlled': ('load_column', True),
+                         'Arbitrary Displacement Peak': ('displacement_column', False),
+                         'Arbitrary Load Peak': ('load_column', False)}
+    cycle_batch_columns: tuple = ('Cycle', 'Rows', 'Max Strain', 'Max Stress', "Young's Modulus (CSM)",
+                                  "Young's Modulus (Sneddon)", 'Energy', 'Bursts')
+    # pascal units picked by the stress & modulus calculations: log10 range, divisor & unit
+    pascal_units: tuple = ((0, 1, 1.0, 'Pa'), (2, 4, 1e3, 'kPa'), (5, 7, 1e6, 'MPa'), (8, 10, 1e9, 'GPa'),
+                           (11, 13, 1e12, 'TPa'), (14, math.inf, 1e15, 'PPa'))
+    # strain range sweep: grid points along the strain axis & R^2 a window needs to count as a stable candidate
+    strain_sweep_points: int = 64
+    strain_sweep_r2: float = 0.99
+    # material sweep: values per parameter, grid values evaluated per row chunk (memory bound) & table columns
+    material_sweep_points: int = 21
+    material_sweep_block: int = 1048576
+    material_sweep_columns: tuple = ('Poisson Ratio', 'Known Elastic Modulus', "Young's Modulus (CSM, area)",
+                                     "Young's Modulus (Sneddon, area)", "Young's Modulus (CSM, volume)",
+                                     "Young's Modulus (Sneddon, volume)")
+    # geometry uncertainty: sample distributions, grid nodes per axis for the Sneddon & true energy interpolation,
+    # values per chunk of exact Sneddon evaluation and the results it reports (label & attribute holding the unit)
+    uncertainty_distributions: tuple = ('Normal', 'Uniform')
+    uncertainty_grid_points: int = 17
+    uncertainty_block: int = 1048576
+    uncertainty_outputs: dict = {'youngs_modulus_value_slope': ("Young's Modulus (slope)", 'stress_pascal_unit'),
+                                 'youngs_modulus_value_csm': ("Young's Modulus (CSM)", 'csm_pascal_unit'),
+                                 'youngs_modulus_value_sneddon': ("Young's Modulus (Sneddon)", 'sneddon_pascal_unit'),
+                                 'ultimate_stress_value': ('Ultimate stress', 'stress_pascal_unit'),
+                                 'ultimate_strain_value': ('Ultimate strain', None),
+                                 'energy_dissipated_value': ('Energy dissipated', 'stress_pascal_unit')}
+    # failure detection: most candidates ranked & columns of the candidates table
+    failure_candidate_count: int = 10
+    failure_columns: tuple = ('Rank', 'Row', 'Strain', 'Stress', 'Confidence')
+    # rolling modulus: the window is a number of rows or a strain distance travelled along the curve
+    rolling_window_units: tuple = ('Points', 'Strain')
+    # plot filter: rows of the segment index phase that are plotted
+    plot_segments: dict = {'All Rows': None, 'Loading Rows': SegmentIndex.LOADING, 'Hold Rows': SegmentIndex.HOLD,
+                           'Unloading Rows': SegmentIndex.UNLOADING}
+    # Oliver-Pharr: geometry constant (epsilon), tip correction (beta), fitted points per unload & table columns
+    oliver_pharr_epsilon: float = 0.75
+    oliver_pharr_beta: float = 1.034
+    oliver_pharr_points: int = 200
+    # fits w/ a lower R^2 are left out of the table
+    oliver_pharr_min_r2: float = 0.9
+    oliver_pharr_columns: tuple = ('Unload', 'Start Row', 'Fit Rows', 'Max Load', 'Max Depth', 'Final Depth', 'Exponent m',
+                                   'Contact Stiffness', 'Contact Depth', 'Reduced Modulus', 'Hardness', 'Fit R^2')
+    # rows shown on each side of a burst when the plot is zoomed onto it from the burst table
+    burst_margin: int = 25
+    # columns of the per-cycle energy table
+    cycle_energy_columns: tuple = ('Cycle', 'Start Row', 'Rows', 'Max Strain', 'Max Stress', 'Loading Energy',
+                                   'Recovered Energy', 'Dissipated Energy')
+    # result_cache: version of the calculations (bump when any calculation changes its output), parameters each
+    # calculation depends on (directly or through the columns it uses) & the results it sets
+    calculation_version: int = 2
+    calculation_parameters: dict = {
+        'engineering_stress': ('load_column', 'specimen_area'),
+        'engineering_strain': ('displacement_column', 'specimen_height'),
+        'true_stress': ('load_column', 'specimen_area', 'displacement_column', 'specimen_height'),
+        'true_strain': ('displacement_column', 'specimen_height'),
+        'yms': ('load_column', 'specimen_area', 'displacement_column', 'specimen_height', 'stress_type', 'strain_type',
+                'strain_start', 'strain_end'),
+        'ymcsm': ('csm_column', 'csm_start', 'csm_end', 'area_conservation', 'volume_conservation', 'specimen_area',
+                  'specimen_height', 'displacement_column'),
+        'sneddon': ('csm_column', 'csm_start', 'csm_end', 'area_conservation', 'volume_conservation', 'specimen_area',
+                    'specimen_height', 'displacement_column', 'poisson_ratio', 'known_elastic_modulus'),
+        'ultimate_failure': ('load_column', 'specimen_area', 'displacement_column', 'specimen_height', 'stress_type',
+                             'strain_type'),
+        'energy_dissipated': ('load_column', 'specimen_area', 'displacement_column', 'specimen_height', 'stress_type',
+                              'strain_type'),
+        'bursts': ('load_column', 'specimen_area', 'displacement_column', 'specimen_height', 'stress_type',
+                   'strain_type'),
+        'energy_cycles': ('load_column', 'specimen_area', 'displacement_column', 'specimen_height', 'stress_type',
+                          'strain_type', 'stress_pascal_unit'),
+        'rolling_modulus': ('load_column', 'specimen_area', 'displacement_column', 'specimen_height', 'stress_type',
+                            'strain_type', 'stress_pascal_unit', 'rolling_window', 'rolling_window_unit')}
+    calculation_outputs: dict = {
+        'engineering_stress': ('stress_pascal_unit',),
+        'engineering_strain': (),
+        'true_stress': (),
+        'true_strain': (),
+        'yms': ('youngs_modulus_value_slope',),
+        'ymcsm': ('youngs_modulus_value_csm', 'csm_pascal_unit'),
+        'sneddon': ('youngs_modulus_value_sneddon', 'sneddon_pascal_unit'),
+        'ultimate_failure': ('ultimate_stress_value', 'ultimate_strain_value', 'failure_row', 'failure_candidates'),
+        'energy_dissipated': ('energy_dissipated_value',),
+        'bursts': ('num_bursts_value', 'toggle_bursts', 'large_diff', 'burst_stress_strain', 'burst_size'),
+        'energy_cycles': ('cycle_energy_table',),
+        'rolling_modulus': ()}
+
+    def __init__(self, parent, csv_index, *args, **kwargs):
+        """
+        function initializes Graph Software class upon creating master parent and selecting a csv file from desktop
+        :param parent: reference to the main frame of the Graph Software class
+        :param args: N/A
+        :param kwargs: N/A
+        """
+        tk.Frame.__init__(self, parent, *args, **kwargs)
+        self.parent = parent
+        self.csv_index = csv_index
+        self.initialize_parameters()
+        self.open_file()
+
+    @classmethod
+    def headless(cls, csv_index):
+        """
+        function creates a Graph Software object w/o any window or widgets so calculations can run outside the GUI
+        (benchmarks, batch processing); parameters are set directly on the returned object
+        :param csv_index: index of the CSV file in data_frames & csv_list
+        :return: Graph Software object w/ default parameters
+        """
+        software = cls.__new__(cls)
+        software.parent = None
+        software.csv_index = csv_index
+        software.initialize_parameters()
+        return software
+
+    def is_headless(self):
+        """
+        function checks whether the sheet has no widgets to update, either because it was created by headless (session
+        load, watched folder, benchmarks) or because its window was dismissed; callers outside the sheet check it
+        before touching entries, checkboxes or outputs
+        :return: True or False
+        """
+        return self.parent is None or self.winfo_exists() == 0
+
+    def initialize_parameters(self):
+        """
+        function sets every calculation parameter, calculation toggle & output value to its default
+        :return: Graph Software parameters at their defaults
+        """
+        self.csm_s: bool = False
+        self.csm_e: bool = False
+        self.ss: bool = False
+        self.se: bool = False
+        self.a: bool = False
+        self.o: bool = False
+        self.l: bool = False
+        self.d: bool = False
+        self.csm: bool = False
+        self.s: bool = False
+        self.h: bool = False
         self.can_export: bool = False
         self.poisson_exists: bool = False
         self.known_elastic_modulus_exists: bool = False
@@ -1362,6 +3926,8 @@ class GraphSoftware(tk.Frame):
         self.ultimate_stress_value: float = 0.0
         self.ultimate_strain_value: float = 0.0
         self.energy_dissipated_value: float = 0.0
+        self.failure_row: int = 0
+        self.failure_candidates: list = []
         self.num_bursts_value: float = 0.0
         self.area_conservation: bool = False
         self.volume_conservation: bool = False
@@ -1375,6 +3941,8 @@ class GraphSoftware(tk.Frame):
         self.compute_uss: bool = False
         self.compute_energy_dissipated: bool = False
         self.compute_bursts: bool = False
+        self.compute_cycle_energy: bool = False
+        self.compute_rolling_modulus: bool = False
         self.abscissa: str = ''
         self.ordinate: str = ''
         self.load_column: str = ''
@@ -1396,10 +3964,54 @@ class GraphSoftware(tk.Frame):
         self.burst_stress_strain: list = []
         self.toggle_bursts: bool = False
         self.burst_size: list = []
+        self.cycle_energy_table: list = []
+        self.cycle_batch_table: list = []
+        self.cycle_batch_units: dict = {}
+        self.cycle_mode: str = 'Arbitrary Displacement Peak'
+        self.unload_fraction: float = 0.5
+        self.area_coefficient: float = 24.5
+        self.oliver_pharr_table: list = []
+        self.oliver_pharr_units: dict = {}
         self.stress_type: str = ''
         self.strain_type: str = ''
         self.type_exists: bool = False
-        self.open_file()
+        self.timing_overlay: bool = False
+        self.plot_segment: str = 'All Rows'
+        self.rolling_window: float = 50.0
+        self.rolling_window_unit: str = 'Points'
+        self.sweep_poisson_start: float = 0.0
+        self.sweep_poisson_end: float = 0.5
+        self.sweep_modulus_start: float = 0.0
+        self.sweep_modulus_end: float = 0.0
+        self.area_uncertainty: float = 0.0
+        self.height_uncertainty: float = 0.0
+        self.uncertainty_distribution: str = 'Normal'
+        self.uncertainty_samples: int = 10000
+        self.uncertainty_results: dict = {}
+        self.apply_filter: bool = False
+        self.filter_method: str = 'Savitzky-Golay'
+        self.filter_window: int = 11
+        self.filter_order: int = 3
+        self.filter_cutoff: float = 0.1
+        self.correct_drift: bool = False
+        self.time_column: str = ''
+        self.hold_tolerance: float = 0.0
+        self.drift_min_rows: int = 10
+        self.zero_at_contact: bool = False
+        self.contact_method: str = 'Piecewise Fit'
+        self.contact_threshold: float = 0.0
+        self.span_sums = None
+        self.span_csm = None
+        self.span_selector = None
+        self.plot_axes = None
+        self.plot_canvas = None
+        self.burst_marker = None
+        self.live_tail = None
+        self.live_interval: int = 500
+        self.live_job = None
+        self.menus_stale: bool = False
+        self.listed_abscissa = None
+        self.listed_ordinate = None
 
     def idle(self):
         """
@@ -1436,6 +4048,7 @@ class GraphSoftware(tk.Frame):
         self.create_button('Calculate True Strain', self.can_compute_true_strain, 5, 10, 1)
         self.create_header("Young's Modulus (Slope Method) ↓", 7, 0, 5)
         self.create_button("Calculate Young's Modulus (Slope)", self.can_compute_yms, 10, 3, 5)
+        self.create_button('Strain Range Sweep', self.strain_sweep_window, 10, 8, 4)
         self.create_header("Young's Modulus (CSM Method) ↓", 12, 0, 5)
         self.create_button("Calculate Young's Modulus (CSM)", self.can_compute_ymcsm, 17, 3, 5)
         self.output_values("Young's Modulus Value (slope):", 11, 0, 4)
@@ -1447,9 +4060,12 @@ class GraphSoftware(tk.Frame):
         self.output_values("Approximated Stress:", 25, 0, 3)
         self.output_values("Approximated Strain:", 26, 0, 3)
         self.create_button("Calculate Ultimate Failure Stress & Strain", self.can_compute_uss, 27, 3, 7)
+        self.create_button("Failure Candidates", self.failure_candidates_window, 26, 8, 4)
         self.create_header("Energy Dissipation ↓", 28, 0, 3)
         self.output_values("Energy dissipated:", 29, 0, 3)
         self.create_button("Calculate Energy Dissipated", self.can_compute_energy_dissipated, 30, 3, 5)
+        self.create_button("Calculate Cycle Energy", self.can_compute_cycle_energy, 30, 8, 4)
+        self.create_button("Cycle Energy Table", self.cycle_energy_window, 29, 8, 4)
         self.create_header("Burst Events ↓", 31, 0, 2)
         self.create_button("Calculate Burst Values", self.can_compute_bursts, 32, 3, 4)
         self.output_values("Number of bursts:", 33, 0, 3)
@@ -1457,6 +4073,46 @@ class GraphSoftware(tk.Frame):
         self.input_domain()
         self.input_range()
         self.scrolling_output()
+        self.check_timing_overlay()
+        self.select_plot_segment()
+        self.cycle_batch_controls()
+        self.input_oliver_pharr()
+        self.input_rolling_modulus()
+        self.input_material_sweep()
+        self.input_geometry_uncertainty()
+        self.input_signal_conditioning()
+        self.input_drift_correction()
+        self.input_contact_detection()
+        self.input_live_tail()
+        dataset_store.subscribe(self.columns_changed)
+
+    def columns_changed(self, n):
+        """
+        function notes that dataset_store reports this sheet's dataset gained or lost columns; the options menus are
+        updated at once when the change comes from the main thread, otherwise on the next refresh or watch poll
+        :param n: nth CSV file whose columns changed
+        :return: updated options menus or sheet marked for updating
+        """
+        if n != self.csv_index:
+            return
+        self.menus_stale = True
+        if threading.current_thread() is threading.main_thread():
+            self.update_menus()
+
+    def update_menus(self):
+        """
+        function updates the 'Select Abscissa' & 'Select Ordinate' options if columns_changed marked them; a closed
+        sheet stops listening
+        :return: updated options menus
+        """
+        if self.menus_stale is False:
+            return
+        self.menus_stale = False
+        if self.is_headless() is True:
+            dataset_store.unsubscribe(self.columns_changed)
+            return
+        self.refresh_abscissa_options()
+        self.refresh_ordinate_options()
 
     def scrolling_output(self):
         """
@@ -1472,20 +4128,46 @@ class GraphSoftware(tk.Frame):
 
     def burst_information(self):
         """
-        function outputs the lower & upper bound stress-strain at bursts, size of bursts, for each burst calculated
-        :return: scrolling frame with information on each burst event in the material
+        function outputs the lower & upper bound stress-strain at bursts, size of bursts, for each burst calculated;
+        the table is created once & handed the new bursts on every refresh
+        :return: virtual table w/ information on each burst event in the material
         """
-        self.bs = Scrollable(self.parent)
-        self.grid_rowconfigure(0, weight=1)
-        self.grid_columnconfigure(0, weight=1)
-        self.bs.grid(row=34, rowspan=10, column=0, columnspan=5, sticky=tk.E)
-        self.hold = self.bs.scrolled_frame
-        for r in range(0, len(self.burst_stress_strain), 4):
-            tk.Label(self.hold, text= str(int(r/4)+1) + ' | Lower Bound').grid(row=int((5/4)*r), column=0, sticky=tk.W)
-            tk.Label(self.hold, text='    Stress (' + self.stress_pascal_unit + '): ' + str(float("{:.3f}".format(self.burst_stress_strain[r]))) + ' Strain: ' + str(float("{:.3f}".format(self.burst_stress_strain[r+1])))).grid(row=int((5/4)*r)+1, sticky=tk.W)
-            tk.Label(self.hold, text='    Upper Bound').grid(row=int((5/4)*r)+2, column=0, sticky=tk.W)
-            tk.Label(self.hold, text='    Stress: (' + self.stress_pascal_unit + '): ' + str(float("{:.3f}".format(self.burst_stress_strain[r+2]))) + ' Strain: ' + str(float("{:.3f}".format(self.burst_stress_strain[r+3])))).grid(row=int((5/4)*r)+3, sticky=tk.W)
-            tk.Label(self.hold, text='    Size (strain range): ' + str(float("{:.3f}".format(self.burst_size[int(r/4)])))).grid(row=int((5/4)*r)+4, sticky=tk.W)
+        try:
+            self.bs.set_bursts(self.burst_stress_strain, self.burst_size, self.stress_pascal_unit)
+        except (AttributeError, tk.TclError):
+            self.bs = BurstTable(self.parent, command=self.show_burst)
+            self.bs.grid(row=34, rowspan=10, column=0, columnspan=5, sticky=tk.E)
+            self.bs.set_bursts(self.burst_stress_strain, self.burst_size, self.stress_pascal_unit)
+
+    def show_burst(self, burst):
+        """
+        function zooms the plot onto a burst (the rows around it) & marks its lower & upper bound points
+        :param burst: burst index (0 for the first burst)
+        :return: plot zoomed onto the burst
+        """
+        if self.a is False or self.o is False:
+            self.create_pop_up('Select Abscissa and Select Ordinate to show a burst on the plot.')
+            return
+        if self.live_tail is not None:
+            self.create_pop_up('Stop the live tail to show a burst on the plot.')
+            return
+        if self.plot_axes is None:
+            self.plot()
+        data = data_frames[self.csv_index]
+        (lower, upper) = (self.large_diff[2 * burst], self.large_diff[2 * burst + 1])
+        rows = data.loc[lower - self.burst_margin:upper + self.burst_margin, [self.abscissa, self.ordinate]]
+        ax = self.plot_axes
+        if self.burst_marker is not None:
+            self.burst_marker.remove()
+        self.burst_marker = ax.scatter(data.loc[[lower, upper], self.abscissa], data.loc[[lower, upper], self.ordinate],
+                                       s=80, facecolors='none', edgecolors='#ff8c00', linewidths=2)
+        limits = []
+        for col_name in (self.abscissa, self.ordinate):
+            (low, high) = (float(rows[col_name].min()), float(rows[col_name].max()))
+            pad = 0.05 * (high - low) if high > low else max(abs(low) * 0.05, 1e-9)
+            limits.append((low - pad, high + pad))
+        ax.set(xlim=limits[0], ylim=limits[1])
+        self.plot_canvas.draw_idle()
 
     def both_selected(self):
         """
@@ -1502,9 +4184,323 @@ class GraphSoftware(tk.Frame):
         functions adds each unit from each column to units_list
         :return: updated units_list
         """
-        if csv_list[self.csv_index] != 'parse':
-            data_frames[self.csv_index] = pd.read_csv(csv_list[self.csv_index])
-        self.unit_storage(data_frames[self.csv_index])
+        if dataset_store.has(self.csv_index) is True:
+            self.units_list.update(dataset_store.stored_units(self.csv_index))
+        else:
+            self.read_file()
+            self.unit_storage(data_frames[self.csv_index])
+
+    def read_file(self):
+        """
+        function re-reads the CSV file behind this Data Calculations sheet from desktop (files produced by cycle
+        parsing only exist in data_frames and are left as is; datasets already cleaned are served by dataset_store)
+        :return: raw DataFrame stored in data_frames
+        """
+        if csv_list[self.csv_index] != 'parse' and dataset_store.has(self.csv_index) is False:
+            with profiler.span('ingest', self.csv_index, path=csv_list[self.csv_index]):
+                data_frames[self.csv_index] = pd.read_csv(csv_list[self.csv_index])
+
+    def load_data(self, calculate: bool = True):
+        """
+        function takes a copy of the cleaned dataset (the first time: reads the CSV file, removes its unit row,
+        re-zeros it and registers it in dataset_store), conditions its load, displacement & CSM columns when a filter
+        or the drift correction or contact zeroing is applied and, if requested, applies every completed calculation
+        to the conditioned columns; the raw columns keep their names & the conditioned ones are added as
+        '<column> (<conditioning steps>)'
+        :param calculate: whether completed calculations are applied through check()
+        :return: processed DataFrame stored in data_frames
+        """
+        self.register_data()
+        data = dataset_store.frame(self.csv_index)
+        raw = self.condition(data)
+        if calculate is True:
+            data = self.check(data)
+        for col_name in raw:
+            data[self.conditioned_name(col_name)] = data[col_name]
+            data[col_name] = raw[col_name]
+        data_frames[self.csv_index] = dataset_store.compact(self.csv_index, data)
+        if calculate is True or len(raw) > 0:
+            dataset_store.update_units(self.csv_index, self.units_list)
+        dataset_store.publish(self.csv_index, data.columns, self.units_list)
+        return data_frames[self.csv_index]
+
+    def listed_columns(self):
+        """
+        function lists the columns of this sheet's dataset as last published to dataset_store (raw columns once the
+        dataset is registered, calculated columns after each calculation) w/o reading or recalculating the data
+        :return: column name -> unit
+        """
+        self.register_data()
+        return dataset_store.listed_columns(self.csv_index)
+
+    def register_data(self):
+        """
+        function reads the CSV file, removes its unit row, re-zeros it and registers it in dataset_store the first
+        time the dataset is needed
+        :return: cleaned dataset registered
+        """
+        if dataset_store.has(self.csv_index) is False:
+            self.read_file()
+            data = self.reindex(data_frames[self.csv_index])
+            offsets = dataset_store.zero_offsets(data)
+            data = self.re_zero(data)
+            dataset_store.register(self.csv_index, data, self.units_list, offsets=offsets)
+
+    def signal_conditioner(self):
+        """
+        function gives the filter applied to this sheet's load, displacement & CSM columns
+        :return: SignalConditioner ('None' method if no filter is applied)
+        """
+        return SignalConditioner(self.filter_method if self.apply_filter is True else 'None', self.filter_window,
+                                 self.filter_order, self.filter_cutoff)
+
+    def drift_correction(self):
+        """
+        function returns the thermal drift correction of this sheet's dataset (holds found in the load column)
+        :return: DriftCorrection
+        """
+        self.register_data()
+        return dataset_store.drift(self.csv_index, self.time_column, self.load_column, self.displacement_column,
+                                   self.hold_tolerance, self.drift_min_rows)
+
+    def contact_detection(self):
+        """
+        function returns the contact point of this sheet's dataset (first contact on the load-displacement curve)
+        :return: ContactDetector
+        """
+        self.register_data()
+        return dataset_store.contact(self.csv_index, self.load_column, self.displacement_column, self.contact_method,
+                                     self.contact_threshold)
+
+    def conditioning_steps(self, col_name):
+        """
+        function lists the conditioning steps applied to a raw column, in the order they are applied
+        :param col_name: raw column name
+        :return: 'Filtered', 'Drift Corrected', 'Contact Zeroed' and/or 'As Measured' (CSM un-shifted)
+        """
+        steps = []
+        if self.apply_filter is True and ((self.l is True and col_name == self.load_column) or
+                                          (self.d is True and col_name == self.displacement_column) or
+                                          (self.csm is True and col_name == self.csm_column)):
+            steps.append('Filtered')
+        if self.correct_drift is True and self.d is True and col_name == self.displacement_column:
+            steps.append('Drift Corrected')
+        if self.zero_at_contact is True and self.l is True and self.d is True:
+            if col_name in (self.load_column, self.displacement_column):
+                steps.append('Contact Zeroed')
+            elif self.csm is True and col_name == self.csm_column:
+                steps.append('As Measured')
+        return steps
+
+    def conditioned_columns(self):
+        """
+        function lists the selected load, displacement & CSM columns that are filtered, drift corrected or zeroed at
+        the contact point
+        :return: column names (empty if no conditioning is applied)
+        """
+        columns = []
+        for col_name in (self.load_column, self.displacement_column, self.csm_column):
+            if col_name not in columns and len(self.conditioning_steps(col_name)) > 0:
+                columns.append(col_name)
+        return columns
+
+    def conditioned_name(self, col_name):
+        """
+        function names the column holding the conditioned values of a raw column
+        :param col_name: raw column name
+        :return: '<column> (<steps>)', e.g. 'Displacement (Filtered, Drift Corrected)'
+        """
+        return col_name + ' (' + ', '.join(self.conditioning_steps(col_name)) + ')'
+
+    def conditioned_values(self, col_name):
+        """
+        function filters a raw column (memoized per dataset & filter settings in dataset_store), subtracts the thermal
+        drift from the displacement column and zeros the load & displacement at the contact point (the CSM column gets
+        back the shift re-zeroing removed)
+        :param col_name: load, displacement or CSM column
+        :return: conditioned values
+        """
+        steps = self.conditioning_steps(col_name)
+        if 'Filtered' in steps:
+            values = dataset_store.conditioned(self.csv_index, col_name, self.signal_conditioner())
+        else:
+            values = dataset_store.stored(self.csv_index)[col_name].to_numpy(dtype='float64')
+        if 'Drift Corrected' in steps:
+            values = values - self.drift_correction().drift
+        if 'Contact Zeroed' in steps:
+            values = values - values[self.contact_detection().row]
+        if 'As Measured' in steps:
+            values = values + dataset_store.stored_offsets(self.csv_index).get(col_name, 0.0)
+        return values
+
+    def condition(self, data: {}):
+        """
+        function replaces the load, displacement & CSM columns of the data w/ their conditioned values
+        :param data: copy of the cleaned dataset
+        :return: raw values of the replaced columns
+        """
+        raw = {}
+        for col_name in self.conditioned_columns():
+            raw[col_name] = data[col_name].to_numpy(dtype='float64')
+            data[col_name] = self.conditioned_values(col_name)
+            self.units_list[self.conditioned_name(col_name)] = self.units_list.get(col_name, 'null')
+        return raw
+
+    def input_values(self, col_name):
+        """
+        function returns a raw column of this sheet's dataset as the calculations see it (filtered or drift corrected
+        if it is a conditioned column)
+        :param col_name: column name
+        :return: column values
+        """
+        self.register_data()
+        if col_name in self.conditioned_columns():
+            return self.conditioned_values(col_name)
+        return dataset_store.stored(self.csv_index)[col_name].to_numpy(dtype='float64')
+
+    def segment_index(self, col_name):
+        """
+        function returns the shared segment index (loading/hold/unloading rows, cycles & segment boundaries) of a raw
+        column of this sheet's dataset
+        :param col_name: displacement or load column
+        :return: SegmentIndex
+        """
+        self.register_data()
+        return dataset_store.segments(self.csv_index, col_name)
+
+    def snapshot_state(self):
+        """
+        function collects the parameters, calculation toggles, units & results of this Data Calculations sheet
+        :return: dictionary of scalar values & dictionary of result arrays
+        """
+        state = {}
+        for name in self.state_attributes:
+            value = getattr(self, name)
+            state[name] = value.item() if isinstance(value, np.generic) else value
+        state['units_list'] = {i: str(self.units_list[i]) for i in self.units_list}
+        arrays = {name: np.asarray(getattr(self, name)) for name in self.state_arrays}
+        return state, arrays
+
+    def template_state(self):
+        """
+        function collects the parameters & calculation toggles of this Data Calculations sheet w/o its results, so they
+        can be applied to other datasets of the same kind
+        :return: dictionary of scalar values
+        """
+        (state, arrays) = self.snapshot_state()
+        return {name: state[name] for name in self.state_attributes if name not in self.result_attributes}
+
+    def restore_state(self, state: dict, arrays: dict):
+        """
+        function restores parameters, calculation toggles, units & results collected by snapshot_state w/o
+        recalculating anything; an open sheet also gets its entries, menus, checkboxes & outputs filled in
+        :param state: dictionary of scalar values
+        :param arrays: dictionary of result arrays
+        :return: restored Data Calculations sheet
+        """
+        for name in self.state_attributes:
+            if name in state:
+                setattr(self, name, state[name])
+        self.units_list.update(state.get('units_list', {}))
+        for name in self.state_arrays:
+            if name in arrays:
+                setattr(self, name, np.asarray(arrays[name]).tolist())
+        if self.is_headless() is False:
+            self.restore_widgets()
+
+    def restore_widgets(self):
+        """
+        function fills the entries, option menus & checkboxes of the sheet w/ the current parameters and displays
+        the completed calculations
+        :return: updated software GUI
+        """
+        entries = ((self.s, self.user_input_area, self.specimen_area),
+                   (self.h, self.user_input_height, self.specimen_height),
+                   (self.ss, self.user_input_strain_s, self.strain_start),
+                   (self.se, self.user_input_strain_e, self.strain_end),
+                   (self.csm_s, self.user_input_csm_s, self.csm_start),
+                   (self.csm_e, self.user_input_csm_e, self.csm_end),
+                   (self.poisson_exists, self.user_input_poisson, self.poisson_ratio),
+                   (self.known_elastic_modulus_exists, self.user_input_known_elastic_modulus, self.known_elastic_modulus),
+                   (self.xmin_exists, self.user_input_xmin, self.xmin_value),
+                   (self.xmax_exists, self.user_input_xmax, self.xmax_value),
+                   (self.ymin_exists, self.user_input_ymin, self.ymin_value),
+                   (self.ymax_exists, self.user_input_ymax, self.ymax_value))
+        for (exists, entry, value) in entries:
+            if exists is True:
+                entry.delete(0, tk.END)
+                entry.insert(0, str(value))
+        menus = ((self.l, self.clicked_load_button, self.load_column),
+                 (self.d, self.clicked_displacement_button, self.displacement_column),
+                 (self.csm, self.clicked_csm_button, self.csm_column),
+                 (self.a, self.clicked_abscissa_button, self.abscissa),
+                 (self.o, self.clicked_ordinate_button, self.ordinate))
+        for (exists, clicked, value) in menus:
+            if exists is True:
+                clicked.set(value)
+        self.clicked_cycle_mode.set(self.cycle_mode)
+        self.clicked_plot_segment.set(self.plot_segment)
+        self.clicked_rolling_window_unit.set(self.rolling_window_unit)
+        self.clicked_uncertainty_distribution.set(self.uncertainty_distribution)
+        self.clicked_filter_method.set(self.filter_method)
+        self.clicked_time_column.set(self.time_column if self.time_column != '' else 'Row Number')
+        self.drift_select.set(1 if self.correct_drift is True else 0)
+        self.clicked_contact_method.set(self.contact_method)
+        self.contact_select.set(1 if self.zero_at_contact is True else 0)
+        for (entry, value) in ((self.user_input_unload_fraction, self.unload_fraction),
+                               (self.user_input_area_coefficient, self.area_coefficient),
+                               (self.user_input_rolling_window, self.rolling_window),
+                               (self.user_input_sweep_poisson_s, self.sweep_poisson_start),
+                               (self.user_input_sweep_poisson_e, self.sweep_poisson_end),
+                               (self.user_input_sweep_modulus_s, self.sweep_modulus_start),
+                               (self.user_input_sweep_modulus_e, self.sweep_modulus_end),
+                               (self.user_input_area_uncertainty, self.area_uncertainty),
+                               (self.user_input_height_uncertainty, self.height_uncertainty),
+                               (self.user_input_uncertainty_samples, self.uncertainty_samples),
+                               (self.user_input_filter_window, self.filter_window),
+                               (self.user_input_filter_order, self.filter_order),
+                               (self.user_input_filter_cutoff, self.filter_cutoff),
+                               (self.user_input_hold_tolerance, self.hold_tolerance),
+                               (self.user_input_drift_min_rows, self.drift_min_rows),
+                               (self.user_input_contact_threshold, self.contact_threshold)):
+            entry.delete(0, tk.END)
+            entry.insert(0, str(value))
+        self.area_select.set(1 if self.area_conservation is True else 0)
+        self.volume_select.set(1 if self.volume_conservation is True else 0)
+        if self.type_exists is True:
+            self.engineering_select.set(1 if self.stress_type == 'Stress (Engineering)' else 0)
+            self.true_select.set(1 if self.stress_type == 'Stress (True)' else 0)
+        if self.compute_yms is True:
+            self.display_yms_value()
+        if self.compute_ymcsm is True:
+            self.display_ymcsm_value()
+        if self.compute_sneddon is True:
+            self.display_ymsneddon_value()
+        if self.compute_energy_dissipated is True:
+            self.display_energy_dissipated_value()
+        if self.compute_bursts is True:
+            self.display_num_bursts_value()
+            self.sbf.destroy()
+            self.burst_information()
+        if self.compute_uss is True:
+            self.display_uss_value()
+        if len(self.uncertainty_results) > 0:
+            self.display_uncertainty()
+        if self.correct_drift is True:
+            self.display_drift()
+        if self.zero_at_contact is True:
+            self.display_contact()
+
+    def conservation_mode(self):
+        """
+        function names the conservation assumption currently selected for the CSM & Sneddon calculations
+        :return: 'area', 'volume' or '' when neither is selected
+        """
+        if self.area_conservation is True:
+            return 'area'
+        if self.volume_conservation is True:
+            return 'volume'
+        return ''
 
     def unit_storage(self, data: {}):
         """
@@ -1531,13 +4527,14 @@ class GraphSoftware(tk.Frame):
         :param data: csv data file user selects from desktop
         :return: data converted to float64 values where each column has its 0th row index removed
         """
-        data = data.loc[data.index > 0]
-        data = data.reset_index(drop=True)
-        for col_name in data.columns:
-            try:
-                data[col_name] = data[col_name].astype('float64')
-            except ValueError:
-                data[col_name] = None
+        with profiler.span('reindex', self.csv_index, len(data)):
+            data = data.loc[data.index > 0]
+            data = data.reset_index(drop=True)
+            for col_name in data.columns:
+                try:
+                    data[col_name] = data[col_name].astype('float64')
+                except ValueError:
+                    data[col_name] = None
         return data
 
     def re_zero(self, data: {}):
@@ -1547,12 +4544,13 @@ class GraphSoftware(tk.Frame):
         :param data: csv data file user selects from desktop
         :return: data shifted to a new zero value
         """
-        for i in data.columns:
-            column_edge = data[i].min()
-            if column_edge >= 0:
-                data[i] = data[i] - column_edge
-            elif column_edge < 0:
-                data[i] = data[i] + abs(column_edge)
+        with profiler.span('re_zero', self.csv_index, len(data)):
+            for i in data.columns:
+                column_edge = data[i].min()
+                if column_edge >= 0:
+                    data[i] = data[i] - column_edge
+                elif column_edge < 0:
+                    data[i] = data[i] + abs(column_edge)
         return data
 
     def engineering_stress(self, data: {}):
@@ -1564,39 +4562,37 @@ class GraphSoftware(tk.Frame):
         :return: new graphable data column called Stress (Engineerning) and auto-calculated corresponding unit (_Pa)
         appended to units_list
         """
-        start = time.time()
-        data['Stress (Engineering)'] = data[self.load_column] / self.specimen_area * 1000000000000000
-        data['Stress (Engineering)'].astype('float64')
-        n = data['Stress (Engineering)'].mean()
+        with profiler.span('engineering_stress', self.csv_index, len(data), load=self.load_column, area=self.specimen_area):
+            data['Stress (Engineering)'] = data[self.load_column] / self.specimen_area * 1000000000000000
+            data['Stress (Engineering)'].astype('float64')
+            n = data['Stress (Engineering)'].mean()
 
-        if n > 0.0:
-            log_value = int(math.log10(n))
-        elif n == 0.0:
-            log_value = 0.0
-        else:
-            log_value = int(math.log10(-n)) + 1
-
-        if 0 <= log_value <= 1:
-            self.stress_pascal_unit = 'Pa'
-        elif 2 <= log_value <= 4:
-            data['Stress (Engineering)'] = data['Stress (Engineering)'] / 1000
-            self.stress_pascal_unit = 'kPa'
-        elif 5 <= log_value <= 7:
-            data['Stress (Engineering)'] = data['Stress (Engineering)'] / 1000000
-            self.stress_pascal_unit = 'MPa'
-        elif 8 <= log_value <= 10:
-            data['Stress (Engineering)'] = data['Stress (Engineering)'] / 1000000000
-            self.stress_pascal_unit = 'GPa'
-        elif 11 <= log_value <= 13:
-            data['Stress (Engineering)'] = data['Stress (Engineering)'] / 1000000000000
-            self.stress_pascal_unit = 'TPa'
-        else:
-            data['Stress (Engineering)'] = data['Stress (Engineering)'] / 1000000000000000
-            self.stress_pascal_unit = 'PPa'
+            if n > 0.0:
+                log_value = int(math.log10(n))
+            elif n == 0.0:
+                log_value = 0.0
+            else:
+                log_value = int(math.log10(-n)) + 1
+
+            if 0 <= log_value <= 1:
+                self.stress_pascal_unit = 'Pa'
+            elif 2 <= log_value <= 4:
+                data['Stress (Engineering)'] = data['Stress (Engineering)'] / 1000
+                self.stress_pascal_unit = 'kPa'
+            elif 5 <= log_value <= 7:
+                data['Stress (Engineering)'] = data['Stress (Engineering)'] / 1000000
+                self.stress_pascal_unit = 'MPa'
+            elif 8 <= log_value <= 10:
+                data['Stress (Engineering)'] = data['Stress (Engineering)'] / 1000000000
+                self.stress_pascal_unit = 'GPa'
+            elif 11 <= log_value <= 13:
+                data['Stress (Engineering)'] = data['Stress (Engineering)'] / 1000000000000
+                self.stress_pascal_unit = 'TPa'
+            else:
+                data['Stress (Engineering)'] = data['Stress (Engineering)'] / 1000000000000000
+                self.stress_pascal_unit = 'PPa'
 
-        self.units_list[data.columns[len(data.columns) - 1].format(len(data.columns) - 1)] = self.stress_pascal_unit
-        end = time.time()
-        print('Engineering stress time: ' + str(end-start))
+            self.units_list[data.columns[len(data.columns) - 1].format(len(data.columns) - 1)] = self.stress_pascal_unit
         return data
 
     def true_stress(self, data: {}):
@@ -1606,12 +4602,10 @@ class GraphSoftware(tk.Frame):
         :param data: csv data file user selects from desktop
         :return: new graphable data column called Stress (True) and and _Pa appended to units_list
         """
-        start = time.time()
-        data['Stress (True)'] = data['Stress (Engineering)'] * (
-                (self.specimen_height + data[self.displacement_column]) / self.specimen_height)
-        self.units_list[data.columns[len(data.columns) - 1].format(len(data.columns) - 1)] = self.stress_pascal_unit
-        end = time.time()
-        print('True stress time: ' + str(end-start))
+        with profiler.span('true_stress', self.csv_index, len(data), displacement=self.displacement_column, height=self.specimen_height):
+            data['Stress (True)'] = data['Stress (Engineering)'] * (
+                    (self.specimen_height + data[self.displacement_column]) / self.specimen_height)
+            self.units_list[data.columns[len(data.columns) - 1].format(len(data.columns) - 1)] = self.stress_pascal_unit
         return data
 
     def engineering_strain(self, data: {}):
@@ -1623,12 +4617,10 @@ class GraphSoftware(tk.Frame):
         :return: new graphable data column called Strain (Engineering) and % appended to units_list
         """
         # TODO: figure out why strain calculation is off by a decimal (e.g. should be 0.05 but get 0.5)
-        start = time.time()
-        data['Strain (Engineering)'] = data[self.displacement_column] / self.specimen_height
-        data['Strain (Engineering)'].astype('float64')
-        self.units_list[data.columns[len(data.columns) - 1].format(len(data.columns) - 1)] = ''
-        end = time.time()
-        print('Engineering strain time: ' + str(end-start))
+        with profiler.span('engineering_strain', self.csv_index, len(data), displacement=self.displacement_column, height=self.specimen_height):
+            data['Strain (Engineering)'] = data[self.displacement_column] / self.specimen_height
+            data['Strain (Engineering)'].astype('float64')
+            self.units_list[data.columns[len(data.columns) - 1].format(len(data.columns) - 1)] = ''
         return data
 
     def true_strain(self, data: {}):
@@ -1639,73 +4631,30 @@ class GraphSoftware(tk.Frame):
         :param data: csv data file user selects from desktop
         :return: new graphable data column called Strain (True) and % appended to units_list
         """
-        start = time.time()
-        data['Strain (True)'] = np.log((self.specimen_height + data[self.displacement_column]) / self.specimen_height)
-        self.units_list[data.columns[len(data.columns) - 1].format(len(data.columns) - 1)] = ''
-        end = time.time()
-        print('True strain time: ' + str(end-start))
+        with profiler.span('true_strain', self.csv_index, len(data), displacement=self.displacement_column, height=self.specimen_height):
+            data['Strain (True)'] = np.log((self.specimen_height + data[self.displacement_column]) / self.specimen_height)
+            self.units_list[data.columns[len(data.columns) - 1].format(len(data.columns) - 1)] = ''
         return data
 
-    def ultimate_stress(self, data: {}):
+    def ultimate_failure(self, data: {}):
         """
-        function essentially checks size of differences between each strain data point, and finds the index of the
-        first difference that meets criteria for a large enough difference to result in failure of the material
+        function finds the failure point of the material as the change point inside a loading stretch of the
+        displacement's segment index where the strain increments jump up the most while the stress per strain drops
+        (FailureDetector, one pass shared by the stress & strain outputs) and ranks the other candidates
         :param data: csv data file user selects from desktop
-        :return: ultimate stress value in _Pa
-        """
-        '''
-        idx = data[self.strain_type].diff().idxmax() - 1
-        self.ultimate_stress_value = data['Stress (Engineering)'][idx]
-        temp_arr = data[self.strain_type].diff()
-        idx = temp_arr.index[temp_arr >= 2 * temp_arr.mean()]
-        self.ultimate_stress_value = data['Stress (Engineering)'][idx[0]]
-        '''
-        start = time.time()
-        def shift(a):
-            a_r = np.roll(a, 1)  # right shift
-            a_l = np.roll(a, -1)  # left shift
-            return np.stack([a_l, a_r], axis=1)
-
-        z = np.array(data[self.strain_type])
-        diff = abs(shift(z) - z.reshape(-1, 1))
-        diff = diff[1:-1]
-        indices = diff.argmax(axis=0) - 2
-        self.ultimate_stress_value = data[self.stress_type][indices[0]]
-        end = time.time()
-        print('Stress at failure time: ' + str(end-start))
-        return data
-
-    def ultimate_strain(self, data: {}):
-        """
-        function essentially checks size of differences between each strain data point, and finds the index of the
-        first difference that meets criteria for a large enough difference to result in failure of the material
-        :param data: csv data file user selects from desktop
-        :return: ultimate strain value (fractional)
-        """
-        '''
-        idx = data[self.strain_type].diff().idxmax() - 1
-        self.ultimate_strain_value = data[self.strain_type][idx]
-        temp_arr = data[self.strain_type].diff()
-        idx = temp_arr.index[temp_arr >= 2 * temp_arr.mean()]
-        self.ultimate_strain_value = data[self.strain_type][idx[0]]
-        differences = data[self.strain_type].diff(-1).abs()
-        kmeans = KMeans(n_clusters=5).fit(differences.values[:-1].reshape(-1, 1))
-        clusters = pd.Series(kmeans.labels_, index=differences.index[:-1])
-        idx = clusters.index[clusters.eq(np.squeeze(kmeans.cluster_centers_).argmax())]
-        '''
-        start = time.time()
-        def shift(a):
-            a_r = np.roll(a, 1)  # right shift
-            a_l = np.roll(a, -1)  # left shift
-            return np.stack([a_l, a_r], axis=1)
-
-        z = np.array(data[self.strain_type])
-        diff = abs(shift(z) - z.reshape(-1, 1))
-        diff = diff[1:-1]
-        indices = diff.argmax(axis=0) - 2
-        self.ultimate_strain_value = data[self.strain_type][indices[0]]
-        end = time.time()
-        print('Strain at failure time: ' + str(end-start))
+        :return: ultimate stress value in _Pa, ultimate strain value (fractional) & ranked failure candidates
+        """
+        with profiler.span('ultimate_failure', self.csv_index, len(data), stress=self.stress_type, strain=self.strain_type):
+            strain = data[self.strain_type].to_numpy(dtype='float64')
+            stress = data[self.stress_type].to_numpy(dtype='float64')
+            direction = self.segment_index(self.displacement_column).direction
+            detector = FailureDetector(strain, self.failure_candidate_count, stress=stress,
+                                       direction=direction if len(direction) == len(strain) else None)
+            self.failure_row = detector.failure_row
+            self.ultimate_stress_value = float(stress[self.failure_row])
+            self.ultimate_strain_value = float(strain[self.failure_row])
+            self.failure_candidates = [[rank + 1, int(row), float(strain[row]), float(stress[row]), float(confidence)]
+                                       for (rank, (row, confidence)) in enumerate(zip(detector.rows, detector.confidence))]
         return data
 
     def yms(self, data: {}):
@@ -1722,27 +4671,25 @@ class GraphSoftware(tk.Frame):
         s1 = data[self.strain_type][data[self.strain_type]==self.strain_start].index
         s2 = data[self.strain_type][data[self.strain_type]==self.strain_end].index
         '''
-        start = time.time()
-        s1i = min(data[self.strain_type], key=lambda x:abs(x-self.strain_start))
-        s2i = min(data[self.strain_type], key=lambda x:abs(x-self.strain_end))
-        s1 = data[self.strain_type][data[self.strain_type] == s1i].index
-        s2 = data[self.strain_type][data[self.strain_type] == s2i].index
-        self.youngs_modulus_value_slope = (data[self.stress_type][s2[0]] - data[self.stress_type][s1[0]]) / (data[self.strain_type][s2[0]] - data[self.strain_type][s1[0]])
-        '''
-        data.loc[
-            (data[self.strain_type]).between(self.strain_start, self.strain_end,
-                                                  inclusive=True), "Young's Modulus (Slope)"] = \
-            data[self.stress_type] / data[self.strain_type]
-        temp = data[data["Young's Modulus (Slope)"].notna()]
-        self.youngs_modulus_value_slope = temp["Young's Modulus (Slope)"].mean()
-        try:
-            data["Young's Modulus (Slope)"] = data["Young's Modulus (Slope)"].astype('float64')
-        except ValueError:
-            data["Young's Modulus (Slope)"] = None
-        '''
-        self.units_list[data.columns[len(data.columns) - 1].format(len(data.columns) - 1)] = self.stress_pascal_unit
-        end = time.time()
-        print('Elastic modulus (slope) time: ' + str(end-start))
+        with profiler.span('yms', self.csv_index, len(data), strain=self.strain_type, strain_start=self.strain_start, strain_end=self.strain_end):
+            s1i = min(data[self.strain_type], key=lambda x:abs(x-self.strain_start))
+            s2i = min(data[self.strain_type], key=lambda x:abs(x-self.strain_end))
+            s1 = data[self.strain_type][data[self.strain_type] == s1i].index
+            s2 = data[self.strain_type][data[self.strain_type] == s2i].index
+            self.youngs_modulus_value_slope = (data[self.stress_type][s2[0]] - data[self.stress_type][s1[0]]) / (data[self.strain_type][s2[0]] - data[self.strain_type][s1[0]])
+            '''
+            data.loc[
+                (data[self.strain_type]).between(self.strain_start, self.strain_end,
+                                                      inclusive=True), "Young's Modulus (Slope)"] = \
+                data[self.stress_type] / data[self.strain_type]
+            temp = data[data["Young's Modulus (Slope)"].notna()]
+            self.youngs_modulus_value_slope = temp["Young's Modulus (Slope)"].mean()
+            try:
+                data["Young's Modulus (Slope)"] = data["Young's Modulus (Slope)"].astype('float64')
+            except ValueError:
+                data["Young's Modulus (Slope)"] = None
+            '''
+            self.units_list[data.columns[len(data.columns) - 1].format(len(data.columns) - 1)] = self.stress_pascal_unit
         return data
 
     def ymcsm(self, data: {}):
@@ -1757,61 +4704,60 @@ class GraphSoftware(tk.Frame):
         :param data: csv data file user selects from desktop
         :return: Young's modulus value (CSM method)
         """
-        start = time.time()
-        if self.volume_conservation is True:
-            data.loc[(data[self.csm_column]).between(self.csm_start, self.csm_end, inclusive=True), "Young's Modulus (CSM)"] = data[
-                                                                                                                    self.csm_column] * (
-                                                                                                                            (
-                                                                                                                                        self.specimen_height +
-                                                                                                                                        data[
-                                                                                                                                            self.displacement_column]) ** 2) / (
-                                                                                                                            self.specimen_area * self.specimen_height) * 1000000000
-        elif self.area_conservation is True:
-            data.loc[(data[self.csm_column]).between(self.csm_start, self.csm_end, inclusive=True), "Young's Modulus (CSM)"] = data[
-                                                                                                                    self.csm_column] * (
-                                                                                                                            self.specimen_height +
-                                                                                                                            data[
-                                                                                                                                self.displacement_column]) / self.specimen_area * 1000000000
-
-        first_temp = data[data["Young's Modulus (CSM)"].notna()]
-        c = first_temp["Young's Modulus (CSM)"].mean()
-        if math.isnan(c) is True:
-            c = 0.0
-
-        if c > 0.0:
-            log_value_csm = int(math.log10(c))
-        elif c == 0.0:
-            log_value_csm = 0.0
-        else:
-            log_value_csm = int(math.log10(-c)) + 1
-
-        if 0 <= log_value_csm <= 1:
-            self.csm_pascal_unit = 'Pa'
-        elif 2 <= log_value_csm <= 4:
-            data["Young's Modulus (CSM)"] = data["Young's Modulus (CSM)"] / 1000
-            self.csm_pascal_unit = 'kPa'
-        elif 5 <= log_value_csm <= 7:
-            data["Young's Modulus (CSM)"] = data["Young's Modulus (CSM)"] / 1000000
-            self.csm_pascal_unit = 'MPa'
-        elif 8 <= log_value_csm <= 10:
-            data["Young's Modulus (CSM)"] = data["Young's Modulus (CSM)"] / 1000000000
-            self.csm_pascal_unit = 'GPa'
-        elif 11 <= log_value_csm <= 13:
-            data["Young's Modulus (CSM)"] = data["Young's Modulus (CSM)"] / 1000000000000
-            self.csm_pascal_unit = 'TPa'
-        else:
-            data["Young's Modulus (CSM)"] = data["Young's Modulus (CSM)"] / 1000000000000000
-            self.csm_pascal_unit = 'PPa'
+        with profiler.span('ymcsm', self.csv_index, len(data), csm=self.csm_column, csm_start=self.csm_start, csm_end=self.csm_end,
+                           conservation=self.conservation_mode()):
+            if self.volume_conservation is True:
+                data.loc[(data[self.csm_column]).between(self.csm_start, self.csm_end, inclusive=True), "Young's Modulus (CSM)"] = data[
+                                                                                                                        self.csm_column] * (
+                                                                                                                                (
+                                                                                                                                            self.specimen_height +
+                                                                                                                                            data[
+                                                                                                                                                self.displacement_column]) ** 2) / (
+                                                                                                                                self.specimen_area * self.specimen_height) * 1000000000
+            elif self.area_conservation is True:
+                data.loc[(data[self.csm_column]).between(self.csm_start, self.csm_end, inclusive=True), "Young's Modulus (CSM)"] = data[
+                                                                                                                        self.csm_column] * (
+                                                                                                                                self.specimen_height +
+                                                                                                                                data[
+                                                                                                                                    self.displacement_column]) / self.specimen_area * 1000000000
+
+            first_temp = data[data["Young's Modulus (CSM)"].notna()]
+            c = first_temp["Young's Modulus (CSM)"].mean()
+            if math.isnan(c) is True:
+                c = 0.0
+
+            if c > 0.0:
+                log_value_csm = int(math.log10(c))
+            elif c == 0.0:
+                log_value_csm = 0.0
+            else:
+                log_value_csm = int(math.log10(-c)) + 1
+
+            if 0 <= log_value_csm <= 1:
+                self.csm_pascal_unit = 'Pa'
+            elif 2 <= log_value_csm <= 4:
+                data["Young's Modulus (CSM)"] = data["Young's Modulus (CSM)"] / 1000
+                self.csm_pascal_unit = 'kPa'
+            elif 5 <= log_value_csm <= 7:
+                data["Young's Modulus (CSM)"] = data["Young's Modulus (CSM)"] / 1000000
+                self.csm_pascal_unit = 'MPa'
+            elif 8 <= log_value_csm <= 10:
+                data["Young's Modulus (CSM)"] = data["Young's Modulus (CSM)"] / 1000000000
+                self.csm_pascal_unit = 'GPa'
+            elif 11 <= log_value_csm <= 13:
+                data["Young's Modulus (CSM)"] = data["Young's Modulus (CSM)"] / 1000000000000
+                self.csm_pascal_unit = 'TPa'
+            else:
+                data["Young's Modulus (CSM)"] = data["Young's Modulus (CSM)"] / 1000000000000000
+                self.csm_pascal_unit = 'PPa'
 
-        last_temp = data[data["Young's Modulus (CSM)"].notna()]
-        self.youngs_modulus_value_csm = last_temp["Young's Modulus (CSM)"].mean()
-        try:
-            data["Young's Modulus (CSM)"] = data["Young's Modulus (CSM)"].astype('float64')
-        except ValueError:
-            data["Young's Modulus (CSM"] = None
-        self.units_list[data.columns[len(data.columns) - 1].format(len(data.columns) - 1)] = self.csm_pascal_unit
-        end = time.time()
-        print('Elastic modulus (CSM) time: ' + str(end-start))
+            last_temp = data[data["Young's Modulus (CSM)"].notna()]
+            self.youngs_modulus_value_csm = last_temp["Young's Modulus (CSM)"].mean()
+            try:
+                data["Young's Modulus (CSM)"] = data["Young's Modulus (CSM)"].astype('float64')
+            except ValueError:
+                data["Young's Modulus (CSM"] = None
+            self.units_list[data.columns[len(data.columns) - 1].format(len(data.columns) - 1)] = self.csm_pascal_unit
         return data
 
     def sneddon(self, data: {}):
@@ -1828,76 +4774,75 @@ class GraphSoftware(tk.Frame):
         :param data: csv data file user selects from desktop
         :return: Young's modulus w/ Sneddon's correction
         """
-        start = time.time()
-        if self.volume_conservation is True:
-            partial_compliance_sneddon = (math.sqrt(math.pi) * (1 - (self.poisson_ratio ** 2))) / (2 * self.known_elastic_modulus)
-            data["Sneddon's correction to CSM (volume conservation)"] = np.reciprocal(
-                np.reciprocal(data[self.csm_column]) - (partial_compliance_sneddon / np.sqrt(
-                    (self.specimen_area * self.specimen_height) / (self.specimen_height + data[self.displacement_column]))))
-            self.units_list[data.columns[len(data.columns) - 1].format(len(data.columns) - 1)] = 'N/m'
-            data.loc[(data[self.csm_column]).between(self.csm_start, self.csm_end,
-                                                inclusive=True), "Young's Modulus (CSM w/ Sneddon's correction)"] = \
-            data["Sneddon's correction to CSM (volume conservation)"] * (
-                        (self.specimen_height + data[self.displacement_column]) ** 2) / (
-                        self.specimen_area * self.specimen_height) * 1000000000
-        elif self.area_conservation is True:
-            area = self.specimen_area
-            compliance_sneddon = (math.sqrt(math.pi) * (1 - (self.poisson_ratio ** 2))) / (
-                        2 * self.known_elastic_modulus * math.sqrt(area))
-            data["Sneddon's correction to CSM (area conservation)"] = np.reciprocal(
-                np.reciprocal(data[self.csm_column]) - compliance_sneddon)
-            self.units_list[data.columns[len(data.columns) - 1].format(len(data.columns) - 1)] = 'N/m'
-            data.loc[(data[self.csm_column]).between(self.csm_start, self.csm_end,
-                                                inclusive=True), "Young's Modulus (CSM w/ Sneddon's correction)"] = \
-            data["Sneddon's correction to CSM (area conservation)"] * (
-                        self.specimen_height + data[self.displacement_column]) / self.specimen_area * 1000000000
-
-        first_sneddon_temp = data[data["Young's Modulus (CSM w/ Sneddon's correction)"].notna()]
-        c2 = first_sneddon_temp["Young's Modulus (CSM w/ Sneddon's correction)"].mean()
-
-        if math.isnan(c2) is True:
-            c2 = 0.0
-
-        if c2 > 0.0:
-            log_value_sneddon = int(math.log10(c2))
-        elif c2 == 0.0:
-            log_value_sneddon = 0.0
-        else:
-            log_value_sneddon = int(math.log10(-c2)) + 1
-
-        if 0 <= log_value_sneddon <= 1:
-            self.sneddon_pascal_unit = 'Pa'
-        elif 2 <= log_value_sneddon <= 4:
-            data["Young's Modulus (CSM w/ Sneddon's correction)"] = data[
-                                                                        "Young's Modulus (CSM w/ Sneddon's correction)"] / 1000
-            self.sneddon_pascal_unit = 'kPa'
-        elif 5 <= log_value_sneddon <= 7:
-            data["Young's Modulus (CSM w/ Sneddon's correction)"] = data[
-                                                                        "Young's Modulus (CSM w/ Sneddon's correction)"] / 1000000
-            self.sneddon_pascal_unit = 'MPa'
-        elif 8 <= log_value_sneddon <= 10:
-            data["Young's Modulus (CSM w/ Sneddon's correction)"] = data[
-                                                                        "Young's Modulus (CSM w/ Sneddon's correction)"] / 1000000000
-            self.sneddon_pascal_unit = 'GPa'
-        elif 11 <= log_value_sneddon <= 13:
-            data["Young's Modulus (CSM w/ Sneddon's correction)"] = data[
-                                                                        "Young's Modulus (CSM w/ Sneddon's correction)"] / 1000000000000
-            self.sneddon_pascal_unit = 'TPa'
-        else:
-            data["Young's Modulus (CSM w/ Sneddon's correction)"] = data[
-                                                                        "Young's Modulus (CSM w/ Sneddon's correction)"] / 1000000000000000
-            self.sneddon_pascal_unit = 'PPa'
+        with profiler.span('sneddon', self.csv_index, len(data), poisson_ratio=self.poisson_ratio, known_elastic_modulus=self.known_elastic_modulus,
+                           conservation=self.conservation_mode()):
+            if self.volume_conservation is True:
+                partial_compliance_sneddon = (math.sqrt(math.pi) * (1 - (self.poisson_ratio ** 2))) / (2 * self.known_elastic_modulus)
+                data["Sneddon's correction to CSM (volume conservation)"] = np.reciprocal(
+                    np.reciprocal(data[self.csm_column]) - (partial_compliance_sneddon / np.sqrt(
+                        (self.specimen_area * self.specimen_height) / (self.specimen_height + data[self.displacement_column]))))
+                self.units_list[data.columns[len(data.columns) - 1].format(len(data.columns) - 1)] = 'N/m'
+                data.loc[(data[self.csm_column]).between(self.csm_start, self.csm_end,
+                                                    inclusive=True), "Young's Modulus (CSM w/ Sneddon's correction)"] = \
+                data["Sneddon's correction to CSM (volume conservation)"] * (
+                            (self.specimen_height + data[self.displacement_column]) ** 2) / (
+                            self.specimen_area * self.specimen_height) * 1000000000
+            elif self.area_conservation is True:
+                area = self.specimen_area
+                compliance_sneddon = (math.sqrt(math.pi) * (1 - (self.poisson_ratio ** 2))) / (
+                            2 * self.known_elastic_modulus * math.sqrt(area))
+                data["Sneddon's correction to CSM (area conservation)"] = np.reciprocal(
+                    np.reciprocal(data[self.csm_column]) - compliance_sneddon)
+                self.units_list[data.columns[len(data.columns) - 1].format(len(data.columns) - 1)] = 'N/m'
+                data.loc[(data[self.csm_column]).between(self.csm_start, self.csm_end,
+                                                    inclusive=True), "Young's Modulus (CSM w/ Sneddon's correction)"] = \
+                data["Sneddon's correction to CSM (area conservation)"] * (
+                            self.specimen_height + data[self.displacement_column]) / self.specimen_area * 1000000000
+
+            first_sneddon_temp = data[data["Young's Modulus (CSM w/ Sneddon's correction)"].notna()]
+            c2 = first_sneddon_temp["Young's Modulus (CSM w/ Sneddon's correction)"].mean()
+
+            if math.isnan(c2) is True:
+                c2 = 0.0
+
+            if c2 > 0.0:
+                log_value_sneddon = int(math.log10(c2))
+            elif c2 == 0.0:
+                log_value_sneddon = 0.0
+            else:
+                log_value_sneddon = int(math.log10(-c2)) + 1
+
+            if 0 <= log_value_sneddon <= 1:
+                self.sneddon_pascal_unit = 'Pa'
+            elif 2 <= log_value_sneddon <= 4:
+                data["Young's Modulus (CSM w/ Sneddon's correction)"] = data[
+                                                                            "Young's Modulus (CSM w/ Sneddon's correction)"] / 1000
+                self.sneddon_pascal_unit = 'kPa'
+            elif 5 <= log_value_sneddon <= 7:
+                data["Young's Modulus (CSM w/ Sneddon's correction)"] = data[
+                                                                            "Young's Modulus (CSM w/ Sneddon's correction)"] / 1000000
+                self.sneddon_pascal_unit = 'MPa'
+            elif 8 <= log_value_sneddon <= 10:
+                data["Young's Modulus (CSM w/ Sneddon's correction)"] = data[
+                                                                            "Young's Modulus (CSM w/ Sneddon's correction)"] / 1000000000
+                self.sneddon_pascal_unit = 'GPa'
+            elif 11 <= log_value_sneddon <= 13:
+                data["Young's Modulus (CSM w/ Sneddon's correction)"] = data[
+                                                                            "Young's Modulus (CSM w/ Sneddon's correction)"] / 1000000000000
+                self.sneddon_pascal_unit = 'TPa'
+            else:
+                data["Young's Modulus (CSM w/ Sneddon's correction)"] = data[
+                                                                            "Young's Modulus (CSM w/ Sneddon's correction)"] / 1000000000000000
+                self.sneddon_pascal_unit = 'PPa'
 
-        last_sneddon_temp = data[data["Young's Modulus (CSM w/ Sneddon's correction)"].notna()]
-        self.youngs_modulus_value_sneddon = last_sneddon_temp["Young's Modulus (CSM w/ Sneddon's correction)"].mean()
-        try:
-            data["Young's Modulus (CSM w/ Sneddon's correction)"] = data[
-                "Young's Modulus (CSM w/ Sneddon's correction)"].astype('float64')
-        except ValueError:
-            data["Young's Modulus (CSM w/ Sneddon's correction)"] = None
-        self.units_list[data.columns[len(data.columns) - 1].format(len(data.columns) - 1)] = self.sneddon_pascal_unit
-        end = time.time()
-        print('Sneddon correction time: ' + str(end-start))
+            last_sneddon_temp = data[data["Young's Modulus (CSM w/ Sneddon's correction)"].notna()]
+            self.youngs_modulus_value_sneddon = last_sneddon_temp["Young's Modulus (CSM w/ Sneddon's correction)"].mean()
+            try:
+                data["Young's Modulus (CSM w/ Sneddon's correction)"] = data[
+                    "Young's Modulus (CSM w/ Sneddon's correction)"].astype('float64')
+            except ValueError:
+                data["Young's Modulus (CSM w/ Sneddon's correction)"] = None
+            self.units_list[data.columns[len(data.columns) - 1].format(len(data.columns) - 1)] = self.sneddon_pascal_unit
         return data
 
     def energy_dissipated(self, data: {}):
@@ -1907,13 +4852,580 @@ class GraphSoftware(tk.Frame):
         :param data: csv data file user selects from desktop
         :return: work energy with the same units as stress
         """
-        start = time.time()
-        wrk = np.trapz(data[self.stress_type], data[self.strain_type])
-        self.energy_dissipated_value = wrk
-        end = time.time()
-        print('Energy dissipated time: ' + str(end-start))
+        with profiler.span('energy_dissipated', self.csv_index, len(data), stress=self.stress_type, strain=self.strain_type):
+            wrk = np.trapz(data[self.stress_type], data[self.strain_type])
+            self.energy_dissipated_value = wrk
+        return data
+
+    def energy_cycles(self, data: {}):
+        """
+        function integrates the stress-strain curve once w/ the cumulative trapezoid rule and reduces the trapezoid
+        increments of every cycle at once (np.add.reduceat); the cycles, loading & unloading come from the
+        displacement's segment index, so noise in the strain neither splits cycles nor moves energy between loading &
+        unloading
+            loading energy: sum of increments while loading (holds included)
+            recovered energy: -(sum of increments while unloading (holds included))
+            dissipated energy: loading energy - recovered energy (hysteresis loop area)
+        :param data: csv data file user selects from desktop
+        :return: new graphable data column called Energy (Cumulative) & per-cycle energy table (same units as stress)
+        """
+        with profiler.span('energy_cycles', self.csv_index, len(data), stress=self.stress_type, strain=self.strain_type):
+            stress = data[self.stress_type].to_numpy(dtype='float64')
+            strain = data[self.strain_type].to_numpy(dtype='float64')
+            strain_step = np.diff(strain)
+            increments = 0.5 * (stress[1:] + stress[:-1]) * strain_step
+            data['Energy (Cumulative)'] = np.concatenate(([0.0], np.cumsum(increments)))
+            self.units_list['Energy (Cumulative)'] = self.stress_pascal_unit
+            if len(data) < 2:
+                self.cycle_energy_table = []
+                return data
+            index = self.segment_index(self.displacement_column)
+            starts = index.cycle_starts
+            loading_step = index.direction[1:] == SegmentIndex.LOADING
+            loading = np.add.reduceat(np.where(loading_step, increments, 0.0), starts)
+            recovered = -np.add.reduceat(np.where(loading_step, 0.0, increments), starts)
+            self.cycle_energy_table = np.column_stack((np.arange(1, len(starts) + 1), starts,
+                                                       np.diff(np.append(starts, len(data))),
+                                                       np.maximum.reduceat(strain, starts),
+                                                       np.maximum.reduceat(stress, starts), loading, recovered,
+                                                       loading - recovered)).tolist()
+        return data
+
+    def rolling_modulus(self, data: {}):
+        """
+        function calculates the least-squares slope of stress vs. strain over a window centered on every row from
+        prefix sums of 1, strain, stress, strain^2 & strain * stress (each window's sums are two lookups, so there is no
+        loop over windows); the window holds rolling_window rows, or the rows within rolling_window / 2 strain
+        travelled along the curve on either side
+        :param data: csv data file user selects from desktop
+        :return: new graphable data column called Young's Modulus (Rolling) (same units as stress)
+        """
+        with profiler.span('rolling_modulus', self.csv_index, len(data), window=self.rolling_window,
+                           window_unit=self.rolling_window_unit):
+            strain = data[self.strain_type].to_numpy(dtype='float64')
+            stress = data[self.stress_type].to_numpy(dtype='float64')
+            positions = np.arange(len(data))
+            if self.rolling_window_unit == 'Points':
+                half = int(self.rolling_window) // 2
+                first = np.maximum(positions - half, 0)
+                stop = np.minimum(positions + half + 1, len(data))
+            else:
+                path = np.concatenate(([0.0], np.cumsum(np.nan_to_num(np.abs(np.diff(strain))))))
+                first = np.searchsorted(path, path - self.rolling_window / 2, 'left')
+                stop = np.searchsorted(path, path + self.rolling_window / 2, 'right')
+            finite = np.isfinite(strain) & np.isfinite(stress)
+            # centered on the means so the sums of squares do not lose precision
+            (x_center, y_center) = (strain[finite].mean(), stress[finite].mean()) if finite.any() else (0.0, 0.0)
+            dx = np.where(finite, strain - x_center, 0.0)
+            dy = np.where(finite, stress - y_center, 0.0)
+            sums = np.zeros((5, len(data) + 1))
+            np.cumsum(np.stack((finite, dx, dy, dx * dx, dx * dy)), axis=1, out=sums[:, 1:])
+            (n, sx, sy, sxx, sxy) = sums[:, stop] - sums[:, first]
+            denominator = n * sxx - sx * sx
+            with np.errstate(divide='ignore', invalid='ignore'):
+                slope = np.where((n >= 2) & (denominator > 0.0), (n * sxy - sx * sy) / denominator, np.nan)
+            data["Young's Modulus (Rolling)"] = slope
+            self.units_list["Young's Modulus (Rolling)"] = self.stress_pascal_unit
         return data
 
+    def strain_sweep(self):
+        """
+        function fits stress vs. strain over every (start, end) pair of a strain grid at once; the plotted rows are
+        sorted by strain & prefix-summed once (WindowSums) so the whole grid costs two vectorized binary searches & a
+        few array subtractions
+        :return: strain grid, least-squares modulus (same units as stress) & R^2 of each (start, end) pair (NaN if the
+        end is not past the start or the window has fewer than 3 points)
+        """
+        data = self.load_data()
+        rows = self.plot_rows()
+        if rows is not None:
+            data = data[rows]
+        with profiler.span('strain_sweep', self.csv_index, len(data), points=self.strain_sweep_points):
+            sums = WindowSums(data[self.strain_type].to_numpy(dtype='float64'),
+                              data[self.stress_type].to_numpy(dtype='float64'))
+            if len(sums.x) > 0:
+                edges = np.linspace(sums.x[0], sums.x[-1], self.strain_sweep_points)
+            else:
+                edges = np.zeros(0)
+            (modulus, r2, n) = sums.fit(edges[:, np.newaxis], edges[np.newaxis, :])
+            invalid = (edges[np.newaxis, :] <= edges[:, np.newaxis]) | (n < 3)
+            modulus[invalid] = np.nan
+            r2[invalid] = np.nan
+        return edges, modulus, r2
+
+    @classmethod
+    def stable_window(cls, edges, modulus, r2):
+        """
+        function picks the most stable strain window of a sweep: among windows w/ R^2 >= strain_sweep_r2 & at least 5
+        valid neighbours on the grid, the one whose modulus varies least (relative std.) over its 3x3 neighbourhood;
+        the best R^2 if no window qualifies
+        :param edges: strain grid
+        :param modulus: modulus of each (start, end) pair
+        :param r2: R^2 of each (start, end) pair
+        :return: strain start, strain end, modulus & R^2 of the window (None if the sweep found no window)
+        """
+        if not np.isfinite(r2).any():
+            return None
+        neighbours = np.lib.stride_tricks.sliding_window_view(np.pad(modulus, 1, constant_values=np.nan), (3, 3))
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            spread = np.nanstd(neighbours, axis=(2, 3)) / np.abs(modulus)
+        candidates = np.isfinite(spread) & (np.isfinite(neighbours).sum(axis=(2, 3)) >= 5) & (r2 >= cls.strain_sweep_r2)
+        if candidates.any():
+            (i, j) = np.unravel_index(np.argmin(np.where(candidates, spread, np.inf)), modulus.shape)
+        else:
+            (i, j) = np.unravel_index(np.nanargmax(r2), r2.shape)
+        return float(edges[i]), float(edges[j]), float(modulus[i, j]), float(r2[i, j])
+
+    def material_sweep(self):
+        """
+        function evaluates the CSM modulus & Sneddon's correction for every (Poisson ratio, known elastic modulus)
+        pair of the sweep grid under both area & volume conservation; the CSM rows inside the CSM range are broadcast
+        against all pairs at once (in row chunks of at most material_sweep_block values)
+            corrected modulus = mean over rows of geometry / (1 / k - C_sneddon), w/
+            C_sneddon = (sqrt(pi) * (1 - (v ^ 2))) / (2 * E * sqrt(area)), area = initial area (area conservation) or
+            instantaneous area (volume conservation)
+        :return: Poisson ratios, known moduli, {conservation: (CSM modulus, grid of corrected moduli)} in Pa
+        """
+        csm = self.input_values(self.csm_column)
+        displacement = self.input_values(self.displacement_column)
+        in_range = (csm >= self.csm_start) & (csm <= self.csm_end) & np.isfinite(displacement)
+        csm = csm[in_range]
+        displacement = displacement[in_range]
+        poisson = np.linspace(self.sweep_poisson_start, self.sweep_poisson_end, self.material_sweep_points)
+        known = np.linspace(self.sweep_modulus_start, self.sweep_modulus_end, self.material_sweep_points)
+        partial_compliance = (math.sqrt(math.pi) * (1 - poisson[:, np.newaxis] ** 2) / (2 * known[np.newaxis, :])).ravel()
+        chunk = max(1, self.material_sweep_block // len(partial_compliance))
+        results = {}
+        with profiler.span('material_sweep', self.csv_index, len(csm), points=self.material_sweep_points), \
+                np.errstate(divide='ignore', invalid='ignore'):
+            compliance = np.reciprocal(csm)
+            for conservation in ('area', 'volume'):
+                geometry = self.csm_geometry(displacement, conservation)
+                if conservation == 'volume':
+                    inverse_root_area = np.sqrt((self.specimen_height + displacement) / (self.specimen_area * self.specimen_height))
+                else:
+                    inverse_root_area = np.full(len(csm), 1 / math.sqrt(self.specimen_area))
+                totals = np.zeros(len(partial_compliance))
+                for first in range(0, len(csm), chunk):
+                    rows = slice(first, first + chunk)
+                    corrected = np.multiply.outer(inverse_root_area[rows], -partial_compliance)
+                    corrected += compliance[rows, np.newaxis]
+                    np.divide(geometry[rows, np.newaxis], corrected, out=corrected)
+                    totals += corrected.sum(axis=0)
+                grid = (totals / len(csm)).reshape(len(poisson), len(known))
+                results[conservation] = (float(np.mean(csm * geometry)) if len(csm) > 0 else math.nan, grid)
+        return poisson, known, results
+
+    def geometry_samples(self):
+        """
+        function draws the specimen area & height samples; each is its entered value plus a normal deviate scaled by
+        its uncertainty (std. dev.) or a uniform deviate within +/- its uncertainty (half-width); samples w/ a
+        non-positive area or height are dropped
+        :return: area & height samples
+        """
+        rng = np.random.default_rng()
+        if self.uncertainty_distribution == 'Uniform':
+            deviates = rng.uniform(-1.0, 1.0, (2, self.uncertainty_samples))
+        else:
+            deviates = rng.standard_normal((2, self.uncertainty_samples))
+        area = self.specimen_area + self.area_uncertainty * deviates[0]
+        height = self.specimen_height + self.height_uncertainty * deviates[1]
+        kept = (area > 0.0) & (height > 0.0)
+        return area[kept], height[kept]
+
+    @classmethod
+    def grid_nodes(cls, values):
+        """
+        function spreads interpolation nodes over the range of the samples
+        :param values: samples
+        :return: nodes (a single node if every sample is the same)
+        """
+        (low, high) = (float(values.min()), float(values.max()))
+        return np.linspace(low, high, cls.uncertainty_grid_points) if high > low else np.array([low])
+
+    @staticmethod
+    def interpolate_grid(x_nodes, y_nodes, grid, x, y):
+        """
+        function interpolates values computed on a grid of nodes bilinearly at the samples
+        :param x_nodes: nodes of the 1st axis
+        :param y_nodes: nodes of the 2nd axis
+        :param grid: value at each (x node, y node)
+        :param x: 1st coordinate of the samples
+        :param y: 2nd coordinate of the samples
+        :return: interpolated value of each sample
+        """
+        def locate(nodes, values):
+            if len(nodes) == 1:
+                return np.zeros(len(values), dtype=np.intp), np.zeros(len(values), dtype=np.intp), np.zeros(len(values))
+            cell = np.clip(np.searchsorted(nodes, values) - 1, 0, len(nodes) - 2)
+            return cell, cell + 1, (values - nodes[cell]) / (nodes[cell + 1] - nodes[cell])
+
+        (i, i1, wx) = locate(x_nodes, x)
+        (j, j1, wy) = locate(y_nodes, y)
+        return (grid[i, j] * (1 - wx) * (1 - wy) + grid[i1, j] * wx * (1 - wy) + grid[i, j1] * (1 - wx) * wy +
+                grid[i1, j1] * wx * wy)
+
+    def geometry_uncertainty(self):
+        """
+        function propagates the specimen area & height uncertainty into every completed scalar result for all samples
+        at once; stress scales w/ 1 / area & strain depends on the height alone, so each result reduces to a few sums
+        of the raw columns evaluated per sample
+            engineering or true stress-strain at any row: exact per sample
+            slope modulus: nearest strain rows per sample (binary search in the sorted displacement) & exact slope
+            CSM modulus: exact from sums of k, k * h & k * h^2 over the CSM range
+            Sneddon's correction: interpolated on a grid of the terms it depends on, or exact when it has a pole
+            ultimate stress & strain: exact at the failure row of the entered geometry
+            energy: exact for engineering stress-strain, interpolated on a height grid for true stress or strain
+        :return: samples of every completed result in the sheet's units
+        """
+        self.load_data()
+        frame = dataset_store.stored(self.csv_index)
+        load = self.input_values(self.load_column)
+        displacement = self.input_values(self.displacement_column)
+        (area, height) = self.geometry_samples()
+        stress_scale = 1000000000000000 / self.pascal_divisor(self.stress_pascal_unit)
+        true_stress = self.stress_type == 'Stress (True)'
+        true_strain = self.strain_type == 'Strain (True)'
+
+        def strain_at(d, h):
+            return np.log((h + d) / h) if true_strain is True else d / h
+
+        def stress_at(p, d, a, h):
+            return p / a * stress_scale * ((h + d) / h if true_stress is True else 1.0)
+
+        samples = {}
+        with profiler.span('geometry_uncertainty', self.csv_index, len(frame), samples=len(area),
+                           distribution=self.uncertainty_distribution), np.errstate(divide='ignore', invalid='ignore'):
+            if self.compute_yms is True:
+                finite = np.flatnonzero(np.isfinite(displacement))
+                (values, first) = np.unique(displacement[finite], return_index=True)
+                rows = []
+                for target in (self.strain_start, self.strain_end):
+                    nearest = height * (np.exp(target) - 1) if true_strain is True else target * height
+                    above = np.clip(np.searchsorted(values, nearest), 1, len(values) - 1)
+                    below = above - 1
+                    closer = np.abs(strain_at(values[above], height) - target) < np.abs(strain_at(values[below], height) - target)
+                    rows.append(finite[first[np.where(closer, above, below)]])
+                (r1, r2) = rows
+                samples['youngs_modulus_value_slope'] = (
+                    (stress_at(load[r2], displacement[r2], area, height) - stress_at(load[r1], displacement[r1], area, height)) /
+                    (strain_at(displacement[r2], height) - strain_at(displacement[r1], height)))
+            if self.compute_ymcsm is True or self.compute_sneddon is True:
+                csm = self.input_values(self.csm_column)
+                in_range = (csm >= self.csm_start) & (csm <= self.csm_end)
+                (k, h) = (csm[in_range], displacement[in_range])
+                volume = self.conservation_mode() == 'volume'
+            if self.compute_ymcsm is True:
+                (s0, s1, s2) = (k.sum(), (k * h).sum(), (k * h * h).sum())
+                if volume is True:
+                    modulus = (height ** 2 * s0 + 2 * height * s1 + s2) / (len(k) * area * height)
+                else:
+                    modulus = (height * s0 + s1) / (len(k) * area)
+                samples['youngs_modulus_value_csm'] = modulus * 1000000000 / self.pascal_divisor(self.csm_pascal_unit)
+            if self.compute_sneddon is True:
+                samples['youngs_modulus_value_sneddon'] = self.sneddon_uncertainty(k, h, area, height, volume)
+            if self.compute_uss is True:
+                row = self.failure_row
+                samples['ultimate_stress_value'] = stress_at(load[row], displacement[row], area, height)
+                samples['ultimate_strain_value'] = strain_at(displacement[row], height)
+            if self.compute_energy_dissipated is True:
+                # energy * area * height depends on the height alone & is constant for engineering stress-strain
+                def energy_volume(x):
+                    return np.trapz(stress_at(load, displacement, 1.0, x), strain_at(displacement, x)) * x
+
+                x_nodes = self.grid_nodes(height) if true_stress or true_strain else np.array([self.specimen_height])
+                grid = np.array([[energy_volume(x)] for x in x_nodes])
+                samples['energy_dissipated_value'] = self.interpolate_grid(x_nodes, np.zeros(1), grid, height,
+                                                                           np.zeros(len(area))) / (area * height)
+        return samples
+
+    def sneddon_uncertainty(self, k, h, area, height, volume: bool):
+        """
+        function evaluates the mean Sneddon-corrected CSM modulus for every geometry sample; the sum over the CSM rows
+        is computed exactly on a grid of the terms it depends on (compliance / sqrt(area) for area conservation;
+        height & compliance / sqrt(area * height) for volume conservation) & interpolated per sample, unless a
+        denominator 1 / k - C_sneddon changes sign within the sampled range (the sum has a pole there), then it is
+        computed exactly for every sample in chunks
+        :param k: CSM values inside the CSM range
+        :param h: displacement of the same rows
+        :param area: specimen area samples
+        :param height: specimen height samples
+        :param volume: True for volume conservation, False for area conservation
+        :return: Sneddon modulus samples in the sheet's unit
+        """
+        partial_compliance = (math.sqrt(math.pi) * (1 - (self.poisson_ratio ** 2))) / (2 * self.known_elastic_modulus)
+        compliance = np.reciprocal(k)
+        if volume is True:
+            shift = partial_compliance / np.sqrt(area * height)
+            pole = np.any((compliance >= shift.min() * np.sqrt(height.min() + h)) &
+                          (compliance <= shift.max() * np.sqrt(height.max() + h)))
+        else:
+            shift = partial_compliance / np.sqrt(area)
+            pole = np.any((compliance >= shift.min()) & (compliance <= shift.max()))
+        if pole:
+            total = np.empty(len(area))
+            chunk = max(1, self.uncertainty_block // max(len(k), 1))
+            for first in range(0, len(area), chunk):
+                part = slice(first, first + chunk)
+                x = height[part, np.newaxis] + h
+                if volume is True:
+                    total[part] = (x ** 2 / (compliance - shift[part, np.newaxis] * np.sqrt(x))).sum(axis=1) / (area[part] * height[part])
+                else:
+                    total[part] = (x / (compliance - shift[part, np.newaxis])).sum(axis=1) / area[part]
+        elif volume is True:
+            (x_nodes, y_nodes) = (self.grid_nodes(height), self.grid_nodes(shift))
+            grid = np.array([[((x + h) ** 2 / (compliance - y * np.sqrt(x + h))).sum() for y in y_nodes]
+                             for x in x_nodes])
+            total = self.interpolate_grid(x_nodes, y_nodes, grid, height, shift) / (area * height)
+        else:
+            y_nodes = self.grid_nodes(shift)
+            grid = np.array([[(1 / (compliance - y)).sum() for y in y_nodes], [(h / (compliance - y)).sum() for y in y_nodes]])
+            no_axis = np.zeros(len(area))
+            total = (height * self.interpolate_grid(np.zeros(1), y_nodes, grid[:1], no_axis, shift) +
+                     self.interpolate_grid(np.zeros(1), y_nodes, grid[1:], no_axis, shift)) / area
+        return total / len(k) * 1000000000 / self.pascal_divisor(self.sneddon_pascal_unit)
+
+    @classmethod
+    def pascal_divisor(cls, unit):
+        """
+        function gives the number of pascals in a pascal unit picked by the calculations
+        :param unit: 'Pa', 'kPa', 'MPa', 'GPa', 'TPa' or 'PPa'
+        :return: divisor
+        """
+        for (low, high, divisor, name) in cls.pascal_units:
+            if name == unit:
+                return divisor
+        return 1.0
+
+    def csm_geometry(self, displacement, conservation: str = None):
+        """
+        function returns the factor that turns CSM stiffness into Young's modulus (Pa) on each row for area or volume
+        conservation
+        :param displacement: displacement values
+        :param conservation: 'area' or 'volume' (the selected conservation if None)
+        :return: factor of each row
+        """
+        if conservation is None:
+            conservation = self.conservation_mode()
+        if conservation == 'volume':
+            return (self.specimen_height + displacement) ** 2 / (self.specimen_area * self.specimen_height) * 1000000000
+        return (self.specimen_height + displacement) / self.specimen_area * 1000000000
+
+    @classmethod
+    def pascal_scale(cls, value):
+        """
+        function picks the pascal unit the stress & modulus calculations would pick for a value in Pa
+        :param value: mean value in Pa
+        :return: divisor & unit
+        """
+        if math.isnan(value) is True or value == 0.0:
+            log_value = 0
+        elif value > 0.0:
+            log_value = int(math.log10(value))
+        else:
+            log_value = int(math.log10(-value)) + 1
+        for (low, high, divisor, unit) in cls.pascal_units:
+            if low <= log_value <= high:
+                return divisor, unit
+        return 1e15, 'PPa'
+
+    def cycle_batch(self):
+        """
+        function applies this sheet's parameters to every cycle of the dataset at once, as if each cycle had been
+        parsed into its own CSV file (each cycle re-zeroed on its own) and calculated in its own sheet; every step is a
+        segment reduction (np.*.reduceat) over the cycle starts so there is no loop over cycles
+            CSM & Sneddon modulus: mean over the rows of the cycle inside the CSM range
+            energy: trapezoidal stress-strain area of the cycle
+            bursts: strain steps >= 2 * 10^(|log10(mean step)| - 3) * mean step of the cycle
+        :return: per-cycle results table & units
+        """
+        self.register_data()
+        frame = dataset_store.stored(self.csv_index)
+        column, controlled = self.cycle_modes[self.cycle_mode]
+        with profiler.span('cycle_batch', self.csv_index, len(frame), mode=self.cycle_mode):
+            if controlled is True:
+                labels = CSVInterface.cycle_labels(frame[getattr(self, column)], True).to_numpy()
+                starts = np.flatnonzero(np.diff(labels, prepend=labels[0] - 1))
+            else:
+                starts = self.segment_index(getattr(self, column)).cycle_starts
+            rows = np.diff(np.append(starts, len(frame)))
+
+            def zeroed(col_name):
+                values = self.input_values(col_name)
+                return values - np.repeat(np.fmin.reduceat(values, starts), rows)
+
+            load = zeroed(self.load_column)
+            displacement = zeroed(self.displacement_column)
+            stress = load / self.specimen_area * 1000000000000000
+            strain = displacement / self.specimen_height
+            if self.stress_type == 'Stress (True)':
+                stress = stress * ((self.specimen_height + displacement) / self.specimen_height)
+            if self.strain_type == 'Strain (True)':
+                strain = np.log((self.specimen_height + displacement) / self.specimen_height)
+            stress_divisor, stress_unit = self.pascal_scale(float(np.nanmean(stress)))
+            stress = stress / stress_divisor
+
+            # steps that cross from one cycle into the next do not belong to either cycle
+            inside = np.ones(len(frame), dtype=bool)
+            inside[starts] = False
+            strain_step = np.where(inside, np.diff(strain, prepend=strain[0]), 0.0)
+            area_step = np.where(inside, 0.5 * (stress + np.roll(stress, 1)) * strain_step, 0.0)
+            energy = np.add.reduceat(area_step, starts)
+
+            mean_step = np.add.reduceat(strain_step, starts) / np.maximum(rows - 1, 1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                log_value = np.where(mean_step >= 0.0, np.log10(np.abs(mean_step)), np.log10(np.abs(mean_step)) + 1)
+                threshold = 2 * (10 ** (np.abs(log_value) - 3)) * mean_step
+            bursts = np.add.reduceat(inside & (strain_step >= np.repeat(threshold, rows)), starts)
+
+            csm_modulus = np.full(len(starts), np.nan)
+            sneddon_modulus = np.full(len(starts), np.nan)
+            csm_unit = sneddon_unit = ''
+            if self.csm is True and (self.area_conservation is True or self.volume_conservation is True):
+                csm = zeroed(self.csm_column)
+                in_range = (csm >= self.csm_start) & (csm <= self.csm_end)
+                in_range_rows = np.maximum(np.add.reduceat(in_range, starts), 1)
+                geometry = self.csm_geometry(displacement)
+                csm_modulus = np.add.reduceat(np.where(in_range, csm * geometry, 0.0), starts) / in_range_rows
+                csm_divisor, csm_unit = self.pascal_scale(float(np.nanmean(csm_modulus)))
+                csm_modulus = csm_modulus / csm_divisor
+                if self.poisson_exists is True and self.known_elastic_modulus_exists is True:
+                    compliance = (math.sqrt(math.pi) * (1 - (self.poisson_ratio ** 2))) / (2 * self.known_elastic_modulus)
+                    if self.volume_conservation is True:
+                        compliance = compliance / np.sqrt((self.specimen_area * self.specimen_height) / (self.specimen_height + displacement))
+                    else:
+                        compliance = compliance / math.sqrt(self.specimen_area)
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        corrected = np.reciprocal(np.reciprocal(csm) - compliance)
+                    sneddon_modulus = np.add.reduceat(np.where(in_range, corrected * geometry, 0.0), starts) / in_range_rows
+                    sneddon_divisor, sneddon_unit = self.pascal_scale(float(np.nanmean(sneddon_modulus)))
+                    sneddon_modulus = sneddon_modulus / sneddon_divisor
+
+            self.cycle_batch_table = np.column_stack((np.arange(1, len(starts) + 1), rows,
+                                                      np.fmax.reduceat(strain, starts), np.fmax.reduceat(stress, starts),
+                                                      csm_modulus, sneddon_modulus, energy, bursts)).tolist()
+            self.cycle_batch_units = {'Max Stress': stress_unit, "Young's Modulus (CSM)": csm_unit,
+                                      "Young's Modulus (Sneddon)": sneddon_unit, 'Energy': stress_unit}
+        return self.cycle_batch_table
+
+    def unload_segments(self, load, starts, rows):
+        """
+        function finds the fitted part of every unloading segment: from the peak load of each cycle until the load
+        first drops below (1 - unload_fraction) * peak load; a cycle whose load never drops that far (noise, bursts or
+        the end of the test) has no unload
+        :param load: load column
+        :param starts: first row of every cycle
+        :param rows: number of rows of every cycle
+        :return: first row & number of rows of each unload fit (0 rows if the cycle has no unload)
+        """
+        peak_load = np.repeat(np.fmax.reduceat(load, starts), rows)
+        positions = np.arange(len(load))
+        cycle = np.repeat(np.arange(len(starts)), rows)
+        peak_rows = np.full(len(starts), len(load))
+        np.minimum.at(peak_rows, cycle[load == peak_load], positions[load == peak_load])
+        after_peak = positions >= np.repeat(peak_rows, rows)
+        below = after_peak & (load < (1 - self.unload_fraction) * peak_load)
+        first_below = np.minimum.reduceat(np.where(below, positions, len(load)), starts)
+        unloaded = first_below < starts + rows
+        return peak_rows, np.where(unloaded, first_below - peak_rows, 0)
+
+    def oliver_pharr(self):
+        """
+        function fits the power-law unloading curve P = alpha * (h - h_f)^m over the upper unload_fraction of every
+        unloading segment (peak load of each cycle) at once: each segment is sampled to at most oliver_pharr_points
+        points, padded into a (segments x points) array, normalized by its peak and solved w/ batched
+        Levenberg-Marquardt steps (one 3x3 normal equation per segment per iteration); load is taken in mN and
+        displacement in nm like the other calculations
+            contact stiffness: S = dP/dh at h_max = alpha * m * (h_max - h_f)^(m - 1)
+            contact depth: h_c = h_max - epsilon * P_max / S
+            contact area: A = C0 * h_c^2
+            reduced modulus: E_r = sqrt(pi) / (2 * beta) * S / sqrt(A)
+            hardness: H = P_max / A
+        fits w/ an R^2 below oliver_pharr_min_r2 are left out (their unload numbers are skipped)
+        :return: per-unload results table & units
+        """
+        self.register_data()
+        frame = dataset_store.stored(self.csv_index)
+        load = self.input_values(self.load_column)
+        depth = self.input_values(self.displacement_column)
+        with profiler.span('oliver_pharr', self.csv_index, len(frame), fraction=self.unload_fraction, area_coefficient=self.area_coefficient):
+            starts = self.segment_index(self.load_column).cycle_starts
+            rows = np.diff(np.append(starts, len(frame)))
+            first, length = self.unload_segments(load, starts, rows)
+            unloads = np.flatnonzero(length > 0)
+            fitted = np.flatnonzero(length[unloads] >= 4)
+            first, length, unloads = first[unloads][fitted], length[unloads][fitted], fitted + 1
+
+            points = min(self.oliver_pharr_points, int(length.max())) if len(length) > 0 else 1
+            j = np.arange(points)
+            sampled = np.minimum(length, points)
+            index = first[:, None] + (j[None, :] * (length[:, None] - 1)) // np.maximum(sampled[:, None] - 1, 1)
+            weight = (j[None, :] < sampled[:, None]).astype('float64')
+            index = np.where(weight > 0, index, first[:, None])
+            p_max = load[first]
+            h_max = depth[first]
+            p = load[index] / p_max[:, None]
+            u = depth[index] / h_max[:, None]
+
+            # initial guess: m = 1.5 through the peak & the last fitted point
+            m = np.full(len(first), 1.5)
+            u_min = np.where(weight > 0, u, np.inf).min(axis=1)
+            ratio = np.clip(np.where(weight > 0, p, np.inf).min(axis=1), 1e-6, 1 - 1e-6) ** (1 / m)
+            uf = np.minimum((u_min - ratio) / (1 - ratio), u_min - 1e-6)
+            a = 1 / (1 - uf) ** m
+            damping = np.full(len(first), 1e-3)
+
+            def residuals(a, uf, m):
+                d = np.maximum(u - uf[:, None], 1e-12)
+                return (a[:, None] * d ** m[:, None] - p) * weight, d
+
+            r, d = residuals(a, uf, m)
+            cost = (r ** 2).sum(axis=1)
+            for _ in range(60):
+                dm = d ** m[:, None]
+                jacobian = np.stack((dm, -a[:, None] * m[:, None] * d ** (m[:, None] - 1), a[:, None] * dm * np.log(d)), axis=-1) * weight[..., None]
+                normal = np.einsum('kli,klj->kij', jacobian, jacobian)
+                gradient = np.einsum('kli,kl->ki', jacobian, r)
+                diagonal = np.einsum('kii->ki', normal)
+                normal = normal + (damping[:, None] * diagonal + 1e-12)[:, :, None] * np.eye(3)
+                step = np.linalg.solve(normal, -gradient[..., None])[..., 0]
+                a_trial = a + step[:, 0]
+                uf_trial = np.minimum(uf + step[:, 1], u_min - 1e-9)
+                m_trial = np.clip(m + step[:, 2], 0.5, 5.0)
+                r_trial, d_trial = residuals(a_trial, uf_trial, m_trial)
+                cost_trial = (r_trial ** 2).sum(axis=1)
+                better = cost_trial < cost
+                a, uf, m = np.where(better, a_trial, a), np.where(better, uf_trial, uf), np.where(better, m_trial, m)
+                r, d = np.where(better[:, None], r_trial, r), np.where(better[:, None], d_trial, d)
+                cost = np.where(better, cost_trial, cost)
+                damping = np.where(better, damping / 3, damping * 3)
+
+            total = (((p - (p * weight).sum(axis=1, keepdims=True) / sampled[:, None]) * weight) ** 2).sum(axis=1)
+            r_squared = 1 - cost / np.where(total > 0, total, np.nan)
+            good = np.flatnonzero(r_squared >= self.oliver_pharr_min_r2)
+            (first, length, unloads, p_max, h_max) = (first[good], length[good], unloads[good], p_max[good], h_max[good])
+            (a, uf, m, r_squared) = (a[good], uf[good], m[good], r_squared[good])
+            stiffness = p_max / h_max * a * m * (1 - uf) ** (m - 1) * 1000000  # mN/nm -> N/m
+            contact_depth = h_max - self.oliver_pharr_epsilon * p_max / (stiffness / 1000000)
+            area = self.area_coefficient * (contact_depth * 1e-9) ** 2
+            with np.errstate(divide='ignore', invalid='ignore'):
+                reduced_modulus = math.sqrt(math.pi) / (2 * self.oliver_pharr_beta) * stiffness / np.sqrt(area)
+                hardness = p_max * 1e-3 / area
+            modulus_divisor, modulus_unit = self.pascal_scale(float(np.nanmean(reduced_modulus)) if len(first) > 0 else 0.0)
+            hardness_divisor, hardness_unit = self.pascal_scale(float(np.nanmean(hardness)) if len(first) > 0 else 0.0)
+            self.oliver_pharr_table = np.column_stack((unloads, first, length, p_max, h_max,
+                                                       uf * h_max, m, stiffness, contact_depth,
+                                                       reduced_modulus / modulus_divisor, hardness / hardness_divisor,
+                                                       r_squared)).tolist()
+            self.oliver_pharr_units = {'Max Load': self.units_list.get(self.load_column, ''),
+                                       'Max Depth': self.units_list.get(self.displacement_column, ''),
+                                       'Final Depth': self.units_list.get(self.displacement_column, ''),
+                                       'Contact Stiffness': 'N/m',
+                                       'Contact Depth': self.units_list.get(self.displacement_column, ''),
+                                       'Reduced Modulus': modulus_unit, 'Hardness': hardness_unit}
+        return self.oliver_pharr_table
+
     def bursts(self, data: {}):
         """
         function calculates strain differences between each stress-strain point, then sorts the differences and uses
@@ -1922,40 +5434,48 @@ class GraphSoftware(tk.Frame):
         :param data: csv data file user selects from desktop
         :return: # of bursts & arrays containing information of bursts (index of stress-strain occuring at bursts)
         """
-        start = time.time()
-        all_diff = data[self.strain_type].diff()
-        if all_diff.mean() >= 0.0:
-            log_value = math.log10(all_diff.mean())
+        with profiler.span('bursts', self.csv_index, len(data), strain=self.strain_type):
+            all_diff = data[self.strain_type].diff()
+            large_diff_upper = all_diff.index[
+                all_diff >= self.burst_threshold(all_diff.mean())]  # maybe just make len/100 the value 250
+            large_diff_lower = large_diff_upper - 1
+            if self.toggle_bursts is True:
+                for i in range(0, len(large_diff_lower), 2):
+                    self.large_diff[i] = large_diff_lower[int(i / 2)]
+                    self.large_diff[i + 1] = large_diff_upper[int(i / 2)]
+                for j in range(0, len(self.large_diff) * 2, 2):
+                    self.burst_stress_strain[j] = data[self.stress_type][self.large_diff[int(j / 2)]]
+                    self.burst_stress_strain[j + 1] = data[self.strain_type][self.large_diff[int(j / 2)]]
+                for k in range(0, len(self.large_diff), 2):
+                    self.burst_size[int(k/2)] = data[self.strain_type][self.large_diff[k + 1]] - data[self.strain_type][self.large_diff[k]]
+            else:
+                for x in range(0, len(large_diff_lower)):
+                    self.large_diff.append(large_diff_lower[x])
+                    self.large_diff.append(large_diff_upper[x])
+                for w in range(0, len(self.large_diff)):
+                    self.burst_stress_strain.append(data[self.stress_type][self.large_diff[w]])
+                    self.burst_stress_strain.append(data[self.strain_type][self.large_diff[w]])
+                for z in range(0, len(self.large_diff), 2):
+                    self.burst_size.append(data[self.strain_type][self.large_diff[z + 1]] - data[self.strain_type][self.large_diff[z]])
+                self.toggle_bursts = True
+            self.num_bursts_value = len(self.large_diff) / 2
+        return data
+
+    @staticmethod
+    def burst_threshold(mean_difference):
+        """
+        function gives the strain difference from which bursts() counts a burst: the mean difference times a factor
+        picked from its order of magnitude
+        :param mean_difference: mean strain difference between consecutive points
+        :return: strain difference threshold
+        """
+        if mean_difference >= 0.0:
+            log_value = math.log10(mean_difference)
         else:
-            log_value = math.log10(-all_diff.mean()) + 1
+            log_value = math.log10(-mean_difference) + 1
         factor = abs(log_value) - 3
         mean_changer = 2 * (10 ** factor)
-        large_diff_upper = all_diff.index[
-            all_diff >= (mean_changer * all_diff.mean())]  # maybe just make len/100 the value 250
-        large_diff_lower = large_diff_upper - 1
-        if self.toggle_bursts is True:
-            for i in range(0, len(large_diff_lower), 2):
-                self.large_diff[i] = large_diff_lower[int(i / 2)]
-                self.large_diff[i + 1] = large_diff_upper[int(i / 2)]
-            for j in range(0, len(self.large_diff) * 2, 2):
-                self.burst_stress_strain[j] = data[self.stress_type][self.large_diff[int(j / 2)]]
-                self.burst_stress_strain[j + 1] = data[self.strain_type][self.large_diff[int(j / 2)]]
-            for k in range(0, len(self.large_diff), 2):
-                self.burst_size[int(k/2)] = data[self.strain_type][self.large_diff[k + 1]] - data[self.strain_type][self.large_diff[k]]
-        else:
-            for x in range(0, len(large_diff_lower)):
-                self.large_diff.append(large_diff_lower[x])
-                self.large_diff.append(large_diff_upper[x])
-            for w in range(0, len(self.large_diff)):
-                self.burst_stress_strain.append(data[self.stress_type][self.large_diff[w]])
-                self.burst_stress_strain.append(data[self.strain_type][self.large_diff[w]])
-            for z in range(0, len(self.large_diff), 2):
-                self.burst_size.append(data[self.strain_type][self.large_diff[z + 1]] - data[self.strain_type][self.large_diff[z]])
-            self.toggle_bursts = True
-        self.num_bursts_value = len(self.large_diff) / 2
-        end = time.time()
-        print('Bursts time: ' + str(end - start))
-        return data
+        return mean_changer * mean_difference
 
     def check(self, data: {}):
         """
@@ -1964,28 +5484,143 @@ class GraphSoftware(tk.Frame):
         :return: updated calculation data
         """
         if self.compute_stress is True:
-            data = self.engineering_stress(data)
+            data = self.run_calculation('engineering_stress', data)
         if self.compute_strain is True:
-            data = self.engineering_strain(data)
+            data = self.run_calculation('engineering_strain', data)
         if self.compute_yms is True:
-            data = self.yms(data)
+            data = self.run_calculation('yms', data)
         if self.compute_ymcsm is True:
-            data = self.ymcsm(data)
+            data = self.run_calculation('ymcsm', data)
         if self.compute_true_stress is True:
-            data = self.true_stress(data)
+            data = self.run_calculation('true_stress', data)
         if self.compute_true_strain is True:
-            data = self.true_strain(data)
+            data = self.run_calculation('true_strain', data)
         if self.compute_sneddon is True:
-            data = self.sneddon(data)
+            data = self.run_calculation('sneddon', data)
         if self.compute_uss is True:
-            data = self.ultimate_stress(data)
-            data = self.ultimate_strain(data)
+            data = self.run_calculation('ultimate_failure', data)
         if self.compute_energy_dissipated is True:
-            data = self.energy_dissipated(data)
+            data = self.run_calculation('energy_dissipated', data)
         if self.compute_bursts is True:
-            data = self.bursts(data)
+            data = self.run_calculation('bursts', data)
+        if self.compute_cycle_energy is True:
+            data = self.run_calculation('energy_cycles', data)
+        if self.compute_rolling_modulus is True:
+            data = self.run_calculation('rolling_modulus', data)
+        return data
+
+    def run_calculation(self, calculation: str, data: {}):
+        """
+        function runs one calculation of check() through result_cache; a hit restores the calculated columns, results
+        & units w/o recalculating, a miss calculates & stores them, and a verified hit recalculates & compares (a
+        mismatch is shown in a pop-up & listed in the Result Cache sheet)
+        :param calculation: name of the calculation method
+        :param data: csv data file user selects from desktop
+        :return: updated calculation data
+        """
+        if result_cache.enabled is False or dataset_store.has(self.csv_index) is False:
+            return getattr(self, calculation)(data)
+        params = {}
+        for name in self.calculation_parameters[calculation]:
+            value = getattr(self, name)
+            params[name] = value.item() if isinstance(value, np.generic) else value
+        params['columns'] = [str(col_name) for col_name in data.columns]
+        if self.apply_filter is True:
+            params['signal_filter'] = [self.conditioned_columns(), list(self.signal_conditioner().key)]
+        if self.correct_drift is True:
+            params['drift_correction'] = [self.time_column, self.load_column, self.hold_tolerance, self.drift_min_rows]
+        if self.zero_at_contact is True:
+            params['contact_zeroing'] = [self.contact_method, self.contact_threshold,
+                                         dataset_store.stored_offsets(self.csv_index).get(self.csm_column, 0.0)]
+        key = result_cache.key(dataset_store.digest(self.csv_index), calculation, self.calculation_version, params)
+        cached = result_cache.load(key)
+        if cached is not None and result_cache.should_verify() is False:
+            with profiler.span('cache_hit', self.csv_index, len(data), calculation=calculation):
+                return self.apply_outputs(data, *cached)
+        columns = set(data.columns)
+        units = dict(self.units_list)
+        data = getattr(self, calculation)(data)
+        header, arrays = self.collect_outputs(calculation, data, columns, units)
+        if cached is None:
+            result_cache.store(key, header, arrays)
+        else:
+            matched = self.outputs_match((header, arrays), cached)
+            result_cache.record_verification(calculation, key, matched)
+            if matched is False and threading.current_thread() is threading.main_thread() and self.is_headless() is False:
+                self.create_pop_up('The cached result of ' + calculation + ' did not match its recalculation; the cache '
+                                   'entry was removed and the recalculated result is used.')
         return data
 
+    def collect_outputs(self, calculation: str, data: {}, columns: set, units: dict):
+        """
+        function collects what a calculation produced: new columns, results & units that changed
+        :param calculation: name of the calculation method
+        :param data: data after the calculation
+        :param columns: columns before the calculation
+        :param units: units_list before the calculation
+        :return: JSON-serializable header & arrays
+        """
+        new_columns = [col_name for col_name in data.columns if col_name not in columns]
+        attributes = {}
+        arrays = {}
+        for (j, col_name) in enumerate(new_columns):
+            arrays['column ' + str(j)] = data[col_name].to_numpy(dtype='float64')
+        for name in self.calculation_outputs[calculation]:
+            value = getattr(self, name)
+            if isinstance(value, list):
+                arrays[name] = np.asarray(value)
+            else:
+                attributes[name] = value.item() if isinstance(value, np.generic) else value
+        changed_units = {i: str(self.units_list[i]) for i in self.units_list if units.get(i) != self.units_list[i]}
+        header = {'kind': 'result', 'calculation': calculation, 'columns': new_columns, 'attributes': attributes,
+                  'units': changed_units}
+        return header, arrays
+
+    def apply_outputs(self, data: {}, header: dict, arrays: dict):
+        """
+        function applies cached outputs of a calculation to the data & this Data Calculations sheet
+        :param data: csv data file user selects from desktop
+        :param header: cached header (columns, results, units)
+        :param arrays: cached arrays
+        :return: updated calculation data
+        """
+        for (j, col_name) in enumerate(header['columns']):
+            data[col_name] = arrays['column ' + str(j)]
+        for name in header['attributes']:
+            setattr(self, name, header['attributes'][name])
+        for name in self.calculation_outputs[header['calculation']]:
+            if name in arrays:
+                setattr(self, name, arrays[name].tolist())
+        self.units_list.update(header['units'])
+        return data
+
+    @staticmethod
+    def outputs_match(computed: tuple, cached: tuple):
+        """
+        function compares recalculated outputs against cached outputs (numbers within floating point tolerance)
+        :param computed: header & arrays of the recalculation
+        :param cached: header & arrays of the cache entry
+        :return: True or False
+        """
+        (header, arrays), (cached_header, cached_arrays) = computed, cached
+        if header['columns'] != cached_header['columns'] or header['units'] != cached_header['units']:
+            return False
+        if set(header['attributes']) != set(cached_header['attributes']) or set(arrays) != set(cached_arrays):
+            return False
+        for name in header['attributes']:
+            value, cached_value = header['attributes'][name], cached_header['attributes'][name]
+            if isinstance(value, (bool, str)) or isinstance(cached_value, (bool, str)):
+                if value != cached_value:
+                    return False
+            elif not np.allclose(value, cached_value, equal_nan=True):
+                return False
+        for name in arrays:
+            if arrays[name].shape != cached_arrays[name].shape:
+                return False
+            if not np.allclose(arrays[name], cached_arrays[name], equal_nan=True):
+                return False
+        return True
+
     def can_compute_stress(self):
         """
         function checks if software can compute engineering stress; requires load column & initial area
@@ -2117,6 +5752,816 @@ class GraphSoftware(tk.Frame):
         else:
             self.create_pop_up('Cannot compute energy dissipated because a stress-strain curve cannot be generated due one of the following missing parameters: stress calculation, strain calculation, stress-strain type.')
 
+    def can_compute_cycle_energy(self):
+        """
+        function checks if software can compute the cumulative & per-cycle energy of a material; requires stress-strain
+        (either true or engineering) & the displacement column that defines the cycles
+        :return: compute cycle energy availability or pop-up w/ potential missing parameters
+        """
+        if self.compute_stress is True and self.compute_strain is True and self.type_exists is True and self.d is True:
+            self.compute_cycle_energy = True
+        else:
+            self.create_pop_up('Cannot compute cycle energy because a stress-strain curve cannot be generated due one of the following missing parameters: stress calculation, strain calculation, stress-strain type, displacement column.')
+
+    def strain_sweep_window(self):
+        """
+        function runs the strain range sweep & creates a Strain Range Sweep sheet w/ heatmaps of the modulus & R^2 of
+        every (start, end) pair; clicking a cell (or the most stable window button) sets the strain range
+        :return: Strain Range Sweep sheet or pop-up
+        """
+        if self.compute_stress is False or self.compute_strain is False or self.type_exists is False:
+            self.create_pop_up('Cannot sweep strain ranges because a stress-strain curve cannot be generated due one of the following missing parameters: stress calculation, strain calculation, stress-strain type.')
+            return
+        (edges, modulus, r2) = self.strain_sweep()
+        best = self.stable_window(edges, modulus, r2)
+        if best is None:
+            self.create_pop_up('No strain window w/ at least 3 points was found.')
+            return
+        sweep_pop_up = tk.Toplevel()
+        sweep_pop_up.title('Strain Range Sweep')
+        tk.Label(sweep_pop_up, text='CSV File' + str(self.csv_index + 1) + ' strain range sweep',
+                 font='Helvetica 18 bold').grid(row=0, column=0, columnspan=4, sticky=tk.W)
+        fig = Figure(figsize=(12, 5), dpi=100)
+        extent = (edges[0], edges[-1], edges[0], edges[-1])
+        limits = np.nanpercentile(modulus, (5, 95))
+        for (k, values, title, (low, high)) in ((1, modulus, "Young's Modulus (" + self.stress_pascal_unit + ')', limits),
+                                                 (2, r2, 'R^2', (None, None))):
+            ax = fig.add_subplot(1, 2, k, xlabel='Strain start', ylabel='Strain end', title=title)
+            image = ax.imshow(values.T, origin='lower', extent=extent, aspect='auto', cmap='magma', vmin=low, vmax=high)
+            fig.colorbar(image, ax=ax)
+            ax.plot(best[0], best[1], marker='x', markersize=10, color='#00c000')
+        canvas = FigureCanvasTkAgg(fig, master=sweep_pop_up)
+        canvas.draw()
+        canvas.get_tk_widget().grid(row=1, column=0, columnspan=4, sticky=tk.NW)
+        best_label = tk.Label(sweep_pop_up, text='Most stable window: strain ' + '{:.6g}'.format(best[0]) + ' to ' +
+                              '{:.6g}'.format(best[1]) + ', modulus ' + '{:.6g}'.format(best[2]) + ' (' +
+                              self.stress_pascal_unit + '), R^2 ' + '{:.4f}'.format(best[3]))
+        best_label.grid(row=2, column=0, columnspan=3, sticky=tk.W)
+        chosen_label = tk.Label(sweep_pop_up, text='Click a cell to use its strain range.')
+        chosen_label.grid(row=3, column=0, columnspan=3, sticky=tk.W)
+
+        def use_cell(event):
+            if event.inaxes is None or event.xdata is None or event.ydata <= event.xdata:
+                return
+            self.set_strain_range(event.xdata, event.ydata)
+            chosen_label.configure(text='Strain range set to ' + '{:.6g}'.format(event.xdata) + ' to ' +
+                                   '{:.6g}'.format(event.ydata) + '.')
+
+        canvas.mpl_connect('button_press_event', use_cell)
+        tk.Button(sweep_pop_up, text='Use Most Stable Window',
+                  command=lambda: self.set_strain_range(best[0], best[1])).grid(row=2, column=3, sticky=tk.EW)
+
+    def material_sweep_window(self):
+        """
+        function checks the parameters, runs the material parameter sweep & creates a Material Parameter Sweep sheet
+        w/ the table of moduli for every (Poisson ratio, known elastic modulus) pair & contour plots of Sneddon's
+        corrected modulus for area & volume conservation
+        :return: Material Parameter Sweep sheet or pop-up
+        """
+        if self.csm is False or self.d is False or self.s is False or self.h is False or self.csm_s is False or self.csm_e is False:
+            self.create_pop_up('Cannot sweep material parameters due to one of the following missing parameters: CSM column, displacement column, specimen area, specimen height, CSM range.')
+            return
+        if self.sweep_modulus_start <= 0.0 or self.sweep_modulus_end <= 0.0 or not 0.0 <= self.sweep_poisson_start < 1.0 \
+                or not 0.0 <= self.sweep_poisson_end < 1.0:
+            self.create_pop_up('Please enter positive known elastic moduli & Poisson ratios from 0 to 1 for the sweep.')
+            return
+        (poisson, known, results) = self.material_sweep()
+        values = np.concatenate([np.append(grid.ravel(), csm) for (csm, grid) in results.values()])
+        (divisor, unit) = self.pascal_scale(float(np.nanmean(values)) if np.isfinite(values).any() else 0.0)
+        (poisson_grid, known_grid) = np.meshgrid(poisson, known, indexing='ij')
+        rows = np.column_stack((poisson_grid.ravel(), known_grid.ravel()) +
+                               tuple(column for (csm, grid) in results.values()
+                                     for column in (np.full(grid.size, csm / divisor), grid.ravel() / divisor)))
+        sweep_pop_up = tk.Toplevel()
+        sweep_pop_up.title('Material Parameter Sweep')
+        table = TableInterface(sweep_pop_up, 'CSV File' + str(self.csv_index + 1) + ' material parameter sweep',
+                               self.material_sweep_columns, rows, {name: unit for name in self.material_sweep_columns[2:]})
+        table.grid()
+        fig = Figure(figsize=(8, 4), dpi=100)
+        for (k, (conservation, (csm, grid))) in enumerate(results.items()):
+            ax = fig.add_subplot(1, 2, k + 1, xlabel='Poisson Ratio', ylabel='Known Elastic Modulus',
+                                 title="Sneddon (" + conservation + ") (" + unit + ")")
+            if np.isfinite(grid).sum() >= 4:
+                contours = ax.contourf(poisson, known, grid.T / divisor, levels=15, cmap='magma')
+                fig.colorbar(contours, ax=ax)
+        fig.tight_layout()
+        canvas = FigureCanvasTkAgg(fig, master=sweep_pop_up)
+        canvas.draw()
+        canvas.get_tk_widget().grid(row=1, column=5, rowspan=4, sticky=tk.NW)
+
+    def input_material_sweep(self):
+        """
+        function creates the Material Parameter Sweep header, entries for the Poisson ratio & known elastic modulus
+        ranges and the run button
+        :return: material sweep ranges
+        """
+        def callback(uisps):
+            self.sweep_poisson_start = float(uisps.get())
+
+        def callback2(uispe):
+            self.sweep_poisson_end = float(uispe.get())
+
+        def callback3(uisms):
+            self.sweep_modulus_start = float(uisms.get())
+
+        def callback4(uisme):
+            self.sweep_modulus_end = float(uisme.get())
+
+        self.create_header("Material Parameter Sweep ↓", 57, 0, 5)
+        uisps = tk.DoubleVar(value=self.sweep_poisson_start)
+        uispe = tk.DoubleVar(value=self.sweep_poisson_end)
+        self.user_input_label_sweep_poisson = tk.Label(self.parent, text="Enter Poisson ratio start & end:")
+        self.user_input_label_sweep_poisson.grid(row=58, column=0, columnspan=4, sticky=tk.E)
+        self.user_input_sweep_poisson_s = tk.Entry(self.parent, textvariable=uisps)
+        self.user_input_sweep_poisson_s.bind('<Return>', (lambda _: callback(self.user_input_sweep_poisson_s)))
+        self.user_input_sweep_poisson_s.grid(row=58, column=4, columnspan=3, sticky=tk.W)
+        self.user_input_sweep_poisson_e = tk.Entry(self.parent, textvariable=uispe)
+        self.user_input_sweep_poisson_e.bind('<Return>', (lambda _: callback2(self.user_input_sweep_poisson_e)))
+        self.user_input_sweep_poisson_e.grid(row=58, column=7, columnspan=3, sticky=tk.W)
+        uisms = tk.DoubleVar(value=self.sweep_modulus_start)
+        uisme = tk.DoubleVar(value=self.sweep_modulus_end)
+        self.user_input_label_sweep_modulus = tk.Label(self.parent, text="Enter known elastic modulus start & end:")
+        self.user_input_label_sweep_modulus.grid(row=59, column=0, columnspan=4, sticky=tk.E)
+        self.user_input_sweep_modulus_s = tk.Entry(self.parent, textvariable=uisms)
+        self.user_input_sweep_modulus_s.bind('<Return>', (lambda _: callback3(self.user_input_sweep_modulus_s)))
+        self.user_input_sweep_modulus_s.grid(row=59, column=4, columnspan=3, sticky=tk.W)
+        self.user_input_sweep_modulus_e = tk.Entry(self.parent, textvariable=uisme)
+        self.user_input_sweep_modulus_e.bind('<Return>', (lambda _: callback4(self.user_input_sweep_modulus_e)))
+        self.user_input_sweep_modulus_e.grid(row=59, column=7, columnspan=3, sticky=tk.W)
+        self.create_button('Sweep Poisson Ratio & Known Modulus', self.material_sweep_window, 60, 3, 6)
+
+    def propagate_uncertainty(self):
+        """
+        function checks the parameters, propagates the geometry uncertainty into every completed result & displays the
+        mean, std. dev. & 95% confidence interval of each
+        :return: uncertainty results or pop-up
+        """
+        if self.s is False or self.h is False or self.type_exists is False or self.uncertainty_samples < 2:
+            self.create_pop_up('Cannot propagate geometry uncertainty due to one of the following missing parameters: specimen area, specimen height, stress-strain type, at least 2 samples.')
+            return
+        samples = self.geometry_uncertainty()
+        if len(samples) == 0:
+            self.create_pop_up('First calculate the slope, CSM or Sneddon modulus, ultimate stress-strain or energy dissipated.')
+            return
+        self.uncertainty_results = {}
+        for (name, values) in samples.items():
+            values = values[np.isfinite(values)]
+            if len(values) > 0:
+                (low, high) = np.percentile(values, (2.5, 97.5))
+                self.uncertainty_results[name] = [float(values.mean()), float(values.std()), float(low), float(high)]
+        self.display_uncertainty()
+
+    def display_uncertainty(self):
+        """
+        function displays the mean, std. dev. & 95% confidence interval of every result w/ propagated geometry
+        uncertainty & destroys previous labels each time labels are updated
+        :return: display labels for the uncertainty results
+        """
+        for label in getattr(self, 'display_uncertainty_labels', []):
+            label.destroy()
+        self.display_uncertainty_labels = []
+        for (r, (name, (mean, std, low, high))) in enumerate(self.uncertainty_results.items()):
+            (title, unit_name) = self.uncertainty_outputs[name]
+            unit = ' (' + getattr(self, unit_name) + ')' if unit_name is not None else ''
+            label = tk.Label(self.parent, text=title + ': ' + '{:.6g}'.format(mean) + ' +/- ' + '{:.3g}'.format(std) +
+                             unit + ', 95% CI [' + '{:.6g}'.format(low) + ', ' + '{:.6g}'.format(high) + ']')
+            label.grid(row=66 + r, column=0, columnspan=12, sticky=tk.W)
+            self.display_uncertainty_labels.append(label)
+
+    def input_geometry_uncertainty(self):
+        """
+        function creates the Geometry Uncertainty header, entries for the specimen area & height uncertainty and the
+        number of samples, the distribution option menu & the run button
+        :return: geometry uncertainty values
+        """
+        def callback(uiau):
+            self.area_uncertainty = float(uiau.get())
+
+        def callback2(uihu):
+            self.height_uncertainty = float(uihu.get())
+
+        def callback3(uius):
+            self.uncertainty_samples = int(float(uius.get()))
+
+        def select_distribution(arg):
+            self.uncertainty_distribution = self.clicked_uncertainty_distribution.get()
+
+        self.create_header("Geometry Uncertainty ↓", 61, 0, 5)
+        uiau = tk.DoubleVar(value=self.area_uncertainty)
+        self.user_input_label_area_uncertainty = tk.Label(self.parent, text="Enter specimen area uncertainty (nm^2):")
+        self.user_input_label_area_uncertainty.grid(row=62, column=0, columnspan=4, sticky=tk.E)
+        self.user_input_area_uncertainty = tk.Entry(self.parent, textvariable=uiau)
+        self.user_input_area_uncertainty.bind('<Return>', (lambda _: callback(self.user_input_area_uncertainty)))
+        self.user_input_area_uncertainty.grid(row=62, column=4, columnspan=3, sticky=tk.W)
+        uihu = tk.DoubleVar(value=self.height_uncertainty)
+        self.user_input_label_height_uncertainty = tk.Label(self.parent, text="Enter specimen height uncertainty (nm):")
+        self.user_input_label_height_uncertainty.grid(row=63, column=0, columnspan=4, sticky=tk.E)
+        self.user_input_height_uncertainty = tk.Entry(self.parent, textvariable=uihu)
+        self.user_input_height_uncertainty.bind('<Return>', (lambda _: callback2(self.user_input_height_uncertainty)))
+        self.user_input_height_uncertainty.grid(row=63, column=4, columnspan=3, sticky=tk.W)
+        uius = tk.IntVar(value=self.uncertainty_samples)
+        self.user_input_label_uncertainty_samples = tk.Label(self.parent, text="Enter number of samples:")
+        self.user_input_label_uncertainty_samples.grid(row=64, column=0, columnspan=4, sticky=tk.E)
+        self.user_input_uncertainty_samples = tk.Entry(self.parent, textvariable=uius)
+        self.user_input_uncertainty_samples.bind('<Return>', (lambda _: callback3(self.user_input_uncertainty_samples)))
+        self.user_input_uncertainty_samples.grid(row=64, column=4, columnspan=3, sticky=tk.W)
+        self.clicked_uncertainty_distribution = tk.StringVar(self.parent)
+        self.clicked_uncertainty_distribution.set(self.uncertainty_distribution)
+        drop_distribution = tk.OptionMenu(self.parent, self.clicked_uncertainty_distribution,
+                                          *self.uncertainty_distributions, command=select_distribution)
+        drop_distribution.grid(row=64, column=7, columnspan=2, sticky=tk.W)
+        self.create_button('Propagate Geometry Uncertainty', self.propagate_uncertainty, 65, 3, 6)
+
+    def can_apply_filter(self):
+        """
+        function checks if the selected filter can be applied to the load, displacement & CSM columns; selecting None
+        removes the filter (calculations use the raw columns again after Refresh Options)
+        :return: filter applied or pop-up w/ the invalid setting
+        """
+        conditioner = SignalConditioner(self.filter_method, self.filter_window, self.filter_order, self.filter_cutoff)
+        reason = conditioner.validate()
+        if reason != '':
+            self.create_pop_up('Cannot apply the filter because: ' + reason)
+            return
+        self.apply_filter = conditioner.active()
+
+    def input_signal_conditioning(self):
+        """
+        function creates the Signal Conditioning header, the filter option menu, entries for the window, order &
+        cutoff and the apply button
+        :return: signal conditioning values
+        """
+        def callback(uifw):
+            self.filter_window = int(float(uifw.get()))
+
+        def callback2(uifo):
+            self.filter_order = int(float(uifo.get()))
+
+        def callback3(uifc):
+            self.filter_cutoff = float(uifc.get())
+
+        def select_filter_method(arg):
+            self.filter_method = self.clicked_filter_method.get()
+
+        self.create_header("Signal Conditioning ↓", 72, 0, 5)
+        uifw = tk.IntVar(value=self.filter_window)
+        self.user_input_label_filter_window = tk.Label(self.parent, text="Enter window (odd # of points):")
+        self.user_input_label_filter_window.grid(row=73, column=0, columnspan=4, sticky=tk.E)
+        self.user_input_filter_window = tk.Entry(self.parent, textvariable=uifw)
+        self.user_input_filter_window.bind('<Return>', (lambda _: callback(self.user_input_filter_window)))
+        self.user_input_filter_window.grid(row=73, column=4, columnspan=3, sticky=tk.W)
+        uifo = tk.IntVar(value=self.filter_order)
+        self.user_input_label_filter_order = tk.Label(self.parent, text="Enter polynomial / filter order:")
+        self.user_input_label_filter_order.grid(row=74, column=0, columnspan=4, sticky=tk.E)
+        self.user_input_filter_order = tk.Entry(self.parent, textvariable=uifo)
+        self.user_input_filter_order.bind('<Return>', (lambda _: callback2(self.user_input_filter_order)))
+        self.user_input_filter_order.grid(row=74, column=4, columnspan=3, sticky=tk.W)
+        uifc = tk.DoubleVar(value=self.filter_cutoff)
+        self.user_input_label_filter_cutoff = tk.Label(self.parent, text="Enter cutoff (fraction of Nyquist):")
+        self.user_input_label_filter_cutoff.grid(row=75, column=0, columnspan=4, sticky=tk.E)
+        self.user_input_filter_cutoff = tk.Entry(self.parent, textvariable=uifc)
+        self.user_input_filter_cutoff.bind('<Return>', (lambda _: callback3(self.user_input_filter_cutoff)))
+        self.user_input_filter_cutoff.grid(row=75, column=4, columnspan=3, sticky=tk.W)
+        self.clicked_filter_method = tk.StringVar(self.parent)
+        self.clicked_filter_method.set(self.filter_method)
+        drop_filter_method = tk.OptionMenu(self.parent, self.clicked_filter_method, *SignalConditioner.methods,
+                                           command=select_filter_method)
+        drop_filter_method.grid(row=73, column=7, columnspan=3, sticky=tk.W)
+        self.create_button('Apply Signal Filter', self.can_apply_filter, 76, 3, 4)
+
+    def can_correct_drift(self):
+        """
+        function checks if software can correct the thermal drift of the displacement column; requires load &
+        displacement columns and at least one hold (load steps within the hold tolerance) of the minimum length
+        :return: drift correction applied or pop-up w/ potential missing parameters
+        """
+        if self.l is False or self.d is False:
+            self.create_pop_up('Cannot correct thermal drift due to one of the following missing parameters: load column, displacement column.')
+            self.drift_select.set(0)
+            return
+        if len(self.drift_correction().rates) == 0:
+            self.create_pop_up('Cannot correct thermal drift because no hold of at least ' + str(self.drift_min_rows) + ' rows was found in the load column; raise the hold tolerance or lower the minimum hold rows.')
+            self.drift_select.set(0)
+            return
+        self.correct_drift = True
+        self.display_drift()
+
+    def display_drift(self):
+        """
+        function displays the number of fitted holds & their mean drift rate & destroys the previous label each time
+        the label is updated
+        :return: display label for the thermal drift correction
+        """
+        try:
+            if self.display_drift_label:
+                self.display_drift_label.destroy()
+        except AttributeError:
+            lambda *args: None
+        correction = self.drift_correction()
+        time_unit = self.units_list.get(self.time_column, 'null') if self.time_column != '' else 'row'
+        unit = self.units_list.get(self.displacement_column, 'null') + '/' + time_unit
+        self.display_drift_label = tk.Label(self.parent, text=str(len(correction.rates)) + ' holds, mean drift rate ' +
+                                            '{:.4g}'.format(float(np.mean(correction.rates))) + ' (' + unit + ')')
+        self.display_drift_label.grid(row=81, column=5, columnspan=7, sticky=tk.W)
+
+    def input_drift_correction(self):
+        """
+        function creates the Thermal Drift Correction header, the time column option menu, entries for the hold
+        tolerance & minimum hold rows and the drift correction checkbox
+        :return: drift correction values
+        """
+        def callback(uiht):
+            self.hold_tolerance = float(uiht.get())
+
+        def callback2(uidm):
+            self.drift_min_rows = int(float(uidm.get()))
+
+        def select_time_column(arg):
+            self.time_column = '' if self.clicked_time_column.get() == 'Row Number' else self.clicked_time_column.get()
+
+        def determine_drift():
+            if self.drift_select.get() == 1:
+                self.can_correct_drift()
+            else:
+                self.correct_drift = False
+
+        self.create_header("Thermal Drift Correction ↓", 77, 0, 5)
+        tk.Label(self.parent, text="Select time column:").grid(row=78, column=0, columnspan=4, sticky=tk.E)
+        self.clicked_time_column = tk.StringVar(self.parent)
+        self.clicked_time_column.set(self.time_column if self.time_column != '' else 'Row Number')
+        drop_time_column = tk.OptionMenu(self.parent, self.clicked_time_column, 'Row Number',
+                                         *data_frames[self.csv_index].columns, command=select_time_column)
+        drop_time_column.grid(row=78, column=4, columnspan=3, sticky=tk.W)
+        uiht = tk.DoubleVar(value=self.hold_tolerance)
+        self.user_input_label_hold_tolerance = tk.Label(self.parent, text="Enter hold tolerance (|load step|):")
+        self.user_input_label_hold_tolerance.grid(row=79, column=0, columnspan=4, sticky=tk.E)
+        self.user_input_hold_tolerance = tk.Entry(self.parent, textvariable=uiht)
+        self.user_input_hold_tolerance.bind('<Return>', (lambda _: callback(self.user_input_hold_tolerance)))
+        self.user_input_hold_tolerance.grid(row=79, column=4, columnspan=3, sticky=tk.W)
+        uidm = tk.IntVar(value=self.drift_min_rows)
+        self.user_input_label_drift_min_rows = tk.Label(self.parent, text="Enter minimum hold rows:")
+        self.user_input_label_drift_min_rows.grid(row=80, column=0, columnspan=4, sticky=tk.E)
+        self.user_input_drift_min_rows = tk.Entry(self.parent, textvariable=uidm)
+        self.user_input_drift_min_rows.bind('<Return>', (lambda _: callback2(self.user_input_drift_min_rows)))
+        self.user_input_drift_min_rows.grid(row=80, column=4, columnspan=3, sticky=tk.W)
+        self.drift_select = tk.IntVar()
+        checkbox_drift = tk.Checkbutton(self.parent, text='Correct Thermal Drift', variable=self.drift_select,
+                                        onvalue=1, offvalue=0, command=determine_drift)
+        checkbox_drift.grid(row=81, column=0, columnspan=5, sticky=tk.W)
+
+    def can_zero_at_contact(self):
+        """
+        function checks if software can zero the load & displacement at the contact point; requires load &
+        displacement columns
+        :return: contact zeroing applied or pop-up w/ potential missing parameters
+        """
+        if self.l is False or self.d is False:
+            self.create_pop_up('Cannot detect the contact point due to one of the following missing parameters: load column, displacement column.')
+            self.contact_select.set(0)
+            return
+        self.zero_at_contact = True
+        self.display_contact()
+
+    def display_contact(self):
+        """
+        function displays the contact row w/ the raw load & displacement there & destroys the previous label each time
+        the label is updated
+        :return: display label for the contact point
+        """
+        try:
+            if self.display_contact_label:
+                self.display_contact_label.destroy()
+        except AttributeError:
+            lambda *args: None
+        row = self.contact_detection().row
+        frame = dataset_store.stored(self.csv_index)
+        offsets = dataset_store.stored_offsets(self.csv_index)
+        load = float(frame[self.load_column].iloc[row]) + offsets.get(self.load_column, 0.0)
+        displacement = float(frame[self.displacement_column].iloc[row]) + offsets.get(self.displacement_column, 0.0)
+        self.display_contact_label = tk.Label(self.parent, text='Contact at row ' + str(row) + ': load ' +
+                                              '{:.6g}'.format(load) + ' (' + self.units_list.get(self.load_column, 'null') +
+                                              '), displacement ' + '{:.6g}'.format(displacement) + ' (' +
+                                              self.units_list.get(self.displacement_column, 'null') + ')')
+        self.display_contact_label.grid(row=85, column=0, columnspan=12, sticky=tk.W)
+
+    def input_contact_detection(self):
+        """
+        function creates the Contact Point header, the detection method option menu, the load threshold entry and the
+        contact zeroing checkbox
+        :return: contact detection values
+        """
+        def callback(uict):
+            self.contact_threshold = float(uict.get())
+
+        def select_contact_method(arg):
+            self.contact_method = self.clicked_contact_method.get()
+
+        def determine_contact():
+            if self.contact_select.get() == 1:
+                self.can_zero_at_contact()
+            else:
+                self.zero_at_contact = False
+
+        self.create_header("Contact Point ↓", 82, 0, 5)
+        uict = tk.DoubleVar(value=self.contact_threshold)
+        self.user_input_label_contact_threshold = tk.Label(self.parent, text="Enter load threshold (above initial load):")
+        self.user_input_label_contact_threshold.grid(row=83, column=0, columnspan=4, sticky=tk.E)
+        self.user_input_contact_threshold = tk.Entry(self.parent, textvariable=uict)
+        self.user_input_contact_threshold.bind('<Return>', (lambda _: callback(self.user_input_contact_threshold)))
+        self.user_input_contact_threshold.grid(row=83, column=4, columnspan=3, sticky=tk.W)
+        self.clicked_contact_method = tk.StringVar(self.parent)
+        self.clicked_contact_method.set(self.contact_method)
+        drop_contact_method = tk.OptionMenu(self.parent, self.clicked_contact_method, *ContactDetector.methods,
+                                            command=select_contact_method)
+        drop_contact_method.grid(row=83, column=7, columnspan=3, sticky=tk.W)
+        self.contact_select = tk.IntVar()
+        checkbox_contact = tk.Checkbutton(self.parent, text='Zero Load & Displacement at Contact',
+                                          variable=self.contact_select, onvalue=1, offvalue=0, command=determine_contact)
+        checkbox_contact.grid(row=84, column=0, columnspan=7, sticky=tk.W)
+
+    def start_live_tail(self):
+        """
+        function starts following this sheet's CSV file while the instrument is still writing it; requires the
+        abscissa & ordinate to be selected (raw columns, or stress, strain & Energy (Cumulative) when their parameters
+        are entered)
+        :return: live plot polled every live_interval ms or pop-up
+        """
+        if self.live_tail is not None:
+            self.create_pop_up('The live tail is already running.')
+            return
+        if csv_list[self.csv_index] == 'parse':
+            self.create_pop_up('Cannot follow a parsed cycle; the live tail needs the CSV file the instrument writes.')
+            return
+        if self.a is False or self.o is False:
+            self.create_pop_up('Select the abscissa & ordinate to plot live first.')
+            return
+        try:
+            tail = LiveTail(csv_list[self.csv_index])
+        except (OSError, ValueError) as error:
+            self.create_pop_up('Cannot follow ' + os.path.basename(csv_list[self.csv_index]) + ': ' + str(error))
+            return
+        self.live_stress = None
+        self.live_strain = None
+        if self.l is True and self.s is True:
+            self.live_stress = self.stress_type if self.type_exists is True else 'Stress (Engineering)'
+            if self.live_stress == 'Stress (True)' and (self.d is False or self.h is False):
+                self.live_stress = 'Stress (Engineering)'
+            tail.add_column(self.live_stress)
+        if self.d is True and self.h is True:
+            self.live_strain = self.strain_type if self.type_exists is True else 'Strain (Engineering)'
+            tail.add_column(self.live_strain)
+            self.units_list[self.live_strain] = ''
+        if self.live_stress is not None and self.live_strain is not None:
+            tail.add_column('Energy (Cumulative)')
+        missing = [col_name for col_name in (self.abscissa, self.ordinate) if col_name not in tail.columns]
+        if len(missing) > 0:
+            self.create_pop_up('Cannot plot ' + ', '.join(missing) + ' live; select raw columns, stress, strain or Energy (Cumulative).')
+            return
+        self.units_list.update({col_name: tail.units[col_name] for col_name in tail.columns[:tail.raw_columns]
+                                if col_name not in self.units_list})
+        self.live_tail = tail
+        self.live_divisor = None
+        self.live_energy = 0.0
+        self.live_burst_floor = math.inf
+        self.live_burst_rows: list = []
+        self.live_bursts = np.zeros(0, dtype='int64')
+        self.live_limits = [math.inf, -math.inf, math.inf, -math.inf]
+        self.live_figure()
+        self.poll_live()
+
+    def stop_live_tail(self):
+        """
+        function stops the live tail; the dataset is read again in full so every calculation & the plot use all rows
+        written so far
+        :return: full plot (if the plotted columns are calculated outside the live tail too)
+        """
+        if self.live_tail is None:
+            return
+        if self.live_job is not None:
+            self.parent.after_cancel(self.live_job)
+            self.live_job = None
+        self.live_tail = None
+        dataset_store.remove(self.csv_index)
+        data = self.load_data()
+        if self.abscissa in data.columns and self.ordinate in data.columns:
+            self.plot()
+
+    def poll_live(self):
+        """
+        function processes the rows appended since the last poll, updates the live plot & label and re-schedules itself
+        :return: updated live plot or pop-up (live tail stopped)
+        """
+        self.live_job = None
+        try:
+            (first, end) = self.live_step()
+        except (OSError, ValueError) as error:
+            self.live_tail = None
+            self.create_pop_up('Live tail stopped: ' + str(error))
+            return
+        if end > first:
+            self.live_redraw(first, end)
+            self.display_live()
+        self.live_job = self.parent.after(self.live_interval, self.poll_live)
+
+    def live_step(self):
+        """
+        function polls the live CSV file & calculates stress, strain, cumulative energy & bursts for the new rows only
+        :return: first & end row of the new rows
+        """
+        (first, end) = self.live_tail.poll()
+        if end > first:
+            with profiler.span('live_tail', self.csv_index, end - first):
+                self.live_update(first, end)
+        return first, end
+
+    def live_update(self, first, end):
+        """
+        function fills the calculated columns of the new rows of the live buffer; stress & strain use the same
+        formulas as their calculations (the stress unit is picked from the first rows & then kept), the cumulative
+        energy continues the trapezoid sum of the rows before & bursts are counted as in bursts() over all rows so far
+            bursts: rows whose strain difference is at least half the current threshold are kept as candidates (new
+            rows are checked once), so only the candidates are compared w/ the threshold on each poll; all rows are
+            scanned again only when the threshold falls below half its value at the last scan
+        :param first: first new row
+        :param end: end of the new rows
+        :return: calculated columns of the new rows, live energy & bursts
+        """
+        tail = self.live_tail
+        values = tail.values
+        rows = slice(first, end)
+        if self.live_stress is not None:
+            stress = values[rows, tail.columns.index(self.load_column)] / self.specimen_area * 1000000000000000
+            if self.live_stress == 'Stress (True)':
+                stress = stress * (self.specimen_height + values[rows, tail.columns.index(self.displacement_column)]) / self.specimen_height
+            if self.live_divisor is None:
+                (self.live_divisor, self.stress_pascal_unit) = self.pascal_scale(float(np.nanmean(stress)) if np.isfinite(stress).any() else 0.0)
+                self.units_list[self.live_stress] = self.stress_pascal_unit
+                self.units_list['Energy (Cumulative)'] = self.stress_pascal_unit
+            values[rows, tail.columns.index(self.live_stress)] = stress / self.live_divisor
+        if self.live_strain is not None:
+            displacement = values[rows, tail.columns.index(self.displacement_column)]
+            if self.live_strain == 'Strain (True)':
+                values[rows, tail.columns.index(self.live_strain)] = np.log((self.specimen_height + displacement) / self.specimen_height)
+            else:
+                values[rows, tail.columns.index(self.live_strain)] = displacement / self.specimen_height
+        if self.live_stress is None or self.live_strain is None:
+            return
+        stress = values[max(first - 1, 0):end, tail.columns.index(self.live_stress)]
+        strain = tail.column(self.live_strain)
+        increments = np.cumsum(0.5 * (stress[1:] + stress[:-1]) * np.diff(strain[max(first - 1, 0):end]))
+        energy = tail.columns.index('Energy (Cumulative)')
+        if first == 0:
+            values[rows, energy] = np.concatenate(([0.0], increments))
+        else:
+            values[rows, energy] = values[first - 1, energy] + increments
+        self.live_energy = float(values[end - 1, energy])
+        if end < 2:
+            return
+        mean_difference = (strain[end - 1] - strain[0]) / (end - 1)
+        if (mean_difference > 0.0) is False:
+            return
+        threshold = self.burst_threshold(mean_difference)
+        if threshold < self.live_burst_floor:
+            self.live_burst_floor = 0.5 * threshold
+            self.live_burst_rows = (np.flatnonzero(np.diff(strain) >= self.live_burst_floor) + 1).tolist()
+        else:
+            start = max(first, 1)
+            new_rows = np.flatnonzero(strain[start:end] - strain[start - 1:end - 1] >= self.live_burst_floor) + start
+            self.live_burst_rows.extend(new_rows.tolist())
+        candidates = np.asarray(self.live_burst_rows, dtype='int64')
+        self.live_bursts = candidates[strain[candidates] - strain[candidates - 1] >= threshold]
+
+    def live_figure(self):
+        """
+        function creates the live plot once; polls only update the data of its line & its limits
+        :return: empty live plot of ordinate vs. abscissa
+        """
+        self.fig = Figure(figsize=(12, 10), dpi=100)
+        ax = self.fig.add_subplot(1, 1, 1, xlabel=self.abscissa + ' (' + self.units_list.get(self.abscissa, '') + ')',
+                                  ylabel=self.ordinate + ' (' + self.units_list.get(self.ordinate, '') + ')')
+        (self.live_line,) = ax.plot([], [], linestyle='', marker='o', markersize=2.6, color='#8b008b')
+        ax.xaxis.label.set_size(12.5)
+        ax.yaxis.label.set_size(12.5)
+        ax.tick_params(axis=tk.X, labelsize=12.5)
+        ax.tick_params(axis=tk.Y, labelsize=12.5)
+        self.live_canvas = FigureCanvasTkAgg(self.fig, master=self.parent)
+        self.live_canvas.draw()
+        self.live_canvas.get_tk_widget().grid(row=0, rowspan=44, column=13, columnspan=15, sticky=tk.E)
+
+    def live_redraw(self, first, end):
+        """
+        function hands the live line the rows read so far & widens the axis limits by the new rows only (entered
+        domain & range are kept), then schedules a redraw of the canvas
+        :param first: first new row
+        :param end: end of the new rows
+        :return: updated live plot
+        """
+        x = self.live_tail.column(self.abscissa)
+        y = self.live_tail.column(self.ordinate)
+        self.live_line.set_data(x, y)
+        limits = self.live_limits
+        for (k, new) in ((0, x[first:end]), (2, y[first:end])):
+            new = new[np.isfinite(new)]
+            if len(new) > 0:
+                limits[k] = min(limits[k], float(new.min()))
+                limits[k + 1] = max(limits[k + 1], float(new.max()))
+        ax = self.live_line.axes
+        if self.xmin_exists is True and self.xmax_exists is True:
+            ax.set_xlim(self.xmin_value, self.xmax_value)
+        elif limits[0] < limits[1]:
+            ax.set_xlim(limits[0], limits[1] + 0.02 * (limits[1] - limits[0]))
+        if self.ymin_exists is True and self.ymax_exists is True:
+            ax.set_ylim(self.ymin_value, self.ymax_value)
+        elif limits[2] < limits[3]:
+            ax.set_ylim(limits[2], limits[3] + 0.02 * (limits[3] - limits[2]))
+        self.live_canvas.draw_idle()
+
+    def display_live(self):
+        """
+        function displays the rows read, the cumulative energy & the number of bursts of the live tail & destroys the
+        previous label each time the label is updated
+        :return: display label for the live tail
+        """
+        try:
+            if self.display_live_label:
+                self.display_live_label.destroy()
+        except AttributeError:
+            lambda *args: None
+        text = 'Live: ' + str(self.live_tail.rows) + ' rows'
+        if self.live_stress is not None and self.live_strain is not None:
+            text += ', energy ' + '{:.6g}'.format(self.live_energy) + ' (' + self.stress_pascal_unit + '), ' + \
+                    str(len(self.live_bursts)) + ' bursts'
+        self.display_live_label = tk.Label(self.parent, text=text)
+        self.display_live_label.grid(row=89, column=0, columnspan=12, sticky=tk.W)
+
+    def input_live_tail(self):
+        """
+        function creates the Live Tail header, the poll interval entry and the start & stop buttons
+        :return: live tail values
+        """
+        def callback(uili):
+            self.live_interval = max(50, int(uili.get()))
+
+        self.create_header("Live Tail ↓", 86, 0, 5)
+        uili = tk.IntVar(value=self.live_interval)
+        self.user_input_label_live_interval = tk.Label(self.parent, text="Enter poll interval (ms):")
+        self.user_input_label_live_interval.grid(row=87, column=0, columnspan=4, sticky=tk.E)
+        self.user_input_live_interval = tk.Entry(self.parent, textvariable=uili)
+        self.user_input_live_interval.bind('<Return>', (lambda _: callback(self.user_input_live_interval)))
+        self.user_input_live_interval.grid(row=87, column=4, columnspan=3, sticky=tk.W)
+        self.create_button('Start Live Tail', self.start_live_tail, 88, 3, 3)
+        self.create_button('Stop Live Tail', self.stop_live_tail, 88, 6, 3)
+
+    def can_compute_rolling_modulus(self):
+        """
+        function checks if software can compute the rolling modulus of a material; requires stress-strain (either true
+        or engineering) & a window of at least 2 points (or a positive strain window)
+        :return: compute rolling modulus availability or pop-up w/ potential missing parameters
+        """
+        if self.compute_stress is True and self.compute_strain is True and self.type_exists is True:
+            if (self.rolling_window_unit == 'Points' and self.rolling_window >= 2) or \
+                    (self.rolling_window_unit == 'Strain' and self.rolling_window > 0.0):
+                self.compute_rolling_modulus = True
+            else:
+                self.create_pop_up('Cannot compute rolling modulus because the window must be at least 2 points or a positive strain.')
+        else:
+            self.create_pop_up('Cannot compute rolling modulus because a stress-strain curve cannot be generated due one of the following missing parameters: stress calculation, strain calculation, stress-strain type.')
+
+    def input_rolling_modulus(self):
+        """
+        function creates the Rolling Modulus header, the window entry w/ its unit (points or strain) and the
+        calculate button
+        :return: rolling modulus window values
+        """
+        def callback(uirw):
+            self.rolling_window = float(uirw.get())
+
+        def select_window_unit(arg):
+            self.rolling_window_unit = self.clicked_rolling_window_unit.get()
+
+        self.create_header("Rolling Modulus ↓", 54, 0, 5)
+        uirw = tk.DoubleVar(value=self.rolling_window)
+        self.user_input_label_rolling_window = tk.Label(self.parent, text="Enter window:")
+        self.user_input_label_rolling_window.grid(row=55, column=0, columnspan=4, sticky=tk.E)
+        self.user_input_rolling_window = tk.Entry(self.parent, textvariable=uirw)
+        self.user_input_rolling_window.bind('<Return>', (lambda _: callback(self.user_input_rolling_window)))
+        self.user_input_rolling_window.grid(row=55, column=4, columnspan=3, sticky=tk.W)
+        self.clicked_rolling_window_unit = tk.StringVar(self.parent)
+        self.clicked_rolling_window_unit.set(self.rolling_window_unit)
+        drop_window_unit = tk.OptionMenu(self.parent, self.clicked_rolling_window_unit, *self.rolling_window_units,
+                                         command=select_window_unit)
+        drop_window_unit.grid(row=55, column=7, columnspan=2, sticky=tk.W)
+        self.create_button('Calculate Rolling Modulus', self.can_compute_rolling_modulus, 56, 3, 4)
+
+    def cycle_energy_window(self):
+        """
+        function creates a Cycle Energy sheet w/ the per-cycle loading, recovered & dissipated energy table & plot
+        :return: Cycle Energy sheet or pop-up
+        """
+        if self.compute_cycle_energy is False or len(self.cycle_energy_table) == 0:
+            self.create_pop_up('First calculate cycle energy, then click Refresh Options.')
+            return
+        units = {'Max Stress': self.stress_pascal_unit, 'Loading Energy': self.stress_pascal_unit,
+                 'Recovered Energy': self.stress_pascal_unit, 'Dissipated Energy': self.stress_pascal_unit}
+        table_pop_up = tk.Toplevel()
+        table_pop_up.title('Cycle Energy')
+        table = TableInterface(table_pop_up, 'CSV File' + str(self.csv_index + 1) + ' cycle energy',
+                               self.cycle_energy_columns, self.cycle_energy_table, units)
+        table.grid()
+
+    def failure_candidates_window(self):
+        """
+        function creates a Failure Candidates sheet w/ the ranked failure points (row, strain, stress & confidence)
+        :return: Failure Candidates sheet or pop-up
+        """
+        if self.compute_uss is False or len(self.failure_candidates) == 0:
+            self.create_pop_up('First calculate ultimate failure stress & strain, then click Refresh Options. No candidates are listed if the strain increments have no upward change point.')
+            return
+        table_pop_up = tk.Toplevel()
+        table_pop_up.title('Failure Candidates')
+        table = TableInterface(table_pop_up, 'CSV File' + str(self.csv_index + 1) + ' failure candidates',
+                               self.failure_columns, self.failure_candidates, {'Stress': self.stress_pascal_unit})
+        table.grid()
+
+    def cycle_batch_controls(self):
+        """
+        function creates the Cycle Batch Analysis header, the cycle definition option menu & the run button
+        :return: cycle batch controls
+        """
+        def select_cycle_mode(arg):
+            self.cycle_mode = self.clicked_cycle_mode.get()
+
+        self.create_header("Cycle Batch Analysis ↓", 48, 0, 5)
+        self.clicked_cycle_mode = tk.StringVar(self.parent)
+        self.clicked_cycle_mode.set(self.cycle_mode)
+        drop_cycle_mode = tk.OptionMenu(self.parent, self.clicked_cycle_mode, *self.cycle_modes, command=select_cycle_mode)
+        drop_cycle_mode.grid(row=49, column=0, columnspan=3, sticky=tk.W)
+        self.create_button('Analyze All Cycles', self.cycle_batch_window, 49, 3, 4)
+
+    def cycle_batch_window(self):
+        """
+        function checks the parameters, runs the cycle batch analysis & creates a Cycle Batch sheet w/ the per-cycle
+        results table & fatigue trend plots against cycle number
+        :return: Cycle Batch sheet or pop-up
+        """
+        if self.l is False or self.d is False or self.s is False or self.h is False or self.type_exists is False:
+            self.create_pop_up('Cannot analyze cycles due to one of the following missing parameters: load column, displacement column, specimen area, specimen height, stress-strain type. CSM & Sneddon moduli also need the CSM column, CSM range, conservation, Poisson ratio & known elastic modulus.')
+            return
+        self.cycle_batch()
+        table_pop_up = tk.Toplevel()
+        table_pop_up.title('Cycle Batch Analysis')
+        table = TableInterface(table_pop_up, 'CSV File' + str(self.csv_index + 1) + ' cycle batch (' + self.cycle_mode + ')',
+                               self.cycle_batch_columns, self.cycle_batch_table, self.cycle_batch_units)
+        table.grid()
+
+    def input_oliver_pharr(self):
+        """
+        function creates the Oliver-Pharr header, entries for the fitted upper fraction of each unload & the area
+        function coefficient C0 (A = C0 * h_c^2; 24.5 for a Berkovich tip) and the run button
+        :return: Oliver-Pharr fraction & area coefficient values
+        """
+        def callback(uif):
+            self.unload_fraction = float(uif.get())
+
+        def callback2(uiac):
+            self.area_coefficient = float(uiac.get())
+
+        self.create_header("Oliver-Pharr Unloading Analysis ↓", 50, 0, 5)
+        uif = tk.DoubleVar(value=self.unload_fraction)
+        self.user_input_label_unload_fraction = tk.Label(self.parent, text="Enter fitted upper fraction of unload:")
+        self.user_input_label_unload_fraction.grid(row=51, column=0, columnspan=4, sticky=tk.E)
+        self.user_input_unload_fraction = tk.Entry(self.parent, textvariable=uif)
+        self.user_input_unload_fraction.bind('<Return>', (lambda _: callback(self.user_input_unload_fraction)))
+        self.user_input_unload_fraction.grid(row=51, column=4, columnspan=3, sticky=tk.W)
+        uiac = tk.DoubleVar(value=self.area_coefficient)
+        self.user_input_label_area_coefficient = tk.Label(self.parent, text="Enter area function coefficient C0:")
+        self.user_input_label_area_coefficient.grid(row=52, column=0, columnspan=4, sticky=tk.E)
+        self.user_input_area_coefficient = tk.Entry(self.parent, textvariable=uiac)
+        self.user_input_area_coefficient.bind('<Return>', (lambda _: callback2(self.user_input_area_coefficient)))
+        self.user_input_area_coefficient.grid(row=52, column=4, columnspan=3, sticky=tk.W)
+        self.create_button('Analyze All Unloads', self.oliver_pharr_window, 53, 3, 4)
+
+    def oliver_pharr_window(self):
+        """
+        function checks the parameters, runs the Oliver-Pharr analysis & creates a sheet w/ the per-unload table
+        :return: Oliver-Pharr sheet or pop-up
+        """
+        if self.l is False or self.d is False:
+            self.create_pop_up('Cannot analyze unloads due to one of the following missing parameters: load column, displacement column.')
+            return
+        if not 0.0 < self.unload_fraction <= 1.0 or self.area_coefficient <= 0.0:
+            self.create_pop_up('The fitted fraction must be between 0 and 1 and the area coefficient must be positive.')
+            return
+        self.oliver_pharr()
+        if len(self.oliver_pharr_table) == 0:
+            self.create_pop_up('No unloading segments w/ at least 4 points were found.')
+            return
+        table_pop_up = tk.Toplevel()
+        table_pop_up.title('Oliver-Pharr Unloading Analysis')
+        table = TableInterface(table_pop_up, 'CSV File' + str(self.csv_index + 1) + ' Oliver-Pharr',
+                               self.oliver_pharr_columns, self.oliver_pharr_table, self.oliver_pharr_units)
+        table.grid()
+
     def can_compute_bursts(self):
         """
         function checks if software can compute the burst events occurring in a material; requires stress-strain (either
@@ -2147,50 +6592,33 @@ class GraphSoftware(tk.Frame):
 
     def refresh_abscissa_options(self):
         """
-        function refreshes the 'Select Abscissa' options to include all up-to-date calculations
+        function updates the 'Select Abscissa' options to the columns dataset_store published for this dataset (only
+        added, removed or relabeled columns are changed & nothing is recalculated)
         :return: options menu 'Select Abscissa' updated
         """
-        self.clicked_abscissa_button.set('Select Abscissa')
-        self.drop1['menu'].delete(0, 'end')
-        if csv_list[self.csv_index] != 'parse':
-            data_frames[self.csv_index] = pd.read_csv(csv_list[self.csv_index])
-        data_frames[self.csv_index] = self.reindex(data_frames[self.csv_index])
-        data_frames[self.csv_index] = self.re_zero(data_frames[self.csv_index])
-        data_frames[self.csv_index] = self.check(data_frames[self.csv_index])
-        column_names = []
-        for col_name in data_frames[self.csv_index].columns:
-            column_names.append(col_name)
-        for i in column_names[:]:
-            self.drop1['menu'].add_command(label=i + ' (' + self.units_list[i] + ')',
-                                           command=tk._setit(self.clicked_abscissa_button, i,
-                                                             self.select_abscissa_data))
+        self.listed_abscissa = update_option_menu(self.drop1['menu'], self.clicked_abscissa_button, self.listed_abscissa,
+                                                  dataset_store.listed_columns(self.csv_index),
+                                                  self.select_abscissa_data, 'Select Abscissa')
 
     def refresh_ordinate_options(self):
         """
-        function refreshes the 'Select ORdinate' options to include all up-to-date claculations
+        function updates the 'Select Ordinate' options to the columns dataset_store published for this dataset (only
+        added, removed or relabeled columns are changed & nothing is recalculated)
         :return: options menu 'Select Ordinate' updated
         """
-        self.clicked_ordinate_button.set('Select Ordinate')
-        self.drop2['menu'].delete(0, 'end')
-        if csv_list[self.csv_index] != 'parse':
-            data_frames[self.csv_index] = pd.read_csv(csv_list[self.csv_index])
-        data_frames[self.csv_index] = self.reindex(data_frames[self.csv_index])
-        data_frames[self.csv_index] = self.re_zero(data_frames[self.csv_index])
-        data_frames[self.csv_index] = self.check(data_frames[self.csv_index])
-        column_names = []
-        for col_name in data_frames[self.csv_index].columns:
-            column_names.append(col_name)
-        for i in column_names[:]:
-            self.drop2['menu'].add_command(label=i + ' (' + self.units_list[i] + ')',
-                                           command=tk._setit(self.clicked_ordinate_button, i,
-                                                             self.select_ordinate_data))
+        self.listed_ordinate = update_option_menu(self.drop2['menu'], self.clicked_ordinate_button, self.listed_ordinate,
+                                                  dataset_store.listed_columns(self.csv_index),
+                                                  self.select_ordinate_data, 'Select Ordinate')
 
     def refresh(self):
         """
         function refreshes the software to update 'Select Abscissa', 'Select Ordinate', or display Young's modulus
-        slope, CSM, and Sneddon correction methods
+        slope, CSM, and Sneddon correction methods; the dataset is calculated once & its new columns reach the
+        options menus through dataset_store
         :return: updated software GUI
         """
+        self.load_data()
+        self.menus_stale = False
         self.refresh_abscissa_options()
         self.refresh_ordinate_options()
         if self.compute_yms is True:
@@ -2240,15 +6668,9 @@ class GraphSoftware(tk.Frame):
         :param arg: N/A
         :return: updated global abscissa & both_selected()
         """
-        if csv_list[self.csv_index] != 'parse':
-            data_frames[self.csv_index] = pd.read_csv(csv_list[self.csv_index])
-        data_frames[self.csv_index] = self.reindex(data_frames[self.csv_index])
-        data_frames[self.csv_index] = self.re_zero(data_frames[self.csv_index])
-        data_frames[self.csv_index] = self.check(data_frames[self.csv_index])
-        for col_name in data_frames[self.csv_index].columns:
-            if col_name == self.clicked_abscissa_button.get():
-                self.abscissa = col_name
-                self.a = True
+        if self.clicked_abscissa_button.get() in self.listed_columns():
+            self.abscissa = self.clicked_abscissa_button.get()
+            self.a = True
         if self.abscissa != '':
             self.both_selected()
 
@@ -2258,15 +6680,9 @@ class GraphSoftware(tk.Frame):
         :param arg: N/A
         :return: updated global ordinate & both_selected()
         """
-        if csv_list[self.csv_index] != 'parse':
-            data_frames[self.csv_index] = pd.read_csv(csv_list[self.csv_index])
-        data_frames[self.csv_index] = self.reindex(data_frames[self.csv_index])
-        data_frames[self.csv_index] = self.re_zero(data_frames[self.csv_index])
-        data_frames[self.csv_index] = self.check(data_frames[self.csv_index])
-        for col_name in data_frames[self.csv_index].columns:
-            if col_name == self.clicked_ordinate_button.get():
-                self.ordinate = col_name
-                self.o = True
+        if self.clicked_ordinate_button.get() in self.listed_columns():
+            self.ordinate = self.clicked_ordinate_button.get()
+            self.o = True
         if self.ordinate != '':
             self.both_selected()
 
@@ -2276,14 +6692,9 @@ class GraphSoftware(tk.Frame):
         :param arg: N/A
         :return: updated global load_column & can_compute_stress()
         """
-        if csv_list[self.csv_index] != 'parse':
-            data_frames[self.csv_index] = pd.read_csv(csv_list[self.csv_index])
-        data_frames[self.csv_index] = self.reindex(data_frames[self.csv_index])
-        data_frames[self.csv_index] = self.re_zero(data_frames[self.csv_index])
-        for col_name in data_frames[self.csv_index].columns:
-            if col_name == self.clicked_load_button.get():
-                self.load_column = col_name
-                self.l = True
+        if self.clicked_load_button.get() in self.listed_columns():
+            self.load_column = self.clicked_load_button.get()
+            self.l = True
         if self.load_column != '':
             self.can_compute_stress()
 
@@ -2293,14 +6704,9 @@ class GraphSoftware(tk.Frame):
         :param arg: N/A
         :return: updated global displacement_column & can_compute_strain()
         """
-        if csv_list[self.csv_index] != 'parse':
-            data_frames[self.csv_index] = pd.read_csv(csv_list[self.csv_index])
-        data_frames[self.csv_index] = self.reindex(data_frames[self.csv_index])
-        data_frames[self.csv_index] = self.re_zero(data_frames[self.csv_index])
-        for col_name in data_frames[self.csv_index].columns:
-            if col_name == self.clicked_displacement_button.get():
-                self.displacement_column = col_name
-                self.d = True
+        if self.clicked_displacement_button.get() in self.listed_columns():
+            self.displacement_column = self.clicked_displacement_button.get()
+            self.d = True
         if self.displacement_column != '':
             self.can_compute_strain()
 
@@ -2310,14 +6716,9 @@ class GraphSoftware(tk.Frame):
         :param arg: N/A
         :return: udpated global csm_column
         """
-        if csv_list[self.csv_index] != 'parse':
-            data_frames[self.csv_index] = pd.read_csv(csv_list[self.csv_index])
-        data_frames[self.csv_index] = self.reindex(data_frames[self.csv_index])
-        data_frames[self.csv_index] = self.re_zero(data_frames[self.csv_index])
-        for col_name in data_frames[self.csv_index].columns:
-            if col_name == self.clicked_csm_button.get():
-                self.csm_column = col_name
-                self.csm = True
+        if self.clicked_csm_button.get() in self.listed_columns():
+            self.csm_column = self.clicked_csm_button.get()
+            self.csm = True
         if self.csm_column != '':
             return
 
@@ -2328,44 +6729,188 @@ class GraphSoftware(tk.Frame):
         :return: plot: ordinate vs abscissa
         """
         self.can_export = True
-        if csv_list[self.csv_index] != 'parse':
-            data_frames[self.csv_index] = pd.read_csv(csv_list[self.csv_index])
-        data_frames[self.csv_index] = self.reindex(data_frames[self.csv_index])
-        data_frames[self.csv_index] = self.re_zero(data_frames[self.csv_index])
-        data_frames[self.csv_index] = self.check(data_frames[self.csv_index])
-
-        self.fig = Figure(figsize=(12, 10), dpi=100) # -temp- 10, 10
-        self.fig.add_subplot(1, 1, 1, xlabel=self.abscissa + ' (' + self.units_list[self.abscissa] + ')',
-                             ylabel=self.ordinate + ' (' + self.units_list[self.ordinate] + ')').scatter(data_frames[self.csv_index][self.abscissa], data_frames[self.csv_index][self.ordinate],
-                                                                                          s=7, color='#8b008b') # -temp- s=0.5
-        ax = self.fig.gca()
-        ax.xaxis.label.set_size(12.5)
-        ax.yaxis.label.set_size(12.5)
-        ax.tick_params(axis=tk.X, labelsize=12.5)
-        ax.tick_params(axis=tk.Y, labelsize=12.5)
+        self.load_data()
+        rows = self.plot_rows()
+        plotted = data_frames[self.csv_index] if rows is None else data_frames[self.csv_index][rows]
 
-        if self.xmin_exists is True and self.xmax_exists is True and self.ymin_exists is True and self.ymax_exists is True:
-            ax.set(xlim=(self.xmin_value, self.xmax_value), ylim=(self.ymin_value, self.ymax_value))
-        elif self.xmin_exists is True and self.xmax_exists is True:
-            ax.set(xlim=(self.xmin_value, self.xmax_value))
-        elif self.ymin_exists is True and self.ymax_exists is True:
-            ax.set(ylim=(self.ymin_value, self.ymax_value))
-        else:
-            xbound = data_frames[self.csv_index][self.abscissa].min()
-            ybound = data_frames[self.csv_index][self.ordinate].min()
-            ax.set(xlim=(xbound, None), ylim=(ybound, None))
+        with profiler.span('plot', self.csv_index, len(plotted), abscissa=self.abscissa, ordinate=self.ordinate,
+                           segment=self.plot_segment):
+            self.fig = Figure(figsize=(12, 10), dpi=100) # -temp- 10, 10
+            self.fig.add_subplot(1, 1, 1, xlabel=self.abscissa + ' (' + self.units_list[self.abscissa] + ')',
+                                 ylabel=self.ordinate + ' (' + self.units_list[self.ordinate] + ')').scatter(plotted[self.abscissa], plotted[self.ordinate],
+                                                                                              s=7, color='#8b008b') # -temp- s=0.5
+            ax = self.fig.gca()
+            ax.xaxis.label.set_size(12.5)
+            ax.yaxis.label.set_size(12.5)
+            ax.tick_params(axis=tk.X, labelsize=12.5)
+            ax.tick_params(axis=tk.Y, labelsize=12.5)
 
-        canvas = FigureCanvasTkAgg(self.fig, master=self.parent)
-        canvas.draw()
-        canvas.get_tk_widget().grid(row=0, rowspan=44, column=13, columnspan=15, sticky=tk.E)
+            if self.xmin_exists is True and self.xmax_exists is True and self.ymin_exists is True and self.ymax_exists is True:
+                ax.set(xlim=(self.xmin_value, self.xmax_value), ylim=(self.ymin_value, self.ymax_value))
+            elif self.xmin_exists is True and self.xmax_exists is True:
+                ax.set(xlim=(self.xmin_value, self.xmax_value))
+            elif self.ymin_exists is True and self.ymax_exists is True:
+                ax.set(ylim=(self.ymin_value, self.ymax_value))
+            else:
+                xbound = plotted[self.abscissa].min()
+                ybound = plotted[self.ordinate].min()
+                ax.set(xlim=(xbound, None), ylim=(ybound, None))
+
+            if self.timing_overlay is True:
+                ax.text(0.01, 0.99, self.timing_overlay_text(), transform=ax.transAxes, va='top', ha='left',
+                        family='monospace', fontsize=8, bbox=dict(facecolor='white', alpha=0.75, edgecolor='#8b008b'))
+
+            canvas = FigureCanvasTkAgg(self.fig, master=self.parent)
+            canvas.draw()
+            canvas.get_tk_widget().grid(row=0, rowspan=44, column=13, columnspan=15, sticky=tk.E)
+        (self.plot_axes, self.plot_canvas, self.burst_marker) = (ax, canvas, None)
+        self.attach_span_selector(ax, plotted)
+
+    def attach_span_selector(self, ax, plotted):
+        """
+        function lets user drag a strain window on the stress-strain plot; prefix sums of the plotted rows are built
+        once so the least-squares modulus & mean CSM modulus of the window update live while dragging, and releasing
+        the mouse fills the strain & CSM range entries
+        :param ax: axes of the plot
+        :param plotted: plotted rows
+        :return: span selector on stress vs. strain plots
+        """
+        self.span_selector = None
+        if self.type_exists is False or self.abscissa != self.strain_type or self.ordinate != self.stress_type:
+            return
+        extra = {}
+        self.span_csm = None
+        if self.csm is True and self.s is True and self.h is True and self.conservation_mode() != '':
+            self.span_csm = plotted[self.csm_column].to_numpy(dtype='float64')
+            extra['csm'] = self.span_csm * self.csm_geometry(plotted[self.displacement_column].to_numpy(dtype='float64'))
+        with profiler.span('span_sums', self.csv_index, len(plotted)):
+            self.span_sums = WindowSums(plotted[self.strain_type].to_numpy(dtype='float64'),
+                                        plotted[self.stress_type].to_numpy(dtype='float64'), extra)
+        self.span_selector = SpanSelector(ax, self.select_span, 'horizontal', useblit=True, interactive=True,
+                                          onmove_callback=self.move_span, props=dict(alpha=0.2, facecolor='#8b008b'))
+
+    def span_values(self, strain_start, strain_end):
+        """
+        function formats the least-squares modulus & mean CSM modulus of a strain window
+        :param strain_start: window start
+        :param strain_end: window end
+        :return: display text
+        """
+        (slope, n) = self.span_sums.slope(strain_start, strain_end)
+        text = 'Span modulus: ' + '{:.6g}'.format(slope) + ' (' + self.stress_pascal_unit + ') over ' + str(n) + ' points'
+        if self.span_csm is not None:
+            mean = self.span_sums.mean('csm', strain_start, strain_end)
+            (divisor, unit) = self.pascal_scale(mean)
+            text += '  |  mean CSM modulus: ' + '{:.6g}'.format(mean / divisor) + ' (' + unit + ')'
+        return text
+
+    def move_span(self, strain_start, strain_end):
+        """
+        function displays the modulus of the strain window while it is dragged
+        :param strain_start: window start
+        :param strain_end: window end
+        :return: updated span label
+        """
+        text = self.span_values(strain_start, strain_end)
+        try:
+            self.display_span.configure(text=text)
+        except (AttributeError, tk.TclError):
+            self.display_span = tk.Label(self.parent, text=text)
+            self.display_span.grid(row=11, column=6, columnspan=7, sticky=tk.W)
+
+    def select_span(self, strain_start, strain_end):
+        """
+        function fills the strain range (and the CSM range covered by the window's rows) w/ the selected window so the
+        modulus calculations use it
+        :param strain_start: window start
+        :param strain_end: window end
+        :return: strain & CSM range set
+        """
+        if strain_end <= strain_start:
+            return
+        self.move_span(strain_start, strain_end)
+        self.set_strain_range(strain_start, strain_end)
+        if self.span_csm is not None:
+            csm = self.span_csm[self.span_sums.rows(strain_start, strain_end)]
+            csm = csm[np.isfinite(csm)]
+            if len(csm) > 0:
+                self.csm_start, self.csm_end, self.csm_s, self.csm_e = float(csm.min()), float(csm.max()), True, True
+                for (entry, value) in ((self.user_input_csm_s, self.csm_start), (self.user_input_csm_e, self.csm_end)):
+                    entry.delete(0, tk.END)
+                    entry.insert(0, str(value))
+
+    def set_strain_range(self, strain_start, strain_end):
+        """
+        function sets the strain range used by the slope modulus & fills its entries
+        :param strain_start: strain start
+        :param strain_end: strain end
+        :return: strain range set
+        """
+        self.strain_start, self.strain_end, self.ss, self.se = float(strain_start), float(strain_end), True, True
+        for (entry, value) in ((self.user_input_strain_s, self.strain_start), (self.user_input_strain_e, self.strain_end)):
+            entry.delete(0, tk.END)
+            entry.insert(0, str(value))
+
+    def timing_overlay_text(self):
+        """
+        function formats the most recent profiler spans recorded for this CSV file into the on-plot timing overlay
+        :return: multi-line string w/ stage, duration (ms) & rows of each recent span
+        """
+        lines = ['Timing (last spans)']
+        for span in profiler.recent(self.csv_index):
+            lines.append('{:<22}{:>10.2f} ms  {} rows'.format(span['stage'], span['duration_ns'] / 1e6, span['rows']))
+        return '\n'.join(lines)
+
+    def check_timing_overlay(self):
+        """
+        function allows user to toggle the on-plot timing overlay that lists the most recent stage timings for this
+        CSV file
+        :return: timing overlay toggled
+        """
+        def determine_overlay():
+            self.timing_overlay = overlay_select.get() == 1
+
+        overlay_select = tk.IntVar()
+        checkbox_overlay = tk.Checkbutton(self.parent, text='Show Timing Overlay', variable=overlay_select, onvalue=1,
+                                          offvalue=0, command=determine_overlay)
+        checkbox_overlay.grid(row=47, column=0, columnspan=5, sticky=tk.W)
+
+    def select_plot_segment(self):
+        """
+        function allows user to plot only the loading, hold or unloading rows; the rows come from the segment index of
+        the displacement column (load column if no displacement column is selected)
+        :return: plot segment option menu
+        """
+        def select_segment(arg):
+            self.plot_segment = self.clicked_plot_segment.get()
+
+        self.clicked_plot_segment = tk.StringVar(self.parent)
+        self.clicked_plot_segment.set(self.plot_segment)
+        drop_plot_segment = tk.OptionMenu(self.parent, self.clicked_plot_segment, *self.plot_segments,
+                                          command=select_segment)
+        drop_plot_segment.grid(row=46, column=0, columnspan=3, sticky=tk.W)
+
+    def plot_rows(self):
+        """
+        function selects the rows of the plot segment from the segment index
+        :return: boolean mask of the plotted rows (None plots every row)
+        """
+        phase = self.plot_segments[self.plot_segment]
+        if phase is None:
+            return None
+        if self.d is True:
+            return self.segment_index(self.displacement_column).phase == phase
+        if self.l is True:
+            return self.segment_index(self.load_column).phase == phase
+        self.create_pop_up('Please select a displacement or load column to plot only the ' + self.plot_segment.lower() + '.')
+        return None
 
     def select_abscissa_button(self):
         """
         function creates initial 'Select Abscissa' options from original data set (pre-calculations)
         :return: options menu of raw data selectable data
         """
-        if csv_list[self.csv_index] != 'parse':
-            data_frames[self.csv_index] = pd.read_csv(csv_list[self.csv_index])
+        self.read_file()
         column_names = []
         for col_name in data_frames[self.csv_index].columns:
             column_names.append(col_name)
@@ -2380,14 +6925,14 @@ class GraphSoftware(tk.Frame):
                                                              self.select_abscissa_data))
 
         self.drop1.grid(row=0, column=0, columnspan=2)
+        self.listed_abscissa = {i: str(self.units_list[i]) for i in column_names}
 
     def select_ordinate_button(self):
         """
         function creates initial 'Select Ordinate' options from original data set (pre-calculations)
         :return: options menu of raw data selectable data
         """
-        if csv_list[self.csv_index] != 'parse':
-            data_frames[self.csv_index] = pd.read_csv(csv_list[self.csv_index])
+        self.read_file()
         column_names = []
         for col_name in data_frames[self.csv_index].columns:
             column_names.append(col_name)
@@ -2402,6 +6947,7 @@ class GraphSoftware(tk.Frame):
                                                              self.select_ordinate_data))
 
         self.drop2.grid(row=0, column=3, columnspan=2)
+        self.listed_ordinate = {i: str(self.units_list[i]) for i in column_names}
 
     def create_header(self, title, r, c, cs):
         """
@@ -2623,13 +7169,13 @@ class GraphSoftware(tk.Frame):
         """
 
         def determine_conservation():
-            if (area_select.get() == 1) & (volume_select.get() == 0):
+            if (self.area_select.get() == 1) & (self.volume_select.get() == 0):
                 self.area_conservation = True
                 self.volume_conservation = False
-            elif (area_select.get() == 0) & (volume_select.get() == 1):
+            elif (self.area_select.get() == 0) & (self.volume_select.get() == 1):
                 self.volume_conservation = True
                 self.area_conservation = False
-            elif (area_select.get() == 1) & (volume_select.get() == 1):
+            elif (self.area_select.get() == 1) & (self.volume_select.get() == 1):
                 self.area_conservation = False
                 self.volume_conservation = False
                 self.create_pop_up(
@@ -2640,13 +7186,13 @@ class GraphSoftware(tk.Frame):
                 self.create_pop_up(
                     'You have selected neither area conservation nor volume conservation. Please select one.')
 
-        area_select = tk.IntVar()
-        volume_select = tk.IntVar()
-        checkbox_area = tk.Checkbutton(self.parent, text='Area Conservation', variable=area_select, onvalue=1,
+        self.area_select = tk.IntVar()
+        self.volume_select = tk.IntVar()
+        checkbox_area = tk.Checkbutton(self.parent, text='Area Conservation', variable=self.area_select, onvalue=1,
                                        offvalue=0, command=determine_conservation)
         checkbox_area.grid(row=16, column=1, columnspan=3)
-        checkbox_volume = tk.Checkbutton(self.parent, text='Volume Conservation', variable=volume_select, onvalue=1,
-                                         offvalue=0, command=determine_conservation)
+        checkbox_volume = tk.Checkbutton(self.parent, text='Volume Conservation', variable=self.volume_select,
+                                         onvalue=1, offvalue=0, command=determine_conservation)
         checkbox_volume.grid(row=16, column=4, columnspan=3)
 
     def check_engineering_or_true_stress_strain(self):
@@ -2655,32 +7201,32 @@ class GraphSoftware(tk.Frame):
         :return: engineering or truee stress-strain selection
         """
         def determine_type():
-            if (engineering_select.get() == 1) & (true_select.get() == 0):
+            if (self.engineering_select.get() == 1) & (self.true_select.get() == 0):
                 if self.compute_stress is True and self.compute_strain is True:
                     self.stress_type = 'Stress (Engineering)'
                     self.strain_type = 'Strain (Engineering)'
                     self.type_exists = True
                 else:
                     self.create_pop_up('First calculate engineering stress-strain.')
-            elif (engineering_select.get() == 0) & (true_select.get() == 1):
+            elif (self.engineering_select.get() == 0) & (self.true_select.get() == 1):
                 if self.compute_true_stress is True and self.compute_true_strain is True:
                     self.stress_type = 'Stress (True)'
                     self.strain_type = 'Strain (True)'
                     self.type_exists = True
                 else:
                     self.create_pop_up('First calculate true stress-strain.')
-            elif (engineering_select.get() == 1) & (true_select.get() == 1):
+            elif (self.engineering_select.get() == 1) & (self.true_select.get() == 1):
                 self.create_pop_up('You have selected both engineering and true. Please select only one.')
                 self.type_exists = False
             else:
                 self.create_pop_up('You have selected neither engineering nor true. Please select one.')
                 self.type_exists = False
 
-        engineering_select = tk.IntVar()
-        true_select = tk.IntVar()
-        checkbox_engineering = tk.Checkbutton(self.parent, text='Engineering Stress-Strain', variable=engineering_select, onvalue=1, offvalue=0, command=determine_type)
+        self.engineering_select = tk.IntVar()
+        self.true_select = tk.IntVar()
+        checkbox_engineering = tk.Checkbutton(self.parent, text='Engineering Stress-Strain', variable=self.engineering_select, onvalue=1, offvalue=0, command=determine_type)
         checkbox_engineering.grid(row=7, column=8, columnspan=4, sticky=tk.W)
-        checkbox_true = tk.Checkbutton(self.parent, text='True Stress-Strain', variable=true_select, onvalue=1, offvalue=0, command=determine_type)
+        checkbox_true = tk.Checkbutton(self.parent, text='True Stress-Strain', variable=self.true_select, onvalue=1, offvalue=0, command=determine_type)
         checkbox_true.grid(row=8, column=8, columnspan=4, sticky=tk.W)
 
     def output_values(self, title, r, c, cs):
@@ -2788,8 +7334,7 @@ class GraphSoftware(tk.Frame):
         function creates the 'Select CSM Column' option menu for user to select corresponding column
         :return: updated option menu w/ CSM column selected
         """
-        if csv_list[self.csv_index] != 'parse':
-            data_frames[self.csv_index] = pd.read_csv(csv_list[self.csv_index])
+        self.read_file()
         column_names = []
         for col_name in data_frames[self.csv_index].columns:
             column_names.append(col_name)
@@ -2809,8 +7354,7 @@ class GraphSoftware(tk.Frame):
         function creates the 'Select Load Column' option menu for user to select corresponding column
         :return: updated option menu w/ load column selected
         """
-        if csv_list[self.csv_index] != 'parse':
-            data_frames[self.csv_index] = pd.read_csv(csv_list[self.csv_index])
+        self.read_file()
         column_names = []
         for col_name in data_frames[self.csv_index].columns:
             column_names.append(col_name)
@@ -2830,8 +7374,7 @@ class GraphSoftware(tk.Frame):
         function creates the 'Select Displacement Column' option menu for user to select corresponding column
         :return: updated option menu w/ displacement column selected
         """
-        if csv_list[self.csv_index] != 'parse':
-            data_frames[self.csv_index] = pd.read_csv(csv_list[self.csv_index])
+        self.read_file()
         column_names = []
         for col_name in data_frames[self.csv_index].columns:
             column_names.append(col_name)
@@ -2860,5 +7403,7 @@ class MainApplication(tk.Frame):
 if __name__ == '__main__':
     root = tk.Tk()
     root.title('DVaC GUI')
+    stall_watchdog = StallWatchdog(root)
+    stall_watchdog.start()
     MainApplication(root).grid()
     root.mainloop()
\ No newline at end of file
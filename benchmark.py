@@ -0,0 +1,370 @@
+# Synthetic nanoindentation data generator & benchmark suite for DVaCGUI
+# Writes CSV files w/ the same header/units layout CSVInterface.open_file expects, then times every processing stage
+# (ingest, reindex/re-zero, each GraphSoftware calculation, cycle parsing, statistics, Weibull, plot preparation)
+# through the DVaCGUI profiler and appends the results to a JSON file so runs can be compared over time.
+#
+# Usage:
+#   python benchmark.py generate specimen.csv --rows 100000 --mode load --peaks arbitrary --bursts 20
+#   python benchmark.py run --rows 10000 100000 1000000 --output benchmark_results.json
+#   python benchmark.py precision --rows 1000000
+import argparse
+import copy
+import json
+import os
+import platform
+import tempfile
+import time
+from datetime import datetime
+
+import matplotlib
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import DVaCGUI as dvac
+
+COLUMNS: list = ['Time On Sample', 'Displacement On Sample', 'Load On Sample', 'Harmonic Contact Stiffness']
+UNITS: list = ['s', 'nm', 'mN', 'N/m']
+
+
+def cycle_shape(rows: int, cycles: int, peaks: str, rng):
+    """
+    function builds the controlled channel of a cyclic test; every cycle rises from 1 to its peak and falls back in
+    unit steps so the controlled parsers (which expect 2 * peak - 1 rows per cycle) split it exactly, while arbitrary
+    peaks vary in height & minimum from cycle to cycle
+    :param rows: number of data rows
+    :param cycles: number of cycles
+    :param peaks: 'constant' for a known peak every cycle, 'arbitrary' for random peaks & minima
+    :param rng: numpy random generator
+    :return: controlled channel, cycle number, loading mask & cycle peak of every row
+    """
+    cycles = max(1, cycles)
+    if peaks == 'constant':
+        m = max(2, (rows // cycles + 1) // 2)
+        period = 2 * m - 1
+        k = np.arange(rows) % period
+        control = np.where(k < m, k + 1, period - k).astype('float64')
+        cycle = np.arange(rows) // period
+        return control, cycle, k < m - 1, np.full(rows, float(m))
+    half = max(2, rows // (2 * cycles))
+    top = rng.uniform(0.5, 1.5, cycles + 1) * half
+    bottom = rng.uniform(0.0, 0.2, cycles + 1) * half
+    values = np.empty(2 * cycles + 2)
+    values[0::2] = bottom
+    values[1::2] = top
+    lengths = np.maximum(np.abs(np.diff(values)).astype('int64'), 2)
+    knots = np.concatenate([[0], np.cumsum(lengths)])
+    scale = (rows - 1) / knots[-1]
+    knots = knots * scale
+    positions = np.arange(rows)
+    control = np.interp(positions, knots, values)
+    segment = np.minimum(np.searchsorted(knots, positions, side='right') - 1, len(values) - 2)
+    cycle = segment // 2
+    return control, cycle, segment % 2 == 0, top[cycle]
+
+
+def synthetic_frame(rows: int, mode: str = 'displacement', peaks: str = 'constant', cycles: int = 0,
+                    bursts: int = 10, noise: float = 0.005, seed: int = 0):
+    """
+    function generates a synthetic nanoindentation test; Hertzian loading (P ~ h^1.5), power-law unloading, CSM
+    stiffness proportional to displacement, strain bursts & gaussian noise on the measured (uncontrolled) channels
+    :param rows: number of data rows (10k to 10M)
+    :param mode: 'displacement' or 'load' controlled
+    :param peaks: 'constant' or 'arbitrary' cycle peaks
+    :param cycles: number of cycles (0 picks one cycle per ~2000 rows)
+    :param bursts: number of burst events (displacement jumps in load control, load drops in displacement control)
+    :param noise: standard deviation of the noise relative to each channel's range
+    :param seed: random seed so runs are reproducible
+    :return: DataFrame w/ COLUMNS
+    """
+    rng = np.random.default_rng(seed)
+    if cycles <= 0:
+        cycles = max(1, rows // 2000)
+    control, cycle, loading, peak = cycle_shape(rows, cycles, peaks, rng)
+    hertz = 0.01
+    burst_rows = np.sort(rng.choice(np.flatnonzero(loading), size=min(bursts, int(loading.sum())), replace=False))
+    if mode == 'load':
+        load = control
+        peak_displacement = (peak / hertz) ** (2 / 3)
+        residual = 0.5 * peak_displacement
+        displacement = np.where(loading, (load / hertz) ** (2 / 3),
+                                residual + (peak_displacement - residual) * (load / peak) ** (1 / 1.5))
+        jumps = np.zeros(rows)
+        jumps[burst_rows] = 0.05 * displacement[burst_rows]
+        displacement = displacement + np.cumsum(jumps)
+        displacement = displacement + rng.normal(0.0, noise * np.ptp(displacement), rows)
+    else:
+        displacement = control
+        residual = 0.5 * peak
+        load = np.where(loading, hertz * displacement ** 1.5,
+                        hertz * peak ** 1.5 * np.clip((displacement - residual) / (peak - residual), 0.0, None) ** 1.5)
+        drops = np.zeros(rows)
+        for b in burst_rows:
+            width = min(20, rows - b)
+            drops[b:b + width] += 0.1 * load[b] * (1 - np.arange(width) / width)
+        load = load - drops
+        load = load + rng.normal(0.0, noise * np.ptp(load), rows)
+    stiffness = 100.0 * displacement + rng.normal(0.0, noise * 100.0 * np.ptp(displacement), rows)
+    time_on_sample = np.arange(rows) * 0.1
+    return pd.DataFrame({COLUMNS[0]: time_on_sample, COLUMNS[1]: displacement, COLUMNS[2]: load,
+                         COLUMNS[3]: stiffness})
+
+
+def write_synthetic_csv(path: str, rows: int, **kwargs):
+    """
+    function writes a synthetic test to a CSV file w/ a header row followed by a units row, the layout
+    CSVInterface.open_file & reindex() expect from instrument exports
+    :param path: output file path
+    :param rows: number of data rows
+    :param kwargs: options forwarded to synthetic_frame
+    :return: CSV file path
+    """
+    frame = synthetic_frame(rows, **kwargs)
+    with open(path, 'w', newline='') as f:
+        f.write(','.join(COLUMNS) + '\n')
+        f.write(','.join(UNITS) + '\n')
+        frame.to_csv(f, header=False, index=False, float_format='%.6f')
+    return path
+
+
+def configured_software(csv_index: int, raw):
+    """
+    function creates a headless GraphSoftware w/ every calculation enabled & parameters suited to synthetic data
+    :param csv_index: index of the CSV file in data_frames & csv_list
+    :param raw: raw DataFrame (w/ units row) used to store units
+    :return: configured headless GraphSoftware
+    """
+    software = dvac.GraphSoftware.headless(csv_index)
+    software.unit_storage(raw)
+    software.load_column, software.l = COLUMNS[2], True
+    software.displacement_column, software.d = COLUMNS[1], True
+    software.csm_column, software.csm = COLUMNS[3], True
+    software.specimen_area, software.s = 250000.0, True
+    software.specimen_height, software.h = 2000.0, True
+    software.strain_start, software.ss = 0.01, True
+    software.strain_end, software.se = 0.05, True
+    software.csm_start, software.csm_s = 0.0, True
+    software.csm_end, software.csm_e = 1e12, True
+    software.poisson_ratio, software.poisson_exists = 0.3, True
+    software.known_elastic_modulus, software.known_elastic_modulus_exists = 200.0, True
+    software.area_conservation = True
+    software.stress_type, software.strain_type, software.type_exists = 'Stress (Engineering)', 'Strain (Engineering)', True
+    for flag in ('compute_stress', 'compute_strain', 'compute_yms', 'compute_ymcsm', 'compute_true_stress',
+                 'compute_true_strain', 'compute_sneddon', 'compute_uss', 'compute_energy_dissipated',
+                 'compute_bursts'):
+        setattr(software, flag, True)
+    return software
+
+
+def statistics_pass(specimens: list):
+    """
+    function performs the Statistics panel's single pass (mean, median, std, variance, IQR, outliers) over the
+    results of every specimen
+    :param specimens: GraphSoftware objects w/ computed results
+    :return: array of statistics (measure x metric)
+    """
+    return dvac.StatisticsInterface.statistics(specimens)[0]
+
+
+def weibull_pass():
+    """
+    function runs the Weibull interface's numeric steps (sort, logs, failure probability, regression) over the
+    ultimate stresses of csv_identities w/o building its window
+    :return: Weibull modulus & characteristic strength
+    """
+    weibull = dvac.WeibullInterface.__new__(dvac.WeibullInterface)
+    weibull.probability_sort = []
+    weibull.reorder_failure_stresses()
+    weibull.strength_natural_log()
+    weibull.failure_probability()
+    weibull.double_natural_log()
+    modulus, intercept = np.polyfit(weibull.ln_strength_sort, weibull.double_ln_probability_sort, 1)
+    return modulus, np.exp(-intercept / modulus)
+
+
+def benchmark_size(rows: int, directory: str, specimens: int, seed: int):
+    """
+    function generates synthetic files of the given size & times every stage of DVaCGUI against them
+    :param rows: number of data rows
+    :param directory: folder the synthetic files are written to
+    :param specimens: number of specimens fed to the statistics & Weibull stages
+    :param seed: random seed
+    :return: per-stage profiler summary
+    """
+    dvac.profiler.clear()
+    dvac.result_cache.enabled = False  # time the calculations themselves, not cache reads
+    files = {}
+    for mode in ('displacement', 'load'):
+        for peaks in ('constant', 'arbitrary'):
+            path = os.path.join(directory, 'synthetic_%s_%s_%d.csv' % (mode, peaks, rows))
+            if not os.path.exists(path):
+                write_synthetic_csv(path, rows, mode=mode, peaks=peaks, seed=seed)
+            files[(mode, peaks)] = path
+
+    dvac.csv_list.clear()
+    dvac.data_frames.clear()
+    dvac.dataset_store.remove(0)
+    dvac.csv_list[0] = files[('load', 'constant')]
+    raw = pd.read_csv(dvac.csv_list[0], nrows=2)
+    software = configured_software(0, raw)
+    data = software.load_data()
+
+    labels = {('displacement', 'constant'): ('parse_displacement_cycles', COLUMNS[1], True),
+              ('load', 'constant'): ('parse_load_cycles', COLUMNS[2], True),
+              ('displacement', 'arbitrary'): ('parse_arbitrary_displacement_cycles', COLUMNS[1], False),
+              ('load', 'arbitrary'): ('parse_arbitrary_load_cycles', COLUMNS[2], False)}
+    for key, (stage, column, controlled) in labels.items():
+        cycle_raw = pd.read_csv(files[key])
+        with dvac.profiler.span(stage, None, len(cycle_raw)):
+            temp_df = software.reindex(cycle_raw)
+            frames = [frame for _, frame in temp_df.groupby(dvac.CSVInterface.cycle_labels(temp_df[column], controlled))]
+        del frames, temp_df, cycle_raw
+
+    rng = np.random.default_rng(seed)
+    dvac.csv_identities.clear()
+    for _ in range(specimens):
+        specimen = copy.copy(software)
+        jitter = rng.normal(1.0, 0.05)
+        for attribute in ('youngs_modulus_value_slope', 'youngs_modulus_value_csm', 'youngs_modulus_value_sneddon',
+                          'energy_dissipated_value', 'ultimate_stress_value', 'ultimate_strain_value'):
+            setattr(specimen, attribute, float(getattr(software, attribute)) * jitter)
+        dvac.csv_identities.append(specimen)
+    with dvac.profiler.span('statistics', None, specimens):
+        statistics_pass(dvac.csv_identities)
+    with dvac.profiler.span('weibull', None, specimens):
+        weibull_pass()
+
+    with dvac.profiler.span('plot', 0, len(data), abscissa=software.strain_type, ordinate=software.stress_type):
+        fig = Figure(figsize=(12, 10), dpi=100)
+        fig.add_subplot(1, 1, 1).scatter(data[software.strain_type], data[software.stress_type], s=7, color='#8b008b')
+        FigureCanvasAgg(fig).draw()
+    return dvac.profiler.summary()
+
+
+def compare_precision(rows: int, directory: str = '', seed: int = 0):
+    """
+    function processes the same synthetic test under the float64 & float32 precision policies of dataset_store and
+    reports the memory held by the stored frames, the dtype each column is kept in & the largest relative difference
+    of every calculated column & scalar result
+    :param rows: number of data rows
+    :param directory: folder for the synthetic file (a temporary folder is used & removed if empty)
+    :param seed: random seed
+    :return: memory (bytes) per policy, column dtypes & relative differences
+    """
+    temporary = None
+    if directory == '':
+        temporary = tempfile.TemporaryDirectory()
+        directory = temporary.name
+    attributes = ['youngs_modulus_value_slope', 'youngs_modulus_value_csm', 'youngs_modulus_value_sneddon',
+                  'energy_dissipated_value', 'num_bursts_value', 'ultimate_stress_value', 'ultimate_strain_value']
+    frames, results, memory = {}, {}, {}
+    try:
+        path = write_synthetic_csv(os.path.join(directory, 'synthetic_precision_%d.csv' % rows), rows, mode='load',
+                                   seed=seed)
+        dvac.result_cache.enabled = False
+        for precision in ('float64', 'float32'):
+            dvac.csv_list.clear()
+            dvac.data_frames.clear()
+            dvac.dataset_store.remove(0)
+            dvac.dataset_store.set_precision(precision)
+            dvac.csv_list[0] = path
+            software = configured_software(0, pd.read_csv(path, nrows=2))
+            frames[precision] = software.load_data()
+            memory[precision] = dvac.dataset_store.nbytes(dvac.dataset_store.stored(0)) + dvac.dataset_store.nbytes(frames[precision])
+            results[precision] = {a: float(getattr(software, a)) for a in attributes}
+    finally:
+        dvac.dataset_store.set_precision('float64')
+        if temporary is not None:
+            temporary.cleanup()
+    reference, compact = frames['float64'], frames['float32']
+    differences = {}
+    for col_name in reference.columns:
+        exact = reference[col_name].to_numpy(dtype='float64')
+        scale = np.nanmax(np.abs(exact)) if np.isfinite(exact).any() else 0.0
+        error = np.nanmax(np.abs(compact[col_name].to_numpy(dtype='float64') - exact)) if scale > 0 else 0.0
+        differences[col_name] = float(error / scale) if scale > 0 else 0.0
+    for a in attributes:
+        exact = results['float64'][a]
+        differences[a] = abs(results['float32'][a] - exact) / abs(exact) if exact != 0 else abs(results['float32'][a])
+    print('%d rows: %.1f MB as float64, %.1f MB as float32 (%.0f%% saved)' % (
+        rows, memory['float64'] / 1048576, memory['float32'] / 1048576, 100 * (1 - memory['float32'] / memory['float64'])))
+    for col_name in differences:
+        dtype = str(compact[col_name].dtype) if col_name in compact.columns else 'scalar'
+        print('    {:<42}{:>9}{:>14.2e}'.format(col_name, dtype, differences[col_name]))
+    return {'rows': rows, 'memory': memory, 'dtypes': {c: str(compact[c].dtype) for c in compact.columns},
+            'differences': differences}
+
+
+def run_benchmarks(sizes: list, output: str, directory: str = '', specimens: int = 26, seed: int = 0):
+    """
+    function runs the benchmark for every size and appends the run (environment + per-stage timings) to the
+    output JSON file
+    :param sizes: list of row counts
+    :param output: JSON file the run is appended to
+    :param directory: folder for synthetic files (a temporary folder is used & removed when empty)
+    :param specimens: number of specimens fed to the statistics & Weibull stages
+    :param seed: random seed
+    :return: run record
+    """
+    run = {'timestamp': datetime.now().isoformat(timespec='seconds'), 'python': platform.python_version(),
+           'platform': platform.platform(), 'numpy': np.__version__, 'pandas': pd.__version__,
+           'matplotlib': matplotlib.__version__, 'seed': seed, 'results': {}}
+    temporary = None
+    if directory == '':
+        temporary = tempfile.TemporaryDirectory()
+        directory = temporary.name
+    try:
+        for rows in sizes:
+            start = time.perf_counter()
+            run['results'][str(rows)] = benchmark_size(rows, directory, specimens, seed)
+            print('%d rows: %.2f s' % (rows, time.perf_counter() - start))
+            for stage, summary in run['results'][str(rows)].items():
+                print('    {:<38}{:>12.2f} ms'.format(stage, summary['mean_ms']))
+    finally:
+        if temporary is not None:
+            temporary.cleanup()
+    runs = []
+    if os.path.exists(output):
+        with open(output) as f:
+            runs = json.load(f)
+    runs.append(run)
+    with open(output, 'w') as f:
+        json.dump(runs, f, indent=1)
+    return run
+
+
+def main():
+    parser = argparse.ArgumentParser(description='DVaCGUI synthetic data generator & benchmark suite')
+    commands = parser.add_subparsers(dest='command', required=True)
+    generate = commands.add_parser('generate', help='write a synthetic nanoindentation CSV file')
+    generate.add_argument('path')
+    generate.add_argument('--rows', type=int, default=100000)
+    generate.add_argument('--mode', choices=['displacement', 'load'], default='displacement')
+    generate.add_argument('--peaks', choices=['constant', 'arbitrary'], default='constant')
+    generate.add_argument('--cycles', type=int, default=0)
+    generate.add_argument('--bursts', type=int, default=10)
+    generate.add_argument('--noise', type=float, default=0.005)
+    generate.add_argument('--seed', type=int, default=0)
+    run = commands.add_parser('run', help='time every DVaCGUI stage against synthetic data')
+    run.add_argument('--rows', type=int, nargs='+', default=[10000, 100000, 1000000])
+    run.add_argument('--output', default='benchmark_results.json')
+    run.add_argument('--data-dir', default='')
+    run.add_argument('--specimens', type=int, default=26)
+    run.add_argument('--seed', type=int, default=0)
+    precision = commands.add_parser('precision', help='compare memory & results of float64 and float32 storage')
+    precision.add_argument('--rows', type=int, default=1000000)
+    precision.add_argument('--data-dir', default='')
+    precision.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    if args.command == 'generate':
+        write_synthetic_csv(args.path, args.rows, mode=args.mode, peaks=args.peaks, cycles=args.cycles,
+                            bursts=args.bursts, noise=args.noise, seed=args.seed)
+    elif args.command == 'precision':
+        compare_precision(args.rows, args.data_dir, args.seed)
+    else:
+        run_benchmarks(args.rows, args.output, args.data_dir, args.specimens, args.seed)
+
+
+if __name__ == '__main__':
+    main()